@@ -0,0 +1,269 @@
+/**
+ * KITT Bench - Synthetic Corpus Generator
+ *
+ * Fills a database with a reproducible (seeded) corpus that looks like
+ * KITT's own data:
+ * - Transcripts spread over the last N days (so "today" has its share)
+ * - Chunks with random normalized vectors (+ FTS rows)
+ * - Tasks with dependencies, time windows and task-log transcripts
+ */
+
+import type { Client, InStatement } from '@libsql/client';
+import { randomUUID } from 'node:crypto';
+import { embeddingToBuffer, hashText, shortenEmbedding } from '../memory/utils.js';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Statements per write batch
+const WRITE_BATCH_SIZE = 500;
+
+const WORDS = [
+  'training', 'hardlopen', 'hyrox', 'garmin', 'slaap', 'hartslag', 'eiwit', 'ontbijt',
+  'lunch', 'avondeten', 'water', 'koffie', 'afspraak', 'meeting', 'project', 'deadline',
+  'boodschappen', 'herinnering', 'vandaag', 'morgen', 'weekend', 'planning', 'focus',
+  'energie', 'stress', 'wandeling', 'fiets', 'kracht', 'squat', 'deadlift', 'rust',
+  'calorieën', 'recept', 'familie', 'verjaardag', 'vakantie', 'budget', 'factuur',
+  'email', 'telegram', 'notitie', 'idee', 'boek', 'podcast', 'muziek', 'reflectie',
+  'dankbaar', 'doel', 'gewoonte', 'review', 'release', 'bug', 'feature', 'database',
+];
+
+export interface CorpusOptions {
+  /** Number of conversation transcripts */
+  transcripts: number;
+  /** Chunks (with vector) per transcript (default: 2) */
+  chunksPerTranscript?: number;
+  /** Number of tasks (default: 50) */
+  tasks?: number;
+  /** Spread transcripts over the last N days (default: 30) */
+  days?: number;
+  /** Vector dimensions (default: 3072) */
+  dimensions?: number;
+  /** Also fill embedding_short (shortlist mode) */
+  shortlistDimensions?: number;
+  /** Write chunks_fts rows (default: true) */
+  fts?: boolean;
+  /** Embedding model stored with the chunks */
+  model?: string;
+  /** PRNG seed, same seed gives the same corpus (default: 42) */
+  seed?: number;
+}
+
+export interface CorpusStats {
+  transcripts: number;
+  todayTranscripts: number;
+  chunks: number;
+  tasks: number;
+  taskLogs: number;
+  durationMs: number;
+}
+
+/**
+ * Generate a corpus into an initialized (empty) KITT database
+ */
+export async function generateCorpus(db: Client, options: CorpusOptions): Promise<CorpusStats> {
+  const startedAt = Date.now();
+  const random = seededRandom(options.seed ?? 42);
+  const chunksPerTranscript = options.chunksPerTranscript ?? 2;
+  const taskCount = options.tasks ?? 50;
+  const days = options.days ?? 30;
+  const dimensions = options.dimensions ?? 3072;
+  const model = options.model ?? 'text-embedding-3-large';
+  const fts = options.fts ?? true;
+
+  const now = Date.now();
+  const startOfDay = new Date(now);
+  startOfDay.setHours(0, 0, 0, 0);
+
+  const stats: CorpusStats = {
+    transcripts: 0,
+    todayTranscripts: 0,
+    chunks: 0,
+    tasks: 0,
+    taskLogs: 0,
+    durationMs: 0,
+  };
+
+  let statements: InStatement[] = [];
+  const flush = async (force = false): Promise<void> => {
+    if (statements.length >= WRITE_BATCH_SIZE || (force && statements.length > 0)) {
+      await db.batch(statements, 'write');
+      statements = [];
+    }
+  };
+
+  // Transcripts + chunks
+  for (let i = 0; i < options.transcripts; i++) {
+    const id = randomUUID();
+    const createdAt = Math.floor(now - random() * days * DAY_MS);
+    const chunks = Array.from({ length: chunksPerTranscript }, () => sentence(random, 20, 60));
+
+    statements.push(transcriptInsert({
+      id,
+      role: random() < 0.5 ? 'user' : 'kitt',
+      type: 'message',
+      content: chunks.join(' '),
+      createdAt,
+    }));
+    stats.transcripts++;
+    if (createdAt >= startOfDay.getTime()) stats.todayTranscripts++;
+
+    for (let line = 0; line < chunks.length; line++) {
+      const chunkId = randomUUID();
+      const embedding = randomUnitVector(dimensions, random);
+      const columns = ['embedding'];
+      const values = ['vector32(?)'];
+      const vectorArgs = [embeddingToBuffer(embedding)];
+
+      if (options.shortlistDimensions) {
+        columns.push('embedding_short');
+        values.push('vector32(?)');
+        vectorArgs.push(embeddingToBuffer(shortenEmbedding(embedding, options.shortlistDimensions)));
+      }
+
+      statements.push({
+        sql: `INSERT INTO chunks (id, transcript_id, source, path, content, hash, start_line, end_line, ${columns.join(', ')}, model, created_at)
+              VALUES (?, ?, 'transcript', NULL, ?, ?, ?, ?, ${values.join(', ')}, ?, ?)`,
+        args: [chunkId, id, chunks[line], hashText(chunks[line]), line + 1, line + 1, ...vectorArgs, model, createdAt],
+      });
+      if (fts) {
+        statements.push({
+          sql: `INSERT INTO chunks_fts (id, content, source, path) VALUES (?, ?, 'transcript', NULL)`,
+          args: [chunkId, chunks[line]],
+        });
+      }
+      stats.chunks++;
+    }
+
+    await flush();
+  }
+
+  // Tasks: dependencies only point at earlier tasks (no cycles)
+  const frequencies = ['once', 'daily', 'daily', 'weekly', 'monthly'];
+  const priorities = ['high', 'medium', 'low'];
+
+  for (let id = 1; id <= taskCount; id++) {
+    const dependsOn: number[] = [];
+    if (id > 1 && random() < 0.3) {
+      const count = 1 + Math.floor(random() * 2);
+      for (let d = 0; d < count; d++) {
+        const dep = 1 + Math.floor(random() * (id - 1));
+        if (!dependsOn.includes(dep)) dependsOn.push(dep);
+      }
+    }
+
+    const windowStart = random() < 0.5 ? 6 + Math.floor(random() * 12) : null;
+    statements.push({
+      sql: `INSERT INTO kitt_tasks (id, title, description, frequency, priority, time_window_start, time_window_end, grace_period_minutes, depends_on, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
+      args: [
+        id,
+        `Task ${id}: ${sentence(random, 2, 5)}`,
+        sentence(random, 5, 15),
+        pick(random, frequencies),
+        pick(random, priorities),
+        windowStart !== null ? `${String(windowStart).padStart(2, '0')}:00` : null,
+        windowStart !== null ? `${String(windowStart + 2).padStart(2, '0')}:00` : null,
+        windowStart !== null ? 30 : 0,
+        dependsOn.length > 0 ? JSON.stringify(dependsOn) : null,
+        now - days * DAY_MS,
+      ],
+    });
+    stats.tasks++;
+
+    // Task log history (reminders, completions, skips)
+    const logCount = Math.floor(random() * Math.min(days, 10));
+    for (let l = 0; l < logCount; l++) {
+      statements.push(transcriptInsert({
+        id: randomUUID(),
+        role: 'kitt',
+        type: 'task',
+        content: `Task #${id} ${sentence(random, 3, 8)}`,
+        createdAt: Math.floor(now - random() * days * DAY_MS),
+        taskId: id,
+        taskStatus: pick(random, ['reminder', 'completed', 'completed', 'skipped']),
+      }));
+      stats.taskLogs++;
+    }
+
+    await flush();
+  }
+
+  await flush(true);
+
+  stats.durationMs = Date.now() - startedAt;
+  return stats;
+}
+
+/**
+ * Insert statement for a transcript row (same columns as storeMessage)
+ */
+export function transcriptInsert(row: {
+  id: string;
+  role: string;
+  type: string;
+  content: string;
+  createdAt: number;
+  taskId?: number;
+  taskStatus?: string;
+}): InStatement {
+  return {
+    sql: `INSERT INTO transcripts (id, session_id, channel, role, type, content, task_id, task_status, metadata, created_at)
+          VALUES (?, ?, 'telegram', ?, ?, ?, ?, ?, '{}', ?)`,
+    args: [
+      row.id,
+      `bench-${new Date(row.createdAt).toISOString().slice(0, 10)}`,
+      row.role,
+      row.type,
+      row.content,
+      row.taskId ?? null,
+      row.taskStatus ?? null,
+      row.createdAt,
+    ],
+  };
+}
+
+/**
+ * Random sentence of min..max words from the corpus vocabulary
+ */
+export function sentence(random: () => number, min: number, max: number): string {
+  const length = min + Math.floor(random() * (max - min + 1));
+  const words = Array.from({ length }, () => pick(random, WORDS));
+  return words.join(' ') + '.';
+}
+
+/**
+ * Random vector with unit length (uniform direction)
+ */
+export function randomUnitVector(dimensions: number, random: () => number): number[] {
+  const vector = new Array<number>(dimensions);
+  let norm = 0;
+  for (let i = 0; i < dimensions; i++) {
+    // Box-Muller: normal components give a uniformly distributed direction
+    const value = Math.sqrt(-2 * Math.log(1 - random())) * Math.cos(2 * Math.PI * random());
+    vector[i] = value;
+    norm += value * value;
+  }
+  norm = Math.sqrt(norm) || 1;
+  for (let i = 0; i < dimensions; i++) {
+    vector[i] /= norm;
+  }
+  return vector;
+}
+
+/**
+ * Small seeded PRNG (mulberry32), returns values in [0, 1)
+ */
+export function seededRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function pick<T>(random: () => number, items: T[]): T {
+  return items[Math.floor(random() * items.length)];
+}
@@ -0,0 +1,162 @@
+/**
+ * KITT Bench - Local OpenAI / ElevenLabs stand-in
+ *
+ * Answers the embeddings, Whisper and TTS endpoints with synthetic data after
+ * a configurable delay, so hot paths that call out to these APIs can be
+ * benchmarked (and the bridge run) without network access or API costs.
+ *
+ * Point KITT at it with:
+ *   OPENAI_EMBEDDINGS_URL=<url>/v1/embeddings
+ *   OPENAI_TRANSCRIPTION_URL=<url>/v1/audio/transcriptions
+ *   ELEVENLABS_API_URL=<url>/v1/text-to-speech
+ */
+
+import { createServer, type IncomingMessage, type ServerResponse } from 'http';
+import type { AddressInfo } from 'net';
+import { createHash } from 'node:crypto';
+import { randomUnitVector, seededRandom } from './corpus.js';
+
+export interface StubServerOptions {
+  /** Port to listen on (default: 0 = any free port) */
+  port?: number;
+  /** Delay before every response (ms) */
+  latencyMs?: number;
+  /** Random extra delay, 0..jitterMs (ms) */
+  jitterMs?: number;
+  /** Embedding dimensions (default: 3072) */
+  dimensions?: number;
+}
+
+export interface StubServerStats {
+  embeddings: number;
+  embeddedTexts: number;
+  transcriptions: number;
+  uploadBytes: number;
+  speech: number;
+}
+
+export interface StubServer {
+  url: string;
+  /** Environment variables that point KITT at this server */
+  env: Record<string, string>;
+  stats: StubServerStats;
+  close(): Promise<void>;
+}
+
+/**
+ * Start the stub server
+ */
+export async function startStubServer(options: StubServerOptions = {}): Promise<StubServer> {
+  const latencyMs = options.latencyMs ?? 0;
+  const jitterMs = options.jitterMs ?? 0;
+  const dimensions = options.dimensions ?? 3072;
+  const stats: StubServerStats = {
+    embeddings: 0,
+    embeddedTexts: 0,
+    transcriptions: 0,
+    uploadBytes: 0,
+    speech: 0,
+  };
+
+  const delay = (): Promise<void> => {
+    const ms = latencyMs + Math.random() * jitterMs;
+    return ms > 0 ? new Promise((resolve) => setTimeout(resolve, ms)) : Promise.resolve();
+  };
+
+  const handle = async (req: IncomingMessage, res: ServerResponse): Promise<void> => {
+    const url = new URL(req.url ?? '/', 'http://localhost');
+
+    if (req.method === 'POST' && url.pathname === '/v1/embeddings') {
+      const body = JSON.parse((await readBody(req)).toString('utf-8')) as { input: string | string[] };
+      const inputs = Array.isArray(body.input) ? body.input : [body.input];
+      stats.embeddings++;
+      stats.embeddedTexts += inputs.length;
+
+      await delay();
+      return sendJson(res, {
+        object: 'list',
+        data: inputs.map((text, index) => ({
+          object: 'embedding',
+          index,
+          embedding: fakeEmbedding(text, dimensions),
+        })),
+        usage: { total_tokens: inputs.reduce((sum, text) => sum + Math.ceil(text.length / 4), 0) },
+      });
+    }
+
+    if (req.method === 'POST' && url.pathname === '/v1/audio/transcriptions') {
+      const upload = await readBody(req);
+      stats.transcriptions++;
+      stats.uploadBytes += upload.length;
+
+      await delay();
+      return sendJson(res, { text: `Stub transcriptie van ${upload.length} bytes audio.` });
+    }
+
+    if (req.method === 'POST' && url.pathname.startsWith('/v1/text-to-speech/')) {
+      const body = JSON.parse((await readBody(req)).toString('utf-8')) as { text?: string };
+      stats.speech++;
+
+      await delay();
+      // ~1 KB of "audio" per 10 characters, deterministic per text
+      const audio = Buffer.alloc(Math.max(1024, (body.text?.length ?? 0) * 100));
+      createHash('sha256').update(body.text ?? '').digest().copy(audio);
+      res.writeHead(200, { 'Content-Type': 'audio/mpeg', 'Content-Length': audio.length });
+      res.end(audio);
+      return;
+    }
+
+    sendJson(res, { error: { message: `No stub for ${req.method} ${url.pathname}` } }, 404);
+  };
+
+  const server = createServer((req, res) => {
+    handle(req, res).catch((err) => {
+      sendJson(res, { error: { message: String(err) } }, 500);
+    });
+  });
+
+  await new Promise<void>((resolve) => server.listen(options.port ?? 0, '127.0.0.1', resolve));
+  const { port } = server.address() as AddressInfo;
+  const url = `http://127.0.0.1:${port}`;
+
+  return {
+    url,
+    env: {
+      OPENAI_EMBEDDINGS_URL: `${url}/v1/embeddings`,
+      OPENAI_TRANSCRIPTION_URL: `${url}/v1/audio/transcriptions`,
+      ELEVENLABS_API_URL: `${url}/v1/text-to-speech`,
+    },
+    stats,
+    close: () =>
+      new Promise<void>((resolve) => {
+        server.closeAllConnections();
+        server.close(() => resolve());
+      }),
+  };
+}
+
+/**
+ * Deterministic unit vector for a text (same text, same vector)
+ */
+function fakeEmbedding(text: string, dimensions: number): number[] {
+  const seed = createHash('sha256').update(text).digest().readUInt32LE(0);
+  const random = seededRandom(seed);
+  return randomUnitVector(dimensions, random);
+}
+
+async function readBody(req: IncomingMessage): Promise<Buffer> {
+  const chunks: Buffer[] = [];
+  for await (const chunk of req) {
+    chunks.push(chunk as Buffer);
+  }
+  return Buffer.concat(chunks);
+}
+
+function sendJson(res: ServerResponse, body: unknown, status = 200): void {
+  const json = JSON.stringify(body);
+  res.writeHead(status, {
+    'Content-Type': 'application/json',
+    'Content-Length': Buffer.byteLength(json),
+  });
+  res.end(json);
+}
@@ -7,6 +7,7 @@
 import { query } from '@anthropic-ai/claude-agent-sdk';
 import { log } from './logger.js';
 import { getKITTSystemPrompt } from './context.js';
+import { recordSpan, timeSpan } from '../metrics/index.js';
 
 export interface AgentResponse {
   result: string | null;
@@ -21,6 +22,7 @@ export interface AgentOptions {
   model?: AgentModel;
   skillContext?: string; // Full skill content to inject into system prompt
   skipMemorySearch?: boolean; // Skip memory search (for think loop - already has context)
+  onText?: (text: string) => void; // Streaming: called with the assistant text written so far
 }
 
 const KITT_WORKSPACE = process.env.KITT_WORKSPACE || process.cwd();
@@ -39,6 +41,9 @@ export async function runAgent(
 
   let result: string | null = null;
   let newSessionId: string | undefined;
+  let draft = '';
+  let firstTextAt: number | null = null;
+  const startedAt = Date.now();
 
   // Log model being used (SDK uses latest version of each model family)
   const modelUsed = opts.model || 'default (SDK decides)';
@@ -53,7 +58,9 @@ export async function runAgent(
   try {
     // Load KITT personality and context
     // Skip memory search for think loop (already has all context, and prompt is too large to embed)
-    let systemPrompt = await getKITTSystemPrompt(opts.skipMemorySearch ? undefined : prompt);
+    let systemPrompt = await timeSpan('agent.system_prompt', () =>
+      getKITTSystemPrompt(opts.skipMemorySearch ? undefined : prompt)
+    );
 
     // Inject skill context if provided (for skill routing)
     if (opts.skillContext) {
@@ -82,8 +89,24 @@ export async function runAgent(
         ],
         permissionMode: 'bypassPermissions',
         allowDangerouslySkipPermissions: true,
+        includePartialMessages: !!opts.onText,
       },
     })) {
+      // Stream text deltas of the assistant message being written
+      // A new message (e.g. after a tool call) starts a new draft
+      if (opts.onText && message.type === 'stream_event') {
+        const event = message.event;
+        if (event.type === 'message_start') {
+          draft = '';
+        } else if (event.type === 'content_block_delta' && event.delta.type === 'text_delta') {
+          draft += event.delta.text;
+          if (firstTextAt === null) {
+            firstTextAt = Date.now();
+          }
+          opts.onText(draft);
+        }
+      }
+
       // Capture session ID from init message
       if (message.type === 'system' && message.subtype === 'init') {
         newSessionId = message.session_id;
@@ -96,11 +119,18 @@ export async function runAgent(
       }
     }
 
+    recordSpan('agent.turn', Date.now() - startedAt, !result);
+    if (firstTextAt !== null) {
+      recordSpan('agent.first_text', firstTextAt - startedAt);
+    }
+
     log.info('Agent completed', {
       hasResult: !!result,
       resultLength: result?.length,
       sessionId: newSessionId || opts.sessionId,
       model: modelUsed,
+      durationMs: Date.now() - startedAt,
+      firstTextMs: firstTextAt !== null ? firstTextAt - startedAt : undefined,
     });
     console.log(`[agent] ✅ Completed (${modelUsed}) - ${result?.length || 0} chars`);
 
@@ -111,6 +141,7 @@ export async function runAgent(
   } catch (err) {
     const errorMessage = err instanceof Error ? err.message : String(err);
     log.error('Agent error', { error: errorMessage });
+    recordSpan('agent.turn', Date.now() - startedAt, true);
 
     return {
       result: null,
@@ -0,0 +1,144 @@
+/**
+ * KITT Audio Cache
+ *
+ * Content-addressed on-disk cache for synthesized speech.
+ * Files are named after a hash of everything that determines the audio
+ * (text, voice, model, settings). When the cache grows beyond its size
+ * limit, the least recently used files are removed.
+ */
+
+import fs from 'node:fs/promises';
+import path from 'node:path';
+import { createHash } from 'node:crypto';
+import { log } from './logger.js';
+
+const DEFAULT_CACHE_DIR = process.env.KITT_TTS_CACHE_DIR || './profile/cache/tts';
+const DEFAULT_MAX_BYTES = (Number(process.env.KITT_TTS_CACHE_MAX_MB) || 100) * 1024 * 1024;
+
+interface CacheEntry {
+  size: number;
+  usedAt: number;
+}
+
+export class AudioCache {
+  private dir: string;
+  private maxBytes: number;
+  private entries = new Map<string, CacheEntry>();
+  private totalBytes = 0;
+  private loaded: Promise<void> | null = null;
+
+  constructor(dir = DEFAULT_CACHE_DIR, maxBytes = DEFAULT_MAX_BYTES) {
+    this.dir = dir;
+    this.maxBytes = maxBytes;
+  }
+
+  /**
+   * Build a cache key from the parts that determine the audio
+   */
+  static key(parts: unknown): string {
+    return createHash('sha256').update(JSON.stringify(parts)).digest('hex');
+  }
+
+  async get(key: string): Promise<Buffer | null> {
+    await this.load();
+    const entry = this.entries.get(key);
+    if (!entry) return null;
+
+    try {
+      const audio = await fs.readFile(this.filePath(key));
+      entry.usedAt = Date.now();
+      // Keep mtime as "last used" so LRU order survives restarts
+      const now = new Date();
+      fs.utimes(this.filePath(key), now, now).catch(() => undefined);
+      return audio;
+    } catch {
+      this.forget(key);
+      return null;
+    }
+  }
+
+  async set(key: string, audio: Buffer): Promise<void> {
+    if (audio.length === 0 || audio.length > this.maxBytes) return;
+    await this.load();
+
+    try {
+      await fs.mkdir(this.dir, { recursive: true });
+      // Write to a temp file first so readers never see a partial file
+      const tmpPath = `${this.filePath(key)}.${process.pid}.tmp`;
+      await fs.writeFile(tmpPath, audio);
+      await fs.rename(tmpPath, this.filePath(key));
+
+      this.forget(key);
+      this.entries.set(key, { size: audio.length, usedAt: Date.now() });
+      this.totalBytes += audio.length;
+
+      await this.evict();
+    } catch (err) {
+      log.warn('Failed to write audio cache', { error: String(err) });
+    }
+  }
+
+  getStats(): { files: number; bytes: number; maxBytes: number } {
+    return { files: this.entries.size, bytes: this.totalBytes, maxBytes: this.maxBytes };
+  }
+
+  /**
+   * Remove least recently used files until the cache fits
+   */
+  private async evict(): Promise<void> {
+    if (this.totalBytes <= this.maxBytes) return;
+
+    const byAge = Array.from(this.entries.entries()).sort((a, b) => a[1].usedAt - b[1].usedAt);
+    let removed = 0;
+
+    for (const [key] of byAge) {
+      if (this.totalBytes <= this.maxBytes) break;
+      this.forget(key);
+      await fs.unlink(this.filePath(key)).catch(() => undefined);
+      removed++;
+    }
+
+    log.debug('Audio cache evicted', { removed, bytes: this.totalBytes });
+  }
+
+  /**
+   * Index existing cache files (once)
+   */
+  private load(): Promise<void> {
+    if (!this.loaded) {
+      this.loaded = (async () => {
+        let names: string[];
+        try {
+          names = await fs.readdir(this.dir);
+        } catch {
+          return;
+        }
+
+        for (const name of names) {
+          if (!name.endsWith('.mp3')) continue;
+          try {
+            const stat = await fs.stat(path.join(this.dir, name));
+            const key = name.slice(0, -'.mp3'.length);
+            this.entries.set(key, { size: stat.size, usedAt: stat.mtimeMs });
+            this.totalBytes += stat.size;
+          } catch {
+            // Removed in the meantime
+          }
+        }
+      })();
+    }
+    return this.loaded;
+  }
+
+  private forget(key: string): void {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.totalBytes -= entry.size;
+      this.entries.delete(key);
+    }
+  }
+
+  private filePath(key: string): string {
+    return path.join(this.dir, `${key}.mp3`);
+  }
+}
@@ -8,6 +8,18 @@
  */
 const ESCAPE_CHARS = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!'];
 
+/**
+ * Telegram's hard limit for one message
+ */
+export const TELEGRAM_MAX_LENGTH = 4096;
+
+export interface FormattedChunk {
+  text: string;
+  parseMode: 'MarkdownV2' | undefined;
+  /** Unformatted chunk, for the plain text fallback */
+  plain: string;
+}
+
 /**
  * Escape special characters for Telegram MarkdownV2
  */
@@ -113,3 +125,25 @@ export function splitMessage(text: string, maxLength: number = 4000): string[] {
 
   return chunks;
 }
+
+/**
+ * Split a message and format each chunk for Telegram
+ * Escaping makes a chunk longer (up to 2x), so a chunk that no longer fits
+ * in one Telegram message after formatting is split again
+ */
+export function splitFormattedMessage(text: string, maxLength: number = 4000): FormattedChunk[] {
+  const chunks: FormattedChunk[] = [];
+
+  for (const plain of splitMessage(text, maxLength)) {
+    const formatted = formatForTelegramSafe(plain);
+    if (formatted.text.length <= TELEGRAM_MAX_LENGTH || plain.length < 2) {
+      chunks.push({ ...formatted, plain });
+    } else {
+      // Shrink the limit by how much escaping grew this chunk
+      const shrunk = Math.floor((plain.length * TELEGRAM_MAX_LENGTH) / formatted.text.length);
+      chunks.push(...splitFormattedMessage(plain, Math.max(1, shrunk)));
+    }
+  }
+
+  return chunks;
+}
@@ -14,6 +14,7 @@ import { loadState, saveState } from './state.js';
 import { log } from './logger.js';
 import { getScheduler } from '../scheduler/index.js';
 import { startLogServer, stopLogServer } from './log-server.js';
+import { timeSpan } from '../metrics/index.js';
 
 const BANNER = `
 ╔═══════════════════════════════════════════════════════╗
@@ -77,7 +78,7 @@ async function main(): Promise<void> {
       console.log(`[think-loop] ⏰ Tick at ${now}`);
       log.info('Think loop tick', { time: now });
 
-      await scheduler.runThinkLoop();
+      await timeSpan('think.tick', () => scheduler.runThinkLoop());
 
       console.log(`[think-loop] ✅ Complete`);
       log.info('Think loop completed');
@@ -7,7 +7,9 @@ import express from 'express';
 import { WebSocketServer, WebSocket } from 'ws';
 import { createServer, type Server } from 'http';
 import path from 'path';
-import { createClient, type Client } from '@libsql/client';
+import { createClient, type Client, type InValue } from '@libsql/client';
+import { LogStore, RingBuffer, LOG_LEVELS, type LogEntry, type LogLevel } from './log-store.js';
+import { getMetrics, resetMetrics, startEventLoopMonitor } from '../metrics/index.js';
 
 const DB_PATH = process.env.KITT_DB_PATH || './profile/memory/kitt.db';
 let db: Client | null = null;
@@ -19,15 +21,129 @@ function getDb(): Client {
   return db;
 }
 
-export interface LogEntry {
-  ts: number;
-  level: 'debug' | 'info' | 'warn' | 'error';
-  content: string;
-  source?: string;
+// ==========================================
+// Database stats (cached)
+// ==========================================
+
+// Recount at most this often, and only when the database changed
+const STATS_TTL_MS = 10000;
+
+interface DbStats {
+  transcripts: number;
+  transcripts_today: number;
+  chunks: number;
+  kitt_tasks: number;
+  foods: number;
+  food_log: number;
+  food_log_today: number;
 }
 
+let statsCache: { stats: DbStats; dataVersion: number; day: string; at: number } | null = null;
+let statsRefresh: Promise<DbStats> | null = null;
+
+/**
+ * Row counts for the portal
+ * PRAGMA data_version changes when another connection (the bridge) commits,
+ * so an idle database is never recounted.
+ */
+async function getDbStats(): Promise<DbStats> {
+  const database = getDb();
+  const versionResult = await database.execute('PRAGMA data_version');
+  const dataVersion = Number(versionResult.rows[0]?.[0] ?? 0);
+  const day = new Date().toDateString();
+
+  if (
+    statsCache &&
+    statsCache.day === day &&
+    (statsCache.dataVersion === dataVersion || Date.now() - statsCache.at < STATS_TTL_MS)
+  ) {
+    return statsCache.stats;
+  }
+
+  // One recount at a time, shared by concurrent requests
+  statsRefresh ??= countRows(database)
+    .then((stats) => {
+      statsCache = { stats, dataVersion, day, at: Date.now() };
+      return stats;
+    })
+    .finally(() => {
+      statsRefresh = null;
+    });
+  return statsRefresh;
+}
+
+async function countRows(database: Client): Promise<DbStats> {
+  const todayStart = new Date();
+  todayStart.setHours(0, 0, 0, 0);
+
+  const [transcripts, transcriptsToday, chunks, tasks, foods, foodLog, foodLogToday] = await Promise.all([
+    database.execute('SELECT COUNT(*) as count FROM transcripts'),
+    database.execute({ sql: 'SELECT COUNT(*) as count FROM transcripts WHERE created_at >= ?', args: [todayStart.getTime()] }),
+    database.execute('SELECT COUNT(*) as count FROM chunks'),
+    database.execute('SELECT COUNT(*) as count FROM kitt_tasks'),
+    database.execute('SELECT COUNT(*) as count FROM foods'),
+    database.execute('SELECT COUNT(*) as count FROM food_log'),
+    database.execute("SELECT COUNT(*) as count FROM food_log WHERE logged_date = date('now', 'localtime')"),
+  ]);
+
+  return {
+    transcripts: Number(transcripts.rows[0].count),
+    transcripts_today: Number(transcriptsToday.rows[0].count),
+    chunks: Number(chunks.rows[0].count),
+    kitt_tasks: Number(tasks.rows[0].count),
+    foods: Number(foods.rows[0].count),
+    food_log: Number(foodLog.rows[0].count),
+    food_log_today: Number(foodLogToday.rows[0].count),
+  };
+}
+
+// ==========================================
+// Keyset pagination
+// ==========================================
+
+// Sort keys (all DESC) for tables paged with a cursor
+// Each key set must be backed by an index (chunks has none on created_at)
+const TABLE_KEYSETS: Record<string, string[]> = {
+  transcripts: ['created_at', 'ROWID'],
+  chunks: ['ROWID'],
+  meta: ['ROWID'],
+};
+
+/**
+ * Rows strictly after the cursor in (k1 DESC, k2 DESC, ...) order
+ */
+function keysetCondition(keys: string[]): string {
+  return keys
+    .map((key, i) => {
+      const equal = keys.slice(0, i).map((prev) => `${prev} = ?`);
+      return `(${[...equal, `${key} < ?`].join(' AND ')})`;
+    })
+    .join(' OR ');
+}
+
+function keysetArgs(values: InValue[]): InValue[] {
+  return values.flatMap((_, i) => [...values.slice(0, i), values[i]]);
+}
+
+function encodeTableCursor(values: InValue[]): string {
+  const plain = values.map((v) => (typeof v === 'bigint' ? Number(v) : v));
+  return Buffer.from(JSON.stringify(plain)).toString('base64url');
+}
+
+function decodeTableCursor(cursor: string): InValue[] | null {
+  try {
+    const values = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf-8'));
+    return Array.isArray(values) ? values : null;
+  } catch {
+    return null;
+  }
+}
+
+export type { LogEntry } from './log-store.js';
+
 let wss: WebSocketServer | null = null;
 let server: Server | null = null;
+let logStore: LogStore | null = null;
 
 // Store original console methods
 const originalConsole = {
@@ -38,28 +154,106 @@ const originalConsole = {
 
 // Buffer to store recent logs for new connections
 const LOG_BUFFER_SIZE = 100;
-const logBuffer: LogEntry[] = [];
+const logBuffer = new RingBuffer<LogEntry>(LOG_BUFFER_SIZE);
+
+// Entries are sent to clients (and written to disk) in batches
+const FLUSH_INTERVAL_MS = 100;
+// Slow clients: above this only warnings/errors are sent ...
+const SLOW_CLIENT_BYTES = 1024 * 1024;
+// ... and above this the connection is dropped
+const MAX_CLIENT_BYTES = 8 * 1024 * 1024;
+
+interface ClientState {
+  /** Client asked for batched frames (/ws?batch=1): one JSON array per flush */
+  batch: boolean;
+  /** Entries skipped since the client became slow */
+  skipped: number;
+}
+
+const clients = new WeakMap<WebSocket, ClientState>();
+let pendingEntries: LogEntry[] = [];
+let flushTimer: NodeJS.Timeout | null = null;
 
-function addToBuffer(entry: LogEntry): void {
+function broadcast(entry: LogEntry): void {
   logBuffer.push(entry);
-  if (logBuffer.length > LOG_BUFFER_SIZE) {
-    logBuffer.shift();
+  logStore?.append(entry);
+
+  if (!wss && !logStore) return;
+
+  pendingEntries.push(entry);
+  if (!flushTimer) {
+    flushTimer = setTimeout(flushEntries, FLUSH_INTERVAL_MS);
   }
 }
 
-function broadcast(entry: LogEntry): void {
-  addToBuffer(entry);
+/**
+ * Send queued entries to all clients and append them to the log store
+ */
+function flushEntries(): void {
+  flushTimer = null;
+  const entries = pendingEntries;
+  pendingEntries = [];
 
-  if (!wss) return;
+  void logStore?.flush();
+  if (!wss || entries.length === 0) return;
+
+  // Serialize once, shared by all clients
+  const serialized = entries.map((entry) => JSON.stringify(entry));
+  let important: string[] | null = null;
 
-  const message = JSON.stringify(entry);
   wss.clients.forEach((client) => {
-    if (client.readyState === WebSocket.OPEN) {
-      client.send(message);
+    if (client.readyState !== WebSocket.OPEN) return;
+    const state = clients.get(client) ?? { batch: false, skipped: 0 };
+
+    if (client.bufferedAmount > MAX_CLIENT_BYTES) {
+      originalConsole.warn('[kitt-portal] Dropping slow log client', { bufferedAmount: client.bufferedAmount });
+      client.terminate();
+      return;
+    }
+
+    let frames = serialized;
+    if (client.bufferedAmount > SLOW_CLIENT_BYTES) {
+      // Downsample: keep warnings and errors only
+      important ??= serialized.filter((_, i) => entries[i].level === 'warn' || entries[i].level === 'error');
+      state.skipped += serialized.length - important.length;
+      frames = important;
+    } else if (state.skipped > 0) {
+      frames = [
+        JSON.stringify({
+          ts: Date.now(),
+          level: 'warn',
+          content: `⚠️ ${state.skipped} log entries skipped (slow connection)`,
+          source: 'system',
+        }),
+        ...serialized,
+      ];
+      state.skipped = 0;
     }
+
+    sendFrames(client, state, frames);
   });
 }
 
+function sendFrames(client: WebSocket, state: ClientState, frames: string[]): void {
+  if (frames.length === 0) return;
+  if (state.batch) {
+    client.send(`[${frames.join(',')}]`);
+  } else {
+    for (const frame of frames) {
+      client.send(frame);
+    }
+  }
+}
+
+/**
+ * Level of structured logger output (logger.ts writes JSON via console.log)
+ */
+function detectLevel(content: string, fallback: LogLevel): LogLevel {
+  if (!content.startsWith('{"ts":')) return fallback;
+  const match = content.match(/"level":"(debug|info|warn|error)"/);
+  return match ? (match[1] as LogLevel) : fallback;
+}
+
 function detectSource(content: string): string | undefined {
   if (content.includes('[think-loop]')) return 'think-loop';
   if (content.includes('[agent]')) return 'agent';
@@ -94,7 +288,7 @@ export function installLogInterceptor(): void {
     const content = formatArgs(...args);
     broadcast({
       ts: Date.now(),
-      level: 'info',
+      level: detectLevel(content, 'info'),
       content,
       source: detectSource(content),
     });
@@ -207,43 +401,22 @@ export function startLogServer(port = 3000): { server: Server; wss: WebSocketSer
   // Stats endpoint
   app.get('/api/db/stats', async (_req, res) => {
     try {
-      const database = getDb();
-      const todayStart = new Date();
-      todayStart.setHours(0, 0, 0, 0);
-
-      const [transcripts, transcriptsToday, chunks, tasks, foods, foodLog, foodLogToday] = await Promise.all([
-        database.execute('SELECT COUNT(*) as count FROM transcripts'),
-        database.execute({ sql: 'SELECT COUNT(*) as count FROM transcripts WHERE created_at >= ?', args: [todayStart.getTime()] }),
-        database.execute('SELECT COUNT(*) as count FROM chunks'),
-        database.execute('SELECT COUNT(*) as count FROM kitt_tasks'),
-        database.execute('SELECT COUNT(*) as count FROM foods'),
-        database.execute('SELECT COUNT(*) as count FROM food_log'),
-        database.execute("SELECT COUNT(*) as count FROM food_log WHERE logged_date = date('now', 'localtime')"),
-      ]);
-
-      res.json({
-        path: DB_PATH,
-        transcripts: Number(transcripts.rows[0].count),
-        transcripts_today: Number(transcriptsToday.rows[0].count),
-        chunks: Number(chunks.rows[0].count),
-        kitt_tasks: Number(tasks.rows[0].count),
-        foods: Number(foods.rows[0].count),
-        food_log: Number(foodLog.rows[0].count),
-        food_log_today: Number(foodLogToday.rows[0].count),
-      });
+      res.json({ path: DB_PATH, ...(await getDbStats()) });
     } catch (err) {
       res.status(500).json({ error: err instanceof Error ? err.message : String(err) });
     }
   });
 
   // Table data endpoint
+  // Keyset pagination via ?cursor= (nextCursor in the response) for large tables,
+  // ?page= stays available for the small ones
   app.get('/api/db/table/:table', async (req, res) => {
     try {
       const database = getDb();
       const table = req.params.table;
       const page = parseInt(req.query.page as string) || 1;
       const limit = Math.min(parseInt(req.query.limit as string) || 50, 100);
-      const offset = (page - 1) * limit;
+      const cursor = req.query.cursor as string | undefined;
 
       // Whitelist tables for security
       const allowedTables = ['transcripts', 'chunks', 'kitt_tasks', 'foods', 'food_log', 'meta'];
@@ -251,13 +424,48 @@ export function startLogServer(port = 3000): { server: Server; wss: WebSocketSer
         return res.status(400).json({ error: 'Invalid table name' });
       }
 
-      // Get total count
-      const countResult = await database.execute(`SELECT COUNT(*) as count FROM ${table}`);
-      const total = Number(countResult.rows[0].count);
+      // Browsing never triggers the full stats recount: use the last stats
+      // snapshot when there is one, otherwise count just this table
+      const total = statsCache && table in statsCache.stats
+        ? statsCache.stats[table as keyof DbStats]
+        : Number((await database.execute(`SELECT COUNT(*) as count FROM ${table}`)).rows[0].count);
+
+      const keyset = TABLE_KEYSETS[table];
+      if (keyset) {
+        const after = cursor ? decodeTableCursor(cursor) : null;
+        const where = after && after.length === keyset.length
+          ? `WHERE ${keysetCondition(keyset)}`
+          : '';
+        // ?page= without cursor still works (OFFSET), for older portal pages
+        const offset = !where && page > 1 ? (page - 1) * limit : 0;
+
+        const result = await database.execute({
+          sql: `SELECT *, ${keyset.map((col, i) => `${col} AS _k${i}`).join(', ')}
+                FROM ${table}
+                ${where}
+                ORDER BY ${keyset.map((col) => `${col} DESC`).join(', ')}
+                LIMIT ? OFFSET ?`,
+          args: [...(where ? keysetArgs(after!) : []), limit + 1, offset],
+        });
+
+        const rows = result.rows.slice(0, limit).map((row) => {
+          const plain: Record<string, unknown> = {};
+          for (const column of result.columns) {
+            if (!/^_k\d+$/.test(column)) plain[column] = row[column];
+          }
+          return plain;
+        });
+        const last = result.rows[limit - 1];
+        const nextCursor = result.rows.length > limit && last
+          ? encodeTableCursor(keyset.map((_, i) => last[`_k${i}`] as InValue))
+          : null;
+
+        return res.json({ rows, total, page, limit, nextCursor });
+      }
 
-      // Get rows with ordering
+      // Small tables: custom ordering with OFFSET paging
+      const offset = (page - 1) * limit;
       let orderBy = 'ROWID DESC';
-      if (table === 'transcripts' || table === 'chunks') orderBy = 'created_at DESC';
       if (table === 'kitt_tasks') orderBy = 'active DESC, CASE priority WHEN \'high\' THEN 1 WHEN \'medium\' THEN 2 ELSE 3 END, id';
       if (table === 'food_log') orderBy = 'logged_date DESC, logged_time DESC';
       if (table === 'foods') orderBy = 'usage_count DESC, name';
@@ -295,27 +503,80 @@ export function startLogServer(port = 3000): { server: Server; wss: WebSocketSer
     }
   });
 
+  // ==========================================
+  // Log store API routes
+  // ==========================================
+
+  // Query stored logs: ?from=&to=&level=&source=&q=&limit=
+  app.get('/api/logs', async (req, res) => {
+    try {
+      if (!logStore) {
+        return res.status(503).json({ error: 'Log store not available' });
+      }
+      const level = req.query.level as LogLevel | undefined;
+      if (level && !LOG_LEVELS.includes(level)) {
+        return res.status(400).json({ error: 'Invalid level' });
+      }
+
+      const result = await logStore.query({
+        from: req.query.from ? Number(req.query.from) : undefined,
+        to: req.query.to ? Number(req.query.to) : undefined,
+        level,
+        source: req.query.source as string | undefined,
+        q: req.query.q as string | undefined,
+        limit: parseInt(req.query.limit as string) || undefined,
+      });
+      res.json(result);
+    } catch (err) {
+      res.status(500).json({ error: err instanceof Error ? err.message : String(err) });
+    }
+  });
+
+  // Tail stored logs: call without cursor first, then pass the returned cursor
+  app.get('/api/logs/tail', async (req, res) => {
+    try {
+      if (!logStore) {
+        return res.status(503).json({ error: 'Log store not available' });
+      }
+      const result = await logStore.tail(
+        req.query.cursor as string | undefined,
+        Math.min(parseInt(req.query.limit as string) || 500, 5000)
+      );
+      res.json(result);
+    } catch (err) {
+      res.status(500).json({ error: err instanceof Error ? err.message : String(err) });
+    }
+  });
+
+  // Hot path timings (p50/p95/p99 per span), event loop delay and memory
+  // ?reset=1 starts a fresh measurement window after reading
+  app.get('/api/metrics', (req, res) => {
+    const metrics = getMetrics();
+    if (req.query.reset === '1') {
+      resetMetrics();
+    }
+    res.json(metrics);
+  });
+
   // Create HTTP server
   server = createServer(app);
 
   // Create WebSocket server on same port
   wss = new WebSocketServer({ server, path: '/ws' });
 
-  wss.on('connection', (ws) => {
-    // Send welcome message
-    ws.send(
-      JSON.stringify({
-        ts: Date.now(),
-        level: 'info',
-        content: '🚗 Connected to KITT Live Logs',
-        source: 'system',
-      })
-    );
-
-    // Send buffered logs (recent history)
-    logBuffer.forEach((entry) => {
-      ws.send(JSON.stringify(entry));
-    });
+  wss.on('connection', (ws, req) => {
+    const url = new URL(req.url ?? '/ws', 'http://localhost');
+    const state: ClientState = { batch: url.searchParams.get('batch') === '1', skipped: 0 };
+    clients.set(ws, state);
+
+    // Welcome message + buffered logs (recent history)
+    const welcome: LogEntry = {
+      ts: Date.now(),
+      level: 'info',
+      content: '🚗 Connected to KITT Live Logs',
+      source: 'system',
+    };
+    sendFrames(ws, state, [welcome, ...logBuffer.toArray()].map((entry) => JSON.stringify(entry)));
   });
 
   // Start listening - localhost only for security
@@ -324,6 +585,16 @@ export function startLogServer(port = 3000): { server: Server; wss: WebSocketSer
     originalConsole.log(`[kitt-portal] 🌐 KITT Portal running at http://localhost:${actualPort}`);
   });
 
+  // Persist logs on disk (portal can query/tail them after a restart)
+  if (process.env.KITT_LOG_STORE !== 'false') {
+    logStore = new LogStore({
+      onError: (err) => originalConsole.error('[kitt-portal] Log store error:', err),
+    });
+    void logStore.open();
+  }
+
+  startEventLoopMonitor();
+
   // Install interceptors after server is ready
   installLogInterceptor();
 
@@ -339,6 +610,16 @@ export async function stopLogServer(): Promise<void> {
   console.warn = originalConsole.warn;
   console.error = originalConsole.error;
 
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+  }
+  flushEntries();
+
+  if (logStore) {
+    await logStore.close();
+    logStore = null;
+  }
+
   if (wss) {
     wss.close();
     wss = null;
@@ -0,0 +1,495 @@
+/**
+ * KITT Log Store
+ * Append-only, segmented on-disk log for the portal
+ *
+ * - Entries are JSON lines, appended in batches (never on the console call path)
+ * - Segments rotate by size; the oldest are removed above the size limit
+ * - index.json keeps per segment: time range, levels, sources and a sparse
+ *   (timestamp → byte offset) index, so queries skip segments and seek
+ *   to the requested time instead of reading everything
+ * - RingBuffer keeps the most recent entries in memory for new clients
+ */
+
+import fs from 'node:fs/promises';
+import path from 'node:path';
+
+const DEFAULT_LOG_DIR = process.env.KITT_LOG_DIR || './profile/logs';
+const DEFAULT_MAX_BYTES = (Number(process.env.KITT_LOG_MAX_MB) || 200) * 1024 * 1024;
+const DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024;
+
+// One sparse index point per this many bytes
+const SPARSE_INTERVAL = 64 * 1024;
+
+const INDEX_FILE = 'index.json';
+const SEGMENT_PREFIX = 'kitt-';
+const SEGMENT_SUFFIX = '.log';
+
+export const LOG_LEVELS = ['debug', 'info', 'warn', 'error'] as const;
+export type LogLevel = (typeof LOG_LEVELS)[number];
+
+export interface LogEntry {
+  ts: number;
+  level: LogLevel;
+  content: string;
+  source?: string;
+}
+
+export interface LogQuery {
+  /** Inclusive lower bound (ms) */
+  from?: number;
+  /** Inclusive upper bound (ms) */
+  to?: number;
+  /** Minimum level */
+  level?: LogLevel;
+  source?: string;
+  /** Substring match on content */
+  q?: string;
+  limit?: number;
+}
+
+export interface LogQueryResult {
+  entries: LogEntry[];
+  hasMore: boolean;
+}
+
+export interface LogTailResult {
+  entries: LogEntry[];
+  /** Pass back to continue after the last returned entry */
+  cursor: string;
+}
+
+interface SegmentMeta {
+  file: string;
+  startTs: number;
+  endTs: number;
+  bytes: number;
+  levels: LogLevel[];
+  sources: string[];
+  /** [ts, byte offset] of the first entry after every SPARSE_INTERVAL bytes */
+  sparse: Array<[number, number]>;
+}
+
+export interface LogStoreOptions {
+  dir?: string;
+  maxBytes?: number;
+  segmentBytes?: number;
+  /** Called on write errors (must not log through the console interceptor) */
+  onError?: (err: unknown) => void;
+}
+
+export class LogStore {
+  private dir: string;
+  private maxBytes: number;
+  private segmentBytes: number;
+  private onError: (err: unknown) => void;
+
+  private segments: SegmentMeta[] = [];
+  private active: SegmentMeta | null = null;
+  private handle: fs.FileHandle | null = null;
+  private pending: string[] = [];
+  private pendingEntries: LogEntry[] = [];
+  private writing: Promise<void> = Promise.resolve();
+  private opened: Promise<void> | null = null;
+
+  constructor(options: LogStoreOptions = {}) {
+    this.dir = options.dir ?? DEFAULT_LOG_DIR;
+    this.maxBytes = options.maxBytes ?? DEFAULT_MAX_BYTES;
+    this.segmentBytes = options.segmentBytes ?? DEFAULT_SEGMENT_BYTES;
+    this.onError = options.onError ?? (() => undefined);
+  }
+
+  /**
+   * Load the index and start a new segment
+   */
+  open(): Promise<void> {
+    if (!this.opened) {
+      this.opened = this.load().catch((err) => this.onError(err));
+    }
+    return this.opened;
+  }
+
+  /**
+   * Queue an entry; it is written on the next flush()
+   */
+  append(entry: LogEntry): void {
+    this.pending.push(JSON.stringify(entry));
+    this.pendingEntries.push(entry);
+  }
+
+  /**
+   * Write queued entries in one append
+   */
+  flush(): Promise<void> {
+    if (this.pending.length === 0) return this.writing;
+
+    const lines = this.pending;
+    const entries = this.pendingEntries;
+    this.pending = [];
+    this.pendingEntries = [];
+
+    this.writing = this.writing
+      .then(() => this.write(lines, entries))
+      .catch((err) => this.onError(err));
+    return this.writing;
+  }
+
+  /**
+   * Find entries matching the query, in time order
+   * Without `from`, returns the most recent `limit` matches.
+   */
+  async query(query: LogQuery = {}): Promise<LogQueryResult> {
+    await this.open();
+    await this.flush();
+
+    const limit = Math.max(1, Math.min(query.limit ?? 200, 5000));
+    const minLevel = query.level ? LOG_LEVELS.indexOf(query.level) : 0;
+    const candidates = this.allSegments().filter((segment) =>
+      segment.bytes > 0 &&
+      (query.from === undefined || segment.endTs >= query.from) &&
+      (query.to === undefined || segment.startTs <= query.to) &&
+      segment.levels.some((level) => LOG_LEVELS.indexOf(level) >= minLevel) &&
+      (query.source === undefined || segment.sources.includes(query.source))
+    );
+
+    const matches = (entry: LogEntry): boolean =>
+      (query.from === undefined || entry.ts >= query.from) &&
+      (query.to === undefined || entry.ts <= query.to) &&
+      LOG_LEVELS.indexOf(entry.level) >= minLevel &&
+      (query.source === undefined || entry.source === query.source) &&
+      (query.q === undefined || entry.content.includes(query.q));
+
+    const collected: LogEntry[] = [];
+
+    if (query.from !== undefined) {
+      // Oldest first, from the requested time
+      for (const segment of candidates) {
+        for (const entry of await this.readRange(segment, query.from, query.to)) {
+          if (!matches(entry)) continue;
+          collected.push(entry);
+          if (collected.length > limit) {
+            return { entries: collected.slice(0, limit), hasMore: true };
+          }
+        }
+      }
+      return { entries: collected, hasMore: false };
+    }
+
+    // Newest first, keep the last `limit` matches
+    for (let i = candidates.length - 1; i >= 0; i--) {
+      const found = (await this.readRange(candidates[i], undefined, query.to)).filter(matches);
+      collected.unshift(...found);
+      if (collected.length > limit) {
+        return { entries: collected.slice(-limit), hasMore: true };
+      }
+    }
+    return { entries: collected, hasMore: false };
+  }
+
+  /**
+   * Read entries written after `cursor` (all segments, in order)
+   * Without a cursor, returns no entries and a cursor at the current end.
+   */
+  async tail(cursor?: string, limit = 500): Promise<LogTailResult> {
+    await this.open();
+    await this.flush();
+
+    const segments = this.allSegments();
+    const last = segments[segments.length - 1];
+    if (!last) {
+      return { entries: [], cursor: '' };
+    }
+    if (!cursor) {
+      return { entries: [], cursor: `${last.file}:${last.bytes}` };
+    }
+
+    const [file, offsetText] = cursor.split(':');
+    let index = segments.findIndex((s) => s.file === file);
+    let offset = Number(offsetText) || 0;
+    if (index === -1) {
+      // Segment was removed: continue from the oldest one left
+      index = 0;
+      offset = 0;
+    }
+
+    const entries: LogEntry[] = [];
+    while (index < segments.length) {
+      const segment = segments[index];
+      const { lines, bytesRead } = await this.readLines(segment, offset, segment.bytes, limit - entries.length);
+      for (const line of lines) {
+        const entry = parseLine(line);
+        if (entry) entries.push(entry);
+      }
+      offset += bytesRead;
+
+      if (entries.length >= limit || offset < segment.bytes || index === segments.length - 1) break;
+      index++;
+      offset = 0;
+    }
+
+    return { entries, cursor: `${segments[index].file}:${offset}` };
+  }
+
+  getStats(): { segments: number; bytes: number; maxBytes: number } {
+    const segments = this.allSegments();
+    return {
+      segments: segments.length,
+      bytes: segments.reduce((sum, s) => sum + s.bytes, 0),
+      maxBytes: this.maxBytes,
+    };
+  }
+
+  async close(): Promise<void> {
+    await this.flush();
+    await this.writing;
+    if (this.handle) {
+      await this.handle.close().catch(() => undefined);
+      this.handle = null;
+    }
+    await this.saveIndex().catch((err) => this.onError(err));
+  }
+
+  // ==========================================
+  // Writing
+  // ==========================================
+
+  private async write(lines: string[], entries: LogEntry[]): Promise<void> {
+    await this.open();
+    if (!this.active || !this.handle) return;
+
+    const segment = this.active;
+    let offset = segment.bytes;
+    const chunks: Buffer[] = [];
+
+    for (let i = 0; i < lines.length; i++) {
+      const buffer = Buffer.from(lines[i] + '\n');
+      this.indexEntry(segment, entries[i], offset);
+      chunks.push(buffer);
+      offset += buffer.length;
+    }
+
+    await this.handle.write(Buffer.concat(chunks));
+    segment.bytes = offset;
+
+    if (segment.bytes >= this.segmentBytes) {
+      await this.rotate();
+    }
+  }
+
+  private indexEntry(segment: SegmentMeta, entry: LogEntry, offset: number): void {
+    segment.startTs = Math.min(segment.startTs, entry.ts);
+    segment.endTs = Math.max(segment.endTs, entry.ts);
+    if (!segment.levels.includes(entry.level)) segment.levels.push(entry.level);
+    if (entry.source && !segment.sources.includes(entry.source)) segment.sources.push(entry.source);
+
+    const lastPoint = segment.sparse[segment.sparse.length - 1];
+    if (!lastPoint || offset - lastPoint[1] >= SPARSE_INTERVAL) {
+      segment.sparse.push([entry.ts, offset]);
+    }
+  }
+
+  private async rotate(): Promise<void> {
+    if (this.handle) {
+      await this.handle.close();
+      this.handle = null;
+    }
+    await this.startSegment();
+    await this.enforceRetention();
+    await this.saveIndex();
+  }
+
+  private async startSegment(): Promise<void> {
+    // Segment names must stay unique and ordered, even within one millisecond
+    const previous = this.active ?? this.segments[this.segments.length - 1];
+    const now = Math.max(Date.now(), previous ? segmentStart(previous.file) + 1 : 0);
+    const segment: SegmentMeta = {
+      file: `${SEGMENT_PREFIX}${now}${SEGMENT_SUFFIX}`,
+      startTs: now,
+      endTs: now,
+      bytes: 0,
+      levels: [],
+      sources: [],
+      sparse: [],
+    };
+    this.handle = await fs.open(path.join(this.dir, segment.file), 'a');
+    if (this.active) {
+      this.segments.push(this.active);
+    }
+    this.active = segment;
+  }
+
+  private async enforceRetention(): Promise<void> {
+    let total = this.allSegments().reduce((sum, s) => sum + s.bytes, 0);
+    while (total > this.maxBytes && this.segments.length > 0) {
+      const oldest = this.segments.shift()!;
+      total -= oldest.bytes;
+      await fs.unlink(path.join(this.dir, oldest.file)).catch(() => undefined);
+    }
+  }
+
+  // ==========================================
+  // Index
+  // ==========================================
+
+  private async load(): Promise<void> {
+    await fs.mkdir(this.dir, { recursive: true });
+
+    let indexed: SegmentMeta[] = [];
+    try {
+      indexed = JSON.parse(await fs.readFile(path.join(this.dir, INDEX_FILE), 'utf-8'));
+    } catch {
+      // No index yet (or unreadable): rebuilt from the segments below
+    }
+    const byFile = new Map(indexed.map((s) => [s.file, s]));
+
+    const files = (await fs.readdir(this.dir))
+      .filter((name) => name.startsWith(SEGMENT_PREFIX) && name.endsWith(SEGMENT_SUFFIX))
+      .sort((a, b) => segmentStart(a) - segmentStart(b));
+
+    for (const file of files) {
+      const stat = await fs.stat(path.join(this.dir, file));
+      const meta = byFile.get(file);
+      // Index is stale when the process stopped without close()
+      this.segments.push(meta && meta.bytes === stat.size ? meta : await this.scanSegment(file));
+    }
+
+    await this.startSegment();
+    await this.enforceRetention();
+    await this.saveIndex();
+  }
+
+  private async scanSegment(file: string): Promise<SegmentMeta> {
+    const start = segmentStart(file);
+    const segment: SegmentMeta = { file, startTs: start, endTs: start, bytes: 0, levels: [], sources: [], sparse: [] };
+    const content = await fs.readFile(path.join(this.dir, file));
+
+    let offset = 0;
+    while (offset < content.length) {
+      let end = content.indexOf(10, offset);
+      if (end === -1) end = content.length;
+      const entry = parseLine(content.subarray(offset, end).toString('utf-8'));
+      if (entry) {
+        this.indexEntry(segment, entry, offset);
+      }
+      offset = end + 1;
+    }
+    segment.bytes = content.length;
+    return segment;
+  }
+
+  private async saveIndex(): Promise<void> {
+    const tmpPath = path.join(this.dir, `${INDEX_FILE}.tmp`);
+    await fs.writeFile(tmpPath, JSON.stringify(this.allSegments()));
+    await fs.rename(tmpPath, path.join(this.dir, INDEX_FILE));
+  }
+
+  private allSegments(): SegmentMeta[] {
+    return this.active ? [...this.segments, this.active] : [...this.segments];
+  }
+
+  // ==========================================
+  // Reading
+  // ==========================================
+
+  /**
+   * Read entries of a segment, using the sparse index to skip
+   * blocks before `from` and after `to`
+   */
+  private async readRange(segment: SegmentMeta, from?: number, to?: number): Promise<LogEntry[]> {
+    let start = 0;
+    let end = segment.bytes;
+
+    for (const [ts, offset] of segment.sparse) {
+      if (from !== undefined && ts < from) start = offset;
+      if (to !== undefined && ts > to) {
+        end = offset;
+        break;
+      }
+    }
+
+    const { lines } = await this.readLines(segment, start, end, Infinity);
+    const entries: LogEntry[] = [];
+    for (const line of lines) {
+      const entry = parseLine(line);
+      if (entry) entries.push(entry);
+    }
+    return entries;
+  }
+
+  /**
+   * Read complete lines between two byte offsets
+   */
+  private async readLines(
+    segment: SegmentMeta,
+    start: number,
+    end: number,
+    limit: number
+  ): Promise<{ lines: string[]; bytesRead: number }> {
+    if (end <= start || limit <= 0) {
+      return { lines: [], bytesRead: 0 };
+    }
+
+    const handle = await fs.open(path.join(this.dir, segment.file), 'r');
+    try {
+      const buffer = Buffer.alloc(end - start);
+      const { bytesRead } = await handle.read(buffer, 0, buffer.length, start);
+
+      const lines: string[] = [];
+      let offset = 0;
+      while (offset < bytesRead && lines.length < limit) {
+        const newline = buffer.indexOf(10, offset);
+        if (newline === -1 || newline >= bytesRead) break; // Partial line
+        lines.push(buffer.subarray(offset, newline).toString('utf-8'));
+        offset = newline + 1;
+      }
+      return { lines, bytesRead: offset };
+    } finally {
+      await handle.close();
+    }
+  }
+}
+
+/**
+ * Fixed-size ring buffer (oldest entries are overwritten)
+ */
+export class RingBuffer<T> {
+  private capacity: number;
+  private items: Array<T | undefined>;
+  private start = 0;
+  private count = 0;
+
+  constructor(capacity: number) {
+    this.capacity = capacity;
+    this.items = new Array(capacity);
+  }
+
+  push(item: T): void {
+    const index = (this.start + this.count) % this.capacity;
+    this.items[index] = item;
+    if (this.count < this.capacity) {
+      this.count++;
+    } else {
+      this.start = (this.start + 1) % this.capacity;
+    }
+  }
+
+  toArray(): T[] {
+    const result: T[] = [];
+    for (let i = 0; i < this.count; i++) {
+      result.push(this.items[(this.start + i) % this.capacity] as T);
+    }
+    return result;
+  }
+}
+
+function parseLine(line: string): LogEntry | null {
+  if (!line) return null;
+  try {
+    return JSON.parse(line) as LogEntry;
+  } catch {
+    return null;
+  }
+}
+
+function segmentStart(file: string): number {
+  return Number(file.slice(SEGMENT_PREFIX.length, -SEGMENT_SUFFIX.length)) || 0;
+}
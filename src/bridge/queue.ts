@@ -0,0 +1,167 @@
+/**
+ * KITT Chat Queue
+ * Serializes agent turns per chat and caps concurrent turns across chats
+ *
+ * - Messages for the same chat never run in parallel (one session resume at a time)
+ * - Messages arriving within a short window are merged into one turn
+ * - Messages arriving while a turn is running are merged into the next turn
+ */
+
+import { log } from './logger.js';
+
+export interface ChatQueueOptions<T> {
+  /** Quiet period before a burst is handed to the handler (ms) */
+  coalesceMs: number;
+  /** Upper bound on how long the first message of a burst waits (ms) */
+  maxWaitMs: number;
+  /** Max turns running at the same time across all chats */
+  maxConcurrent: number;
+  /** Runs one turn for a chat with all messages collected so far */
+  handler: (chatId: string, items: T[]) => Promise<void>;
+}
+
+interface ChatLane<T> {
+  pending: T[];
+  firstQueuedAt: number;
+  timer: NodeJS.Timeout | null;
+  running: boolean;
+}
+
+/**
+ * Counting semaphore with FIFO waiters
+ */
+class Semaphore {
+  private available: number;
+  private waiters: Array<() => void> = [];
+
+  constructor(count: number) {
+    this.available = Math.max(1, count);
+  }
+
+  async acquire(): Promise<void> {
+    if (this.available > 0) {
+      this.available--;
+      return;
+    }
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.available++;
+    }
+  }
+
+  get waiting(): number {
+    return this.waiters.length;
+  }
+}
+
+export class ChatQueue<T> {
+  private options: ChatQueueOptions<T>;
+  private lanes = new Map<string, ChatLane<T>>();
+  private slots: Semaphore;
+  private active = 0;
+
+  constructor(options: ChatQueueOptions<T>) {
+    this.options = options;
+    this.slots = new Semaphore(options.maxConcurrent);
+  }
+
+  /**
+   * Queue a message for a chat
+   */
+  enqueue(chatId: string, item: T): void {
+    let lane = this.lanes.get(chatId);
+    if (!lane) {
+      lane = { pending: [], firstQueuedAt: 0, timer: null, running: false };
+      this.lanes.set(chatId, lane);
+    }
+
+    if (lane.pending.length === 0) {
+      lane.firstQueuedAt = Date.now();
+    }
+    lane.pending.push(item);
+
+    // A running turn picks up pending messages when it finishes
+    if (lane.running) return;
+
+    // Debounce: wait for a quiet period, but never longer than maxWaitMs
+    if (lane.timer) {
+      clearTimeout(lane.timer);
+    }
+    const waited = Date.now() - lane.firstQueuedAt;
+    const delay = Math.max(0, Math.min(this.options.coalesceMs, this.options.maxWaitMs - waited));
+    lane.timer = setTimeout(() => {
+      lane!.timer = null;
+      void this.drain(chatId, lane!);
+    }, delay);
+  }
+
+  /**
+   * Queue stats (for logging)
+   */
+  getStats(): { chats: number; active: number; waiting: number; pending: number } {
+    let pending = 0;
+    for (const lane of this.lanes.values()) {
+      pending += lane.pending.length;
+    }
+    return {
+      chats: this.lanes.size,
+      active: this.active,
+      waiting: this.slots.waiting,
+      pending,
+    };
+  }
+
+  /**
+   * Run turns for a chat until nothing is pending
+   */
+  private async drain(chatId: string, lane: ChatLane<T>): Promise<void> {
+    if (lane.running) return;
+    lane.running = true;
+
+    try {
+      while (lane.pending.length > 0) {
+        await this.slots.acquire();
+        this.active++;
+
+        // Take everything that arrived up to now, including while waiting for a slot
+        const items = lane.pending;
+        lane.pending = [];
+
+        try {
+          if (items.length > 1) {
+            log.info('Coalesced messages into one turn', { chatId, count: items.length });
+          }
+          await this.options.handler(chatId, items);
+        } catch (err) {
+          log.error('Chat turn failed', { chatId, error: String(err) });
+        } finally {
+          this.active--;
+          this.slots.release();
+        }
+      }
+    } finally {
+      lane.running = false;
+      if (lane.pending.length === 0 && !lane.timer) {
+        this.lanes.delete(chatId);
+      }
+    }
+  }
+}
+
+/**
+ * Join the messages of one coalesced turn into a single prompt
+ * When they come from more than one sender, each message is prefixed with
+ * its sender so the agent doesn't attribute them all to the last one
+ */
+export function joinCoalescedMessages(messages: Array<{ sender: string; text: string }>): string {
+  const senders = new Set(messages.map((m) => m.sender));
+  return messages
+    .map((m) => (senders.size > 1 ? `${m.sender}: ${m.text}` : m.text))
+    .join('\n\n');
+}
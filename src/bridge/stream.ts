@@ -0,0 +1,192 @@
+/**
+ * KITT Streaming Replies
+ * Shows the agent's answer while it is being written by editing Telegram messages
+ *
+ * - Drafts are sent as plain text; the final answer is formatted (MarkdownV2)
+ * - Long answers are split into Telegram-sized chunks, one message per chunk
+ * - Edits are throttled per chat and back off on 429 (retry_after)
+ */
+
+import { GrammyError, type Api } from 'grammy';
+import { log } from './logger.js';
+import { splitMessage, splitFormattedMessage, type FormattedChunk } from './format.js';
+
+const MAX_MESSAGE_LENGTH = 4000;
+
+// Bot API: ~1 message/s per chat, ~20 messages/min in groups
+const EDIT_INTERVAL_MS = 1200;
+const GROUP_EDIT_INTERVAL_MS = 3000;
+
+// Don't open a message for the first few characters
+const MIN_DRAFT_LENGTH = 20;
+
+interface SentChunk {
+  messageId: number;
+  text: string;
+}
+
+export interface StreamingReplyOptions {
+  isGroup?: boolean;
+  replyToMessageId?: number;
+}
+
+export class StreamingReply {
+  private api: Api;
+  private chatId: string;
+  private options: StreamingReplyOptions;
+  private interval: number;
+
+  private chunks: SentChunk[] = [];
+  private draft = '';
+  private lastEditAt = 0;
+  private blockedUntil = 0;
+  private timer: NodeJS.Timeout | null = null;
+  private flushing: Promise<void> = Promise.resolve();
+  private finished = false;
+
+  constructor(api: Api, chatId: string, options: StreamingReplyOptions = {}) {
+    this.api = api;
+    this.chatId = chatId;
+    this.options = options;
+    this.interval = options.isGroup ? GROUP_EDIT_INTERVAL_MS : EDIT_INTERVAL_MS;
+  }
+
+  /**
+   * Whether any draft message was sent
+   */
+  get started(): boolean {
+    return this.chunks.length > 0;
+  }
+
+  /**
+   * Replace the draft with the latest text (throttled)
+   */
+  update(text: string): void {
+    if (this.finished) return;
+    this.draft = text;
+    if (this.chunks.length === 0 && text.trim().length < MIN_DRAFT_LENGTH) return;
+    if (this.timer) return;
+
+    const wait = Math.max(
+      0,
+      this.lastEditAt + this.interval - Date.now(),
+      this.blockedUntil - Date.now()
+    );
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.flushing = this.flushing.then(() => this.render(this.draft, false));
+    }, wait);
+  }
+
+  /**
+   * Render the final answer, formatted, and stop streaming
+   * Surplus draft messages (when the final answer is shorter) are deleted
+   */
+  async finish(text: string): Promise<void> {
+    this.finished = true;
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    await this.flushing;
+
+    const wait = this.blockedUntil - Date.now();
+    if (wait > 0) {
+      await new Promise((resolve) => setTimeout(resolve, wait));
+    }
+    await this.render(text, true);
+  }
+
+  /**
+   * Make the Telegram messages match `text`, editing only changed chunks
+   */
+  private async render(text: string, final: boolean, attempt = 0): Promise<void> {
+    if (!final && (this.finished || Date.now() < this.blockedUntil)) return;
+
+    // Drafts go out as plain text; the final answer is split after formatting
+    // so escaping can't push a chunk over Telegram's limit
+    let parts: FormattedChunk[] = [];
+    if (text.trim()) {
+      parts = final
+        ? splitFormattedMessage(text, MAX_MESSAGE_LENGTH)
+        : splitMessage(text, MAX_MESSAGE_LENGTH).map((plain) => ({ text: plain, parseMode: undefined, plain }));
+    }
+
+    try {
+      for (let i = 0; i < parts.length; i++) {
+        const { text: body, parseMode, plain } = parts[i];
+        const existing = this.chunks[i];
+
+        if (!existing) {
+          const message = await this.sendChunk(body, parseMode, plain);
+          this.chunks.push({ messageId: message.message_id, text: body });
+        } else if (existing.text !== body) {
+          await this.editChunk(existing.messageId, body, parseMode, plain);
+          existing.text = body;
+        }
+      }
+
+      if (final) {
+        for (const surplus of this.chunks.splice(parts.length)) {
+          await this.api.deleteMessage(this.chatId, surplus.messageId).catch(() => undefined);
+        }
+      }
+    } catch (err) {
+      if (err instanceof GrammyError && err.error_code === 429) {
+        const retryAfter = err.parameters?.retry_after ?? 5;
+        this.blockedUntil = Date.now() + retryAfter * 1000;
+        log.warn('Telegram rate limit while streaming', { chatId: this.chatId, retryAfter });
+        if (final && attempt < 2) {
+          await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+          return this.render(text, true, attempt + 1);
+        }
+        if (final) throw err;
+      } else if (final) {
+        throw err;
+      } else {
+        log.warn('Streaming edit failed', { chatId: this.chatId, error: String(err) });
+      }
+    } finally {
+      this.lastEditAt = Date.now();
+    }
+  }
+
+  private async sendChunk(body: string, parseMode: 'MarkdownV2' | undefined, plain: string) {
+    const replyTo = this.chunks.length === 0 ? this.options.replyToMessageId : undefined;
+    try {
+      return await this.api.sendMessage(this.chatId, body, {
+        parse_mode: parseMode,
+        reply_to_message_id: replyTo,
+      });
+    } catch (err) {
+      if (!parseMode || isRateLimit(err)) throw err;
+      // Markdown rejected by Telegram: send as plain text
+      return this.api.sendMessage(this.chatId, plain, { reply_to_message_id: replyTo });
+    }
+  }
+
+  private async editChunk(
+    messageId: number,
+    body: string,
+    parseMode: 'MarkdownV2' | undefined,
+    plain: string
+  ): Promise<void> {
+    try {
+      await this.api.editMessageText(this.chatId, messageId, body, { parse_mode: parseMode });
+    } catch (err) {
+      if (isNotModified(err)) return;
+      if (!parseMode || isRateLimit(err)) throw err;
+      await this.api.editMessageText(this.chatId, messageId, plain).catch((fallbackErr) => {
+        if (!isNotModified(fallbackErr)) throw fallbackErr;
+      });
+    }
+  }
+}
+
+function isRateLimit(err: unknown): boolean {
+  return err instanceof GrammyError && err.error_code === 429;
+}
+
+function isNotModified(err: unknown): boolean {
+  return err instanceof GrammyError && err.description.includes('message is not modified');
+}
@@ -66,10 +66,13 @@ import { getSessionId, updateSession } from './sessions.js';
 import { updateChatState, saveState } from './state.js';
 import { log } from './logger.js';
 import { getMemoryService } from '../memory/index.js';
-import { splitMessage, formatForTelegramSafe } from './format.js';
-import { transcribeAudio, downloadTelegramFile } from './transcribe.js';
-import { textToSpeech, shouldRespondWithVoice } from './tts.js';
+import { splitFormattedMessage } from './format.js';
+import { transcribeTelegramFile } from './transcribe.js';
+import { textToSpeechSegments, shouldRespondWithVoice } from './tts.js';
+import { ChatQueue, joinCoalescedMessages } from './queue.js';
+import { StreamingReply } from './stream.js';
 import { clearSleep } from '../scheduler/sleep-mode.js';
+import { recordSpan, startSpan } from '../metrics/index.js';
 
 let bot: Bot | null = null;
 
@@ -144,7 +147,7 @@ function shouldProcess(ctx: Context): boolean {
   return false;
 }
 
-// splitMessage is imported from ./format.js
+// splitFormattedMessage is imported from ./format.js
 
 /**
  * Check if user is allowed (if whitelist is configured)
@@ -215,136 +218,236 @@ async function checkMemoryTriggers(
 
 /**
  * Send a voice response via TTS
- * @returns true if voice was sent successfully, false otherwise
+ * @returns Number of voice segments sent, plus the text that was not sent
  */
 async function sendVoiceResponse(
   ctx: Context,
   text: string
-): Promise<boolean> {
+): Promise<{ sent: number; unsentText: string }> {
   // Check if ElevenLabs is configured
   if (!process.env.ELEVENLABS_API_KEY) {
     log.debug('ElevenLabs not configured, skipping voice response');
-    return false;
+    return { sent: 0, unsentText: text };
   }
 
+  const startedAt = Date.now();
+  let sent = 0;
+  let audioSize = 0;
+  // Text not yet sent as audio
+  let unsentText = text;
+
   try {
     // Show recording indicator while generating
     await ctx.replyWithChatAction('record_voice');
 
-    const ttsResult = await textToSpeech(text);
+    // Sentence groups are synthesized ahead and sent in order as they finish
+    for await (const ttsResult of textToSpeechSegments(text)) {
+      if (!ttsResult.success || ttsResult.audio.length === 0) {
+        log.error('TTS generation failed', { error: ttsResult.error, segment: sent });
+        return { sent, unsentText };
+      }
 
-    if (!ttsResult.success || ttsResult.audio.length === 0) {
-      log.error('TTS generation failed', { error: ttsResult.error });
-      return false;
-    }
+      // Send voice message
+      await ctx.replyWithVoice(
+        new InputFile(ttsResult.audio, `response-${sent + 1}.mp3`)
+      );
 
-    // Send voice message
-    await ctx.replyWithVoice(
-      new InputFile(ttsResult.audio, 'response.mp3')
-    );
+      if (sent === 0) {
+        recordSpan('voice.first_segment', Date.now() - startedAt);
+        log.info('First voice segment sent', { ms: Date.now() - startedAt, cached: !!ttsResult.cached });
+      }
+      sent++;
+      audioSize += ttsResult.audio.length;
+      unsentText = ttsResult.remainingText;
+    }
 
-    log.info('Voice response sent', {
-      textLength: text.length,
-      audioSize: ttsResult.audio.length,
-    });
+    if (sent > 0) {
+      recordSpan('voice.reply', Date.now() - startedAt);
+      log.info('Voice response sent', {
+        textLength: text.length,
+        segments: sent,
+        audioSize,
+        durationMs: Date.now() - startedAt,
+      });
+    }
 
-    return true;
+    return { sent, unsentText };
   } catch (err) {
-    log.error('Failed to send voice response', { error: String(err) });
-    return false;
+    log.error('Failed to send voice response', { error: String(err), segment: sent });
+    return { sent, unsentText };
   }
 }
 
 /**
- * Initialize and start the Telegram bot
+ * Send a text response, split into Telegram-sized chunks
  */
-export async function startTelegramBot(): Promise<Bot> {
-  const token = process.env.TELEGRAM_BOT_TOKEN;
-  if (!token) {
-    throw new Error('TELEGRAM_BOT_TOKEN is not set');
+async function sendTextResponse(ctx: Context, fullText: string): Promise<void> {
+  for (const { text, parseMode } of splitFormattedMessage(fullText, 4000)) {
+    await ctx.reply(text, { parse_mode: parseMode });
   }
+}
 
-  bot = new Bot(token);
-
-  // Handle text messages
-  bot.on('message:text', async (ctx) => {
-    const user = ctx.message.from;
-    const chatId = String(ctx.chat.id);
-    const content = ctx.message.text;
+// ==========================================
+// Chat Queue
+// ==========================================
+
+// Messages within this window are answered in one agent turn
+const COALESCE_MS = Number(process.env.KITT_TELEGRAM_COALESCE_MS) || 1500;
+// Agent turns running at the same time across all chats
+const MAX_CONCURRENT_TURNS = Number(process.env.KITT_TELEGRAM_MAX_CONCURRENT) || 2;
+// Stream partial replies by editing a message (KITT_TELEGRAM_STREAMING=false to disable)
+const STREAMING_ENABLED = process.env.KITT_TELEGRAM_STREAMING !== 'false';
+
+interface QueuedMessage {
+  ctx: Context;
+  isVoice: boolean;
+  /** Message text, or the pending transcription (null when it failed) */
+  content: Promise<string | null>;
+}
 
-    // Check user whitelist
-    if (!isAllowedUser(user.id)) {
-      log.warn('Message from non-whitelisted user', {
-        userId: user.id,
-        username: user.username,
-      });
-      return;
-    }
+const chatQueue = new ChatQueue<QueuedMessage>({
+  coalesceMs: COALESCE_MS,
+  maxWaitMs: COALESCE_MS * 4,
+  maxConcurrent: MAX_CONCURRENT_TURNS,
+  handler: (chatId, items) => runChatTurn(chatId, items),
+});
 
-    // Wake KITT if sleeping (user message = wake up)
-    {
-      const memoryForSleep = getMemoryService();
-      const sleepDb = memoryForSleep.getDb();
-      if (sleepDb) {
-        await clearSleep(sleepDb);
-      }
-    }
+/**
+ * Download and transcribe a voice message, storing the transcription in memory
+ * Replies with an apology and returns null when transcription fails
+ */
+async function transcribeVoiceMessage(ctx: Context): Promise<string | null> {
+  const message = ctx.message!;
+  const user = message.from!;
+  const chatId = String(ctx.chat!.id);
 
-    // Check if we should process this message
-    if (!shouldProcess(ctx)) {
-      log.debug('Skipping message (not triggered)', {
-        chatId: ctx.chat.id,
-        isGroup: isGroupChat(ctx.chat),
-      });
-      return;
+  try {
+    // Get file info from Telegram
+    const file = await ctx.getFile();
+    const fileUrl = `https://api.telegram.org/file/bot${process.env.TELEGRAM_BOT_TOKEN}/${file.file_path}`;
+
+    // Download and transcribe with Whisper (streamed, no intermediate buffer)
+    const endSpan = startSpan('voice.transcribe');
+    const transcription = await transcribeTelegramFile(fileUrl, file.file_path);
+    endSpan(!transcription.success);
+
+    if (!transcription.success || !transcription.text) {
+      log.error('Transcription failed', { error: transcription.error });
+      await ctx.reply('Sorry, ik kon je voice message niet verstaan. Kun je het nog een keer proberen?')
+        .catch(() => undefined);
+      return null;
     }
 
-    const chatName = getChatName(ctx.chat, user);
-    const displayName = getDisplayName(user);
+    const transcribedText = transcription.text;
 
-    log.info('Processing message', {
+    log.info('Voice transcribed', {
       chatId,
-      from: displayName,
-      isGroup: isGroupChat(ctx.chat),
-      preview: content.slice(0, 50),
-      model: TELEGRAM_DEFAULT_MODEL,
+      text: transcribedText.slice(0, 50),
     });
 
-    // Show typing indicator
-    await ctx.replyWithChatAction('typing');
-
-    // Get existing session for this chat
-    const sessionId = getSessionId(chatId);
-
-    // Store user message in memory (non-blocking)
-    const memory = getMemoryService();
-    memory.storeMessage({
+    // Store transcribed message in memory (with voice metadata)
+    getMemoryService().storeMessage({
       sessionId: chatId,
       channel: 'telegram',
       role: 'user',
-      content,
+      content: transcribedText,
       metadata: {
         userId: user.id,
         username: user.username,
-        displayName,
-        chatName,
-        isGroup: isGroupChat(ctx.chat),
-        messageId: ctx.message.message_id,
+        displayName: getDisplayName(user),
+        chatName: getChatName(ctx.chat!, user),
+        isGroup: isGroupChat(ctx.chat!),
+        messageId: message.message_id,
+        isVoice: true,
+        voiceDuration: message.voice?.duration,
       },
     }).catch((err) => {
-      log.error('Failed to store user message in memory', { error: String(err) });
+      log.error('Failed to store voice message in memory', { error: String(err) });
     });
 
-    // Run agent with Haiku (fast router/communicator)
-    let response = await runAgent(content, { sessionId, model: TELEGRAM_DEFAULT_MODEL });
+    return transcribedText;
+  } catch (err) {
+    log.error('Voice message processing failed', { error: String(err) });
+    await ctx.reply('Sorry, er ging iets mis bij het verwerken van je voice message.')
+      .catch(() => undefined);
+    return null;
+  }
+}
+
+/**
+ * Run one agent turn for all messages queued for a chat
+ * Replies go to the chat of the latest message; messages from several
+ * group members are each attributed to their sender
+ */
+async function runChatTurn(chatId: string, items: QueuedMessage[]): Promise<void> {
+  const ctx = items[items.length - 1].ctx;
+  const user = ctx.message!.from!;
+  const chat = ctx.chat!;
+
+  // Voice transcriptions were started on arrival; wait for them in order
+  const contents = await Promise.all(items.map((item) => item.content));
+  const messages = items
+    .map((item, i) => ({
+      isVoice: item.isVoice,
+      sender: getDisplayName(item.ctx.message!.from!),
+      text: contents[i],
+    }))
+    .filter((m): m is { isVoice: boolean; sender: string; text: string } => !!m.text);
+
+  if (messages.length === 0) return;
+
+  const content = joinCoalescedMessages(messages);
+  const isVoice = messages.some((m) => m.isVoice);
+  const chatName = getChatName(chat, user);
+  const displayName = getDisplayName(user);
+
+  // Transcription feedback for voice input
+  const heard = messages.filter((m) => m.isVoice).map((m) => m.text);
+  const transcriptionNote = heard.length > 0
+    ? heard.map((text) => `🎤 *Ik hoorde:* "${text}"`).join('\n') + '\n\n'
+    : '';
+
+  const useVoice = shouldRespondWithVoice(isVoice, content);
+  const stream = STREAMING_ENABLED && !useVoice
+    ? new StreamingReply(ctx.api, chatId, { isGroup: isGroupChat(chat) })
+    : null;
+
+  // Skill routing answers ("SKILL:name ...") are not for the user
+  const onText = stream
+    ? (text: string) => {
+        if (!text.startsWith('SKILL:')) stream.update(transcriptionNote + text);
+      }
+    : undefined;
+
+  log.info('Running chat turn', {
+    chatId,
+    messages: messages.length,
+    isVoice,
+    streaming: !!stream,
+    model: TELEGRAM_DEFAULT_MODEL,
+  });
+
+  try {
+    // Show typing indicator
+    await ctx.replyWithChatAction('typing');
+
+    // Get existing session for this chat
+    const sessionId = getSessionId(chatId);
+
+    let response = await runAgent(content, { sessionId, model: TELEGRAM_DEFAULT_MODEL, onText });
 
     if (response.error) {
       log.error('Agent failed', { chatId, error: response.error });
-      await ctx.reply(`Sorry, er ging iets mis. Probeer het opnieuw.`);
+      const apology = 'Sorry, er ging iets mis. Probeer het opnieuw.';
+      if (stream?.started) {
+        await stream.finish(apology);
+      } else {
+        await ctx.reply(apology);
+      }
       return;
     }
 
-    // Check if Haiku wants to trigger a skill with a different model
+    // Check if the agent wants to trigger a skill with a different model
     if (response.result) {
       const skillTrigger = parseSkillTrigger(response.result);
       if (skillTrigger) {
@@ -364,6 +467,7 @@ export async function startTelegramBot(): Promise<Bot> {
           const skillResponse = await runAgent(skillTrigger.prompt, {
             model: skillModel,
             skillContext: skillContent || undefined,
+            onText,
           });
           if (skillResponse.result) {
             response = skillResponse;
@@ -384,53 +488,140 @@ export async function startTelegramBot(): Promise<Bot> {
     // Store KITT response in memory (non-blocking)
     // F53: role 'kitt' ipv 'assistant'
     if (response.result) {
-      memory.storeMessage({
+      getMemoryService().storeMessage({
         sessionId: chatId,
         channel: 'telegram',
         role: 'kitt',
         content: response.result,
         metadata: {
           agentSessionId: response.sessionId,
+          ...(isVoice ? { inResponseToVoice: true } : {}),
         },
       }).catch((err) => {
         log.error('Failed to store KITT message in memory', { error: String(err) });
       });
 
       // Check for memory triggers (non-blocking)
-      checkMemoryTriggers(content, response.result).catch((err) => {
-        log.error('Memory trigger check failed', { error: String(err) });
-      });
+      for (const message of messages) {
+        checkMemoryTriggers(message.text, response.result).catch((err) => {
+          log.error('Memory trigger check failed', { error: String(err) });
+        });
+      }
     }
 
     // Send response
     const finalResult = response.result;
-    if (finalResult) {
-      // Check if user wants voice response (for text messages)
-      const useVoice = shouldRespondWithVoice(false, content);
-
-      if (useVoice) {
-        // Try to send voice response
-        const voiceSent = await sendVoiceResponse(ctx, finalResult);
-
-        if (!voiceSent) {
-          // Fallback to text if voice failed
-          const chunks = splitMessage(finalResult, 4000);
-          for (const chunk of chunks) {
-            const { text, parseMode } = formatForTelegramSafe(chunk);
-            await ctx.reply(text, { parse_mode: parseMode });
-          }
-        }
-      } else {
-        // Normal text response
-        const chunks = splitMessage(finalResult, 4000);
-        for (const chunk of chunks) {
-          const { text, parseMode } = formatForTelegramSafe(chunk);
-          await ctx.reply(text, { parse_mode: parseMode });
-        }
+    if (!finalResult) {
+      await stream?.finish('');
+      await ctx.reply(heard.length > 0
+        ? `🎤 Ik hoorde: "${heard.join(' ')}"\n\nIk heb je bericht verwerkt.`
+        : 'Ik heb je bericht verwerkt.');
+      return;
+    }
+
+    if (useVoice) {
+      // Try to send voice response
+      const voice = await sendVoiceResponse(ctx, finalResult);
+
+      if (voice.sent === 0) {
+        // Fallback to text if voice failed
+        await sendTextResponse(ctx, transcriptionNote + finalResult);
+      } else if (voice.unsentText) {
+        // Voice broke off halfway: send only the rest as text
+        await sendTextResponse(ctx, transcriptionNote + voice.unsentText);
+      } else if (transcriptionNote) {
+        // Also send text transcription note
+        await ctx.reply(transcriptionNote.trim(), { parse_mode: 'Markdown' });
       }
+    } else if (stream) {
+      await stream.finish(transcriptionNote + finalResult);
     } else {
-      await ctx.reply('Ik heb je bericht verwerkt.');
+      await sendTextResponse(ctx, transcriptionNote + finalResult);
     }
+  } catch (err) {
+    log.error('Chat turn failed', { chatId, error: String(err) });
+    await ctx.reply('Sorry, er ging iets mis. Probeer het opnieuw.').catch(() => undefined);
+  }
+}
+
+/**
+ * Initialize and start the Telegram bot
+ */
+export async function startTelegramBot(): Promise<Bot> {
+  const token = process.env.TELEGRAM_BOT_TOKEN;
+  if (!token) {
+    throw new Error('TELEGRAM_BOT_TOKEN is not set');
+  }
+
+  bot = new Bot(token);
+
+  // Handle text messages
+  bot.on('message:text', async (ctx) => {
+    const user = ctx.message.from;
+    const chatId = String(ctx.chat.id);
+    const content = ctx.message.text;
+
+    // Check user whitelist
+    if (!isAllowedUser(user.id)) {
+      log.warn('Message from non-whitelisted user', {
+        userId: user.id,
+        username: user.username,
+      });
+      return;
+    }
+
+    // Wake KITT if sleeping (user message = wake up)
+    {
+      const memoryForSleep = getMemoryService();
+      const sleepDb = memoryForSleep.getDb();
+      if (sleepDb) {
+        await clearSleep(sleepDb);
+      }
+    }
+
+    // Check if we should process this message
+    if (!shouldProcess(ctx)) {
+      log.debug('Skipping message (not triggered)', {
+        chatId: ctx.chat.id,
+        isGroup: isGroupChat(ctx.chat),
+      });
+      return;
+    }
+
+    const chatName = getChatName(ctx.chat, user);
+    const displayName = getDisplayName(user);
+
+    log.info('Processing message', {
+      chatId,
+      from: displayName,
+      isGroup: isGroupChat(ctx.chat),
+      preview: content.slice(0, 50),
+      ...chatQueue.getStats(),
+    });
+
+    // Show typing indicator
+    await ctx.replyWithChatAction('typing');
+
+    // Store user message in memory (non-blocking)
+    getMemoryService().storeMessage({
+      sessionId: chatId,
+      channel: 'telegram',
+      role: 'user',
+      content,
+      metadata: {
+        userId: user.id,
+        username: user.username,
+        displayName,
+        chatName,
+        isGroup: isGroupChat(ctx.chat),
+        messageId: ctx.message.message_id,
+      },
+    }).catch((err) => {
+      log.error('Failed to store user message in memory', { error: String(err) });
+    });
+
+    // Answered by the chat queue (serialized per chat, bursts merged)
+    chatQueue.enqueue(chatId, { ctx, isVoice: false, content: Promise.resolve(content) });
   });
 
   // Handle voice messages
@@ -462,7 +653,6 @@ export async function startTelegramBot(): Promise<Bot> {
       return;
     }
 
-    const chatName = getChatName(ctx.chat, user);
     const displayName = getDisplayName(user);
 
     log.info('Processing voice message', {
@@ -470,140 +660,17 @@ export async function startTelegramBot(): Promise<Bot> {
       from: displayName,
       duration: ctx.message.voice.duration,
       fileSize: ctx.message.voice.file_size,
+      ...chatQueue.getStats(),
     });
 
     // Show typing indicator
     await ctx.replyWithChatAction('typing');
 
-    try {
-      // Get file info from Telegram
-      const file = await ctx.getFile();
-      const fileUrl = `https://api.telegram.org/file/bot${process.env.TELEGRAM_BOT_TOKEN}/${file.file_path}`;
-
-      // Download the audio file
-      const audioBuffer = await downloadTelegramFile(fileUrl);
-
-      // Transcribe with Whisper
-      const transcription = await transcribeAudio(audioBuffer, file.file_path);
-
-      if (!transcription.success || !transcription.text) {
-        log.error('Transcription failed', { error: transcription.error });
-        await ctx.reply('Sorry, ik kon je voice message niet verstaan. Kun je het nog een keer proberen?');
-        return;
-      }
-
-      const transcribedText = transcription.text;
-
-      log.info('Voice transcribed', {
-        chatId,
-        text: transcribedText.slice(0, 50),
-      });
-
-      // Get existing session for this chat
-      const sessionId = getSessionId(chatId);
-
-      // Store transcribed message in memory (with voice metadata)
-      const memory = getMemoryService();
-      memory.storeMessage({
-        sessionId: chatId,
-        channel: 'telegram',
-        role: 'user',
-        content: transcribedText,
-        metadata: {
-          userId: user.id,
-          username: user.username,
-          displayName,
-          chatName,
-          isGroup: isGroupChat(ctx.chat),
-          messageId: ctx.message.message_id,
-          isVoice: true,
-          voiceDuration: ctx.message.voice.duration,
-        },
-      }).catch((err) => {
-        log.error('Failed to store voice message in memory', { error: String(err) });
-      });
-
-      // Run agent with transcribed text (Haiku for fast communication)
-      const response = await runAgent(transcribedText, { sessionId, model: TELEGRAM_DEFAULT_MODEL });
-
-      if (response.error) {
-        log.error('Agent failed on voice message', { chatId, error: response.error });
-        await ctx.reply(`Sorry, er ging iets mis. Probeer het opnieuw.`);
-        return;
-      }
-
-      // Update session for context persistence
-      if (response.sessionId) {
-        updateSession(chatId, response.sessionId, displayName);
-      }
-
-      // Update chat state
-      updateChatState(chatId, chatName);
-      await saveState();
-
-      // Store KITT response in memory
-      // F53: role 'kitt' ipv 'assistant'
-      if (response.result) {
-        memory.storeMessage({
-          sessionId: chatId,
-          channel: 'telegram',
-          role: 'kitt',
-          content: response.result,
-          metadata: {
-            agentSessionId: response.sessionId,
-            inResponseToVoice: true,
-          },
-        }).catch((err) => {
-          log.error('Failed to store KITT message in memory', { error: String(err) });
-        });
-
-        // Check for memory triggers
-        checkMemoryTriggers(transcribedText, response.result).catch((err) => {
-          log.error('Memory trigger check failed', { error: String(err) });
-        });
-      }
-
-      // Send response with transcription feedback
-      if (response.result) {
-        // Check if we should respond with voice
-        const useVoice = shouldRespondWithVoice(true, transcribedText);
-
-        if (useVoice) {
-          // Try to send voice response
-          const voiceSent = await sendVoiceResponse(ctx, response.result);
-
-          if (voiceSent) {
-            // Also send text transcription note
-            await ctx.reply(`🎤 *Ik hoorde:* "${transcribedText}"`, { parse_mode: 'Markdown' });
-          } else {
-            // Fallback to text if voice failed
-            const transcriptionNote = `🎤 *Ik hoorde:* "${transcribedText}"\n\n`;
-            const fullResponse = transcriptionNote + response.result;
-
-            const chunks = splitMessage(fullResponse, 4000);
-            for (const chunk of chunks) {
-              const { text, parseMode } = formatForTelegramSafe(chunk);
-              await ctx.reply(text, { parse_mode: parseMode });
-            }
-          }
-        } else {
-          // Text response requested
-          const transcriptionNote = `🎤 *Ik hoorde:* "${transcribedText}"\n\n`;
-          const fullResponse = transcriptionNote + response.result;
-
-          const chunks = splitMessage(fullResponse, 4000);
-          for (const chunk of chunks) {
-            const { text, parseMode } = formatForTelegramSafe(chunk);
-            await ctx.reply(text, { parse_mode: parseMode });
-          }
-        }
-      } else {
-        await ctx.reply(`🎤 Ik hoorde: "${transcribedText}"\n\nIk heb je bericht verwerkt.`);
-      }
-    } catch (err) {
-      log.error('Voice message processing failed', { error: String(err) });
-      await ctx.reply('Sorry, er ging iets mis bij het verwerken van je voice message.');
-    }
+    // Transcribe right away; the queue keeps the answers in arrival order
+    // The promise waits in the queue until the turn runs, so handle rejections now
+    const content = transcribeVoiceMessage(ctx);
+    content.catch(() => undefined);
+    chatQueue.enqueue(chatId, { ctx, isVoice: true, content });
   });
 
   // Handle errors
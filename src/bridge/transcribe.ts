@@ -2,11 +2,19 @@
  * KITT Voice Transcription Service
  *
  * Uses OpenAI Whisper API to transcribe voice messages
+ *
+ * transcribeTelegramFile() streams the Telegram download straight into the
+ * Whisper upload, so transcription starts while the file is still arriving.
  */
 
+import { randomUUID } from 'node:crypto';
+import path from 'node:path';
 import { log } from './logger.js';
 
-const OPENAI_WHISPER_URL = 'https://api.openai.com/v1/audio/transcriptions';
+// Override to point at a local stand-in server
+const OPENAI_WHISPER_URL = process.env.OPENAI_TRANSCRIPTION_URL || 'https://api.openai.com/v1/audio/transcriptions';
+const WHISPER_MODEL = 'whisper-1';
+const WHISPER_LANGUAGE = 'nl'; // Dutch as default, Whisper auto-detects if wrong
 
 export interface TranscriptionResult {
   text: string;
@@ -15,14 +23,15 @@ export interface TranscriptionResult {
 }
 
 /**
- * Transcribe audio buffer using OpenAI Whisper API
+ * Download a Telegram file and transcribe it, streaming the download
+ * into the Whisper request as a multipart body
  *
- * @param audioBuffer - The audio file buffer (OGG format from Telegram)
+ * @param fileUrl - Full URL to download the file from
  * @param filename - Original filename for the audio
  * @returns Transcription result with text or error
  */
-export async function transcribeAudio(
-  audioBuffer: Buffer,
+export async function transcribeTelegramFile(
+  fileUrl: string,
   filename = 'voice.ogg'
 ): Promise<TranscriptionResult> {
   const apiKey = process.env.OPENAI_API_KEY;
@@ -37,50 +46,54 @@ export async function transcribeAudio(
   }
 
   try {
-    // Create form data with the audio file
-    const formData = new FormData();
-    const blob = new Blob([audioBuffer], { type: 'audio/ogg' });
-    formData.append('file', blob, filename);
-    formData.append('model', 'whisper-1');
-    formData.append('language', 'nl'); // Dutch as default, Whisper auto-detects if wrong
-
-    log.info('Sending audio to Whisper API', {
-      fileSize: audioBuffer.length,
-      filename,
-    });
+    const download = await fetch(fileUrl);
+    if (!download.ok || !download.body) {
+      throw new Error(`Failed to download file: ${download.status}`);
+    }
 
-    const response = await fetch(OPENAI_WHISPER_URL, {
-      method: 'POST',
-      headers: {
-        Authorization: `Bearer ${apiKey}`,
-      },
-      body: formData,
-    });
+    const boundary = `kitt-${randomUUID()}`;
+    const head = Buffer.from(
+      formField(boundary, 'model', WHISPER_MODEL) +
+      formField(boundary, 'language', WHISPER_LANGUAGE) +
+      `--${boundary}\r\n` +
+      `Content-Disposition: form-data; name="file"; filename="${path.basename(filename)}"\r\n` +
+      'Content-Type: audio/ogg\r\n\r\n'
+    );
+    const tail = Buffer.from(`\r\n--${boundary}--\r\n`);
 
-    if (!response.ok) {
-      const errorText = await response.text();
-      log.error('Whisper API error', {
-        status: response.status,
-        error: errorText,
-      });
-      return {
-        text: '',
-        success: false,
-        error: `Whisper API error: ${response.status}`,
-      };
+    const headers: Record<string, string> = {
+      Authorization: `Bearer ${apiKey}`,
+      'Content-Type': `multipart/form-data; boundary=${boundary}`,
+    };
+
+    // Known size: send Content-Length instead of a chunked upload
+    const fileSize = Number(download.headers.get('content-length'));
+    if (fileSize > 0) {
+      headers['Content-Length'] = String(head.length + fileSize + tail.length);
     }
 
-    const data = (await response.json()) as { text: string };
+    log.info('Streaming audio to Whisper API', {
+      fileSize: fileSize || undefined,
+      filename,
+    });
 
-    log.info('Transcription successful', {
-      textLength: data.text.length,
-      preview: data.text.slice(0, 50),
+    const fileStream = download.body;
+    async function* multipartBody(): AsyncGenerator<Uint8Array> {
+      yield head;
+      for await (const chunk of fileStream) {
+        yield chunk;
+      }
+      yield tail;
+    }
+
+    const response = await fetch(OPENAI_WHISPER_URL, {
+      method: 'POST',
+      headers,
+      body: multipartBody(),
+      duplex: 'half',
     });
 
-    return {
-      text: data.text.trim(),
-      success: true,
-    };
+    return await readTranscription(response);
   } catch (err) {
     log.error('Transcription failed', { error: String(err) });
     return {
@@ -92,18 +105,35 @@ export async function transcribeAudio(
 }
 
 /**
- * Download file from Telegram and return as buffer
- *
- * @param fileUrl - Full URL to download the file from
- * @returns Buffer with file contents
+ * Parse a Whisper API response
  */
-export async function downloadTelegramFile(fileUrl: string): Promise<Buffer> {
-  const response = await fetch(fileUrl);
-
+async function readTranscription(response: Response): Promise<TranscriptionResult> {
   if (!response.ok) {
-    throw new Error(`Failed to download file: ${response.status}`);
+    const errorText = await response.text();
+    log.error('Whisper API error', {
+      status: response.status,
+      error: errorText,
+    });
+    return {
+      text: '',
+      success: false,
+      error: `Whisper API error: ${response.status}`,
+    };
   }
 
-  const arrayBuffer = await response.arrayBuffer();
-  return Buffer.from(arrayBuffer);
+  const data = (await response.json()) as { text: string };
+
+  log.info('Transcription successful', {
+    textLength: data.text.length,
+    preview: data.text.slice(0, 50),
+  });
+
+  return {
+    text: data.text.trim(),
+    success: true,
+  };
+}
+
+function formField(boundary: string, name: string, value: string): string {
+  return `--${boundary}\r\nContent-Disposition: form-data; name="${name}"\r\n\r\n${value}\r\n`;
 }
@@ -2,19 +2,41 @@
  * KITT Text-to-Speech Service
  *
  * Uses ElevenLabs API to generate voice responses
+ *
+ * - Synthesized audio is cached on disk (see audio-cache.ts)
+ * - textToSpeechSegments() splits long replies into sentence groups and
+ *   synthesizes them concurrently, yielding audio in order, so playback
+ *   can start before the whole reply is synthesized
  */
 
 import { log } from './logger.js';
+import { AudioCache } from './audio-cache.js';
 
-const ELEVENLABS_API_URL = 'https://api.elevenlabs.io/v1/text-to-speech';
+// Override to point at a local stand-in server
+const ELEVENLABS_API_URL = process.env.ELEVENLABS_API_URL || 'https://api.elevenlabs.io/v1/text-to-speech';
 
 // Default voice: Custom KITT voice
 const DEFAULT_VOICE_ID = '60CwgZt94Yf7yYIXMDDe';
+const DEFAULT_MODEL_ID = 'eleven_multilingual_v2';
+
+// Limit text length to avoid huge API costs
+const MAX_TEXT_LENGTH = 5000;
+
+// Sentence groups: small first group for a quick start, larger ones after
+const FIRST_SEGMENT_LENGTH = 200;
+const SEGMENT_LENGTH = 600;
+const SEGMENT_CONCURRENCY = 3;
+
+// Short segments (greetings, one-liners) are sent without neighbour context
+const CONTEXT_MIN_LENGTH = 80;
+
+const audioCache = new AudioCache();
 
 export interface TTSResult {
   audio: Buffer;
   success: boolean;
   error?: string;
+  cached?: boolean;
 }
 
 export interface TTSOptions {
@@ -25,6 +47,18 @@ export interface TTSOptions {
   speed?: number; // 0.25 to 4.0, default 1.25
 }
 
+export interface TTSSegmentResult extends TTSResult {
+  /** Text of this segment (cleaned for speech) */
+  text: string;
+  /** Text of the segments after this one */
+  remainingText: string;
+}
+
+export interface TTSSegmentOptions extends TTSOptions {
+  /** Segments synthesized ahead of the one being sent (default: 3) */
+  concurrency?: number;
+}
+
 /**
  * Generate speech from text using ElevenLabs API
  *
@@ -35,6 +69,105 @@ export interface TTSOptions {
 export async function textToSpeech(
   text: string,
   options: TTSOptions = {}
+): Promise<TTSResult> {
+  // Clean text for speech (remove markdown, emojis)
+  const cleanedText = cleanTextForTTS(text);
+
+  const truncatedText = cleanedText.length > MAX_TEXT_LENGTH
+    ? cleanedText.slice(0, MAX_TEXT_LENGTH) + '...'
+    : cleanedText;
+
+  return synthesize(truncatedText, options);
+}
+
+/**
+ * Generate speech per sentence group, yielding results in text order
+ * Up to `concurrency` groups are synthesized ahead of the one being consumed.
+ * Stops after the first failed segment.
+ *
+ * @param text - The text to convert to speech
+ * @param options - Optional TTS settings
+ */
+export async function* textToSpeechSegments(
+  text: string,
+  options: TTSSegmentOptions = {}
+): AsyncGenerator<TTSSegmentResult> {
+  const cleanedText = cleanTextForTTS(text).slice(0, MAX_TEXT_LENGTH);
+  const segments = splitIntoSentenceGroups(cleanedText);
+  const concurrency = Math.max(1, options.concurrency ?? SEGMENT_CONCURRENCY);
+
+  log.info('TTS segments', { textLength: cleanedText.length, segments: segments.length });
+
+  const inFlight: Promise<TTSSegmentResult>[] = [];
+  let next = 0;
+
+  const startNext = (): void => {
+    if (next >= segments.length) return;
+    const index = next++;
+    inFlight.push(synthesize(segments[index], options, {
+      previousText: segments[index - 1],
+      nextText: segments[index + 1],
+    }).then((result) => ({
+      ...result,
+      text: segments[index],
+      remainingText: segments.slice(index + 1).join(' '),
+    })));
+  };
+
+  for (let i = 0; i < concurrency; i++) {
+    startNext();
+  }
+
+  while (inFlight.length > 0) {
+    const result = await inFlight.shift()!;
+    startNext();
+    yield result;
+    if (!result.success) return;
+  }
+}
+
+/**
+ * Split text into sentence groups for segmented synthesis
+ * A sentence ends at . ! ? … followed by whitespace, or at a newline
+ * (so "3.5" stays intact). Sentences are never cut; a single sentence
+ * longer than the limit becomes its own group.
+ */
+export function splitIntoSentenceGroups(
+  text: string,
+  firstLength = FIRST_SEGMENT_LENGTH,
+  length = SEGMENT_LENGTH
+): string[] {
+  const sentences = text.match(/\S[\s\S]*?(?:[.!?…]+["')\]]*(?=\s|$)|\n|$)/g) ?? [];
+  const groups: string[] = [];
+  let current = '';
+
+  for (const raw of sentences) {
+    const sentence = raw.trim();
+    if (!sentence) continue;
+
+    const limit = groups.length === 0 ? firstLength : length;
+    if (current && current.length + 1 + sentence.length > limit) {
+      groups.push(current);
+      current = sentence;
+    } else {
+      current = current ? `${current} ${sentence}` : sentence;
+    }
+  }
+
+  if (current) {
+    groups.push(current);
+  }
+
+  return groups;
+}
+
+/**
+ * Synthesize already-cleaned text, using the on-disk cache
+ */
+async function synthesize(
+  text: string,
+  options: TTSOptions,
+  context: { previousText?: string; nextText?: string } = {}
 ): Promise<TTSResult> {
   const apiKey = process.env.ELEVENLABS_API_KEY;
   const voiceId = options.voiceId || process.env.ELEVENLABS_VOICE_ID || DEFAULT_VOICE_ID;
@@ -48,20 +181,37 @@ export async function textToSpeech(
     };
   }
 
-  // Clean text for speech (remove markdown, emojis)
-  const cleanedText = cleanTextForTTS(text);
+  const request = {
+    text,
+    model_id: options.modelId || DEFAULT_MODEL_ID,
+    voice_settings: {
+      stability: options.stability ?? 0.5,
+      similarity_boost: options.similarityBoost ?? 0.75,
+      speed: options.speed ?? 1.25,
+    },
+  };
+  const withContext = text.length >= CONTEXT_MIN_LENGTH;
+  const body = {
+    ...request,
+    // Neighbouring segments keep intonation consistent across groups
+    previous_text: withContext ? context.previousText : undefined,
+    next_text: withContext ? context.nextText : undefined,
+  };
 
-  // Limit text length to avoid huge API costs
-  const maxLength = 5000;
-  const truncatedText = cleanedText.length > maxLength
-    ? cleanedText.slice(0, maxLength) + '...'
-    : cleanedText;
+  // Context only nudges intonation: leave it out of the key so recurring
+  // sentences hit the cache whatever surrounds them
+  const cacheKey = AudioCache.key([voiceId, request]);
+  const cachedAudio = await audioCache.get(cacheKey);
+  if (cachedAudio) {
+    log.debug('TTS cache hit', { textLength: text.length, audioSize: cachedAudio.length });
+    return { audio: cachedAudio, success: true, cached: true };
+  }
 
   try {
     log.info('Sending text to ElevenLabs TTS', {
-      textLength: truncatedText.length,
+      textLength: text.length,
       voiceId,
-      preview: truncatedText.slice(0, 50),
+      preview: text.slice(0, 50),
     });
 
     const response = await fetch(`${ELEVENLABS_API_URL}/${voiceId}`, {
@@ -71,15 +221,7 @@ export async function textToSpeech(
         'Content-Type': 'application/json',
         'Accept': 'audio/mpeg',
       },
-      body: JSON.stringify({
-        text: truncatedText,
-        model_id: options.modelId || 'eleven_multilingual_v2',
-        voice_settings: {
-          stability: options.stability ?? 0.5,
-          similarity_boost: options.similarityBoost ?? 0.75,
-          speed: options.speed ?? 1.25,
-        },
-      }),
+      body: JSON.stringify(body),
     });
 
     if (!response.ok) {
@@ -102,6 +244,8 @@ export async function textToSpeech(
       audioSize: audioBuffer.length,
     });
 
+    await audioCache.set(cacheKey, audioBuffer);
+
     return {
       audio: audioBuffer,
       success: true,
@@ -0,0 +1,458 @@
+#!/usr/bin/env tsx
+/**
+ * KITT Bench CLI
+ * Measure the hot paths on a synthetic corpus
+ *
+ * For every corpus size a fresh database is generated (see bench/corpus.ts)
+ * and each hot path is run repeatedly. Embedding calls go to a local stub
+ * server (see bench/stub-server.ts), never to OpenAI. Results are reported as
+ * p50/p95/p99 latency and throughput, and can be saved as a JSON report.
+ *
+ * Usage:
+ *   npm run bench
+ *   npm run bench -- --sizes 1000,10000 --iterations 100
+ *   npm run bench -- --save before
+ *   npm run bench -- --stub --latency 200   (only run the stub server)
+ *
+ * Options:
+ *   --sizes, -s N,N    Corpus sizes in transcripts (default: 1000,5000)
+ *   --iterations, -n N Measured runs per hot path (default: 50)
+ *   --warmup, -w N     Unmeasured runs first (default: 5)
+ *   --latency MS       Stub server response delay (default: 25)
+ *   --jitter MS        Extra random stub delay, 0..MS (default: 10)
+ *   --only a,b         Only run these hot paths
+ *   --save NAME        Save results to bench/baselines/NAME.json
+ *   --keep             Keep the generated databases (prints their path)
+ *   --stub             Only start the stub server (port: --port, default 8787)
+ */
+
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { summarizeLatencies } from '../metrics/index.js';
+import { startStubServer } from '../bench/stub-server.js';
+import {
+  generateCorpus,
+  randomUnitVector,
+  seededRandom,
+  sentence,
+  transcriptInsert,
+} from '../bench/corpus.js';
+
+const BASELINE_DIR = 'bench/baselines';
+
+const HOT_PATHS = [
+  'hybridSearch',
+  'memory.search',
+  'indexTranscripts',
+  'getOpenTasks',
+  'buildThinkLoopContext',
+  'buildThinkLoopContext.incremental',
+  'getNextRun',
+  'getNextRun.yearly',
+];
+
+const CRON_EXPRESSIONS = ['0 8 * * *', '*/5 * * * *', '30 9 * * 1-5', '0 */2 * * *', '0 7 * * 1'];
+
+interface BenchOptions {
+  sizes: number[];
+  iterations: number;
+  warmup: number;
+  latency: number;
+  jitter: number;
+  only: string[];
+  save: string | null;
+  keep: boolean;
+  stub: boolean;
+  port: number;
+}
+
+interface BenchResult {
+  path: string;
+  /** Corpus size (0 = independent of the corpus) */
+  size: number;
+  iterations: number;
+  p50: number;
+  p95: number;
+  p99: number;
+  mean: number;
+  max: number;
+  opsPerSec: number;
+  /** Items processed per second (e.g. transcripts indexed) */
+  itemsPerSec?: number;
+}
+
+interface BenchReport {
+  name?: string;
+  createdAt: string;
+  node: string;
+  platform: string;
+  options: Omit<BenchOptions, 'save' | 'keep' | 'stub' | 'port'>;
+  results: BenchResult[];
+}
+
+// Parse command line arguments
+function parseArgs(): BenchOptions {
+  const args = process.argv.slice(2);
+  const result: BenchOptions = {
+    sizes: [1000, 5000],
+    iterations: 50,
+    warmup: 5,
+    latency: 25,
+    jitter: 10,
+    only: [],
+    save: null,
+    keep: false,
+    stub: false,
+    port: 8787,
+  };
+
+  for (let i = 0; i < args.length; i++) {
+    const arg = args[i];
+    const next = args[i + 1];
+
+    switch (arg) {
+      case '--sizes':
+      case '-s':
+        result.sizes = next.split(',').map((n) => parseInt(n, 10)).filter((n) => n > 0);
+        i++;
+        break;
+      case '--iterations':
+      case '-n':
+        result.iterations = parseInt(next, 10) || 50;
+        i++;
+        break;
+      case '--warmup':
+      case '-w':
+        result.warmup = parseInt(next, 10) || 0;
+        i++;
+        break;
+      case '--latency':
+        result.latency = parseInt(next, 10) || 0;
+        i++;
+        break;
+      case '--jitter':
+        result.jitter = parseInt(next, 10) || 0;
+        i++;
+        break;
+      case '--only':
+        result.only = next.split(',');
+        i++;
+        break;
+      case '--save':
+        result.save = next;
+        i++;
+        break;
+      case '--keep':
+        result.keep = true;
+        break;
+      case '--stub':
+        result.stub = true;
+        break;
+      case '--port':
+        result.port = parseInt(next, 10) || 8787;
+        i++;
+        break;
+    }
+  }
+
+  return result;
+}
+
+/**
+ * Run fn warmup + iterations times and summarize the measured runs
+ * fn may return the number of items it processed (for items/s)
+ */
+async function measure(
+  name: string,
+  size: number,
+  opts: BenchOptions,
+  fn: (iteration: number) => Promise<number | void>
+): Promise<BenchResult> {
+  for (let i = 0; i < opts.warmup; i++) {
+    await quiet(() => fn(i));
+  }
+
+  const durations: number[] = [];
+  let items = 0;
+
+  for (let i = 0; i < opts.iterations; i++) {
+    const start = performance.now();
+    const processed = await quiet(() => fn(opts.warmup + i));
+    durations.push(performance.now() - start);
+    items += processed ?? 0;
+  }
+
+  const totalSeconds = durations.reduce((sum, d) => sum + d, 0) / 1000;
+  const result: BenchResult = {
+    path: name,
+    size,
+    iterations: durations.length,
+    ...summarizeLatencies(durations),
+    opsPerSec: round(durations.length / Math.max(totalSeconds, 1e-9)),
+  };
+  if (items > 0) {
+    result.itemsPerSec = round(items / Math.max(totalSeconds, 1e-9));
+  }
+
+  printResult(result);
+  return result;
+}
+
+/**
+ * Silence console.log while fn runs (hot paths log on every call)
+ */
+async function quiet<T>(fn: () => Promise<T>): Promise<T> {
+  const log = console.log;
+  console.log = () => undefined;
+  try {
+    return await fn();
+  } finally {
+    console.log = log;
+  }
+}
+
+/**
+ * Benchmark the corpus-dependent hot paths at one corpus size
+ */
+async function benchCorpus(size: number, opts: BenchOptions, wanted: (name: string) => boolean): Promise<BenchResult[]> {
+  const results: BenchResult[] = [];
+  const dir = await fs.mkdtemp(path.join(os.tmpdir(), `kitt-bench-${size}-`));
+
+  // Imported after the environment points at the stub server
+  const { MemoryService } = await import('../memory/index.js');
+  const { hybridSearch } = await import('../memory/search.js');
+  const { getOpenTasks } = await import('../scheduler/task-engine.js');
+  const { ThinkLoopContextBuilder } = await import('../scheduler/think-loop.js');
+
+  const memory = new MemoryService({ dbPath: path.join(dir, 'kitt.db') });
+
+  try {
+    const status = await quiet(() => memory.initialize());
+    const db = memory.getDb()!;
+
+    console.log(`\n📚 Corpus: ${size} transcripts`);
+    const corpus = await generateCorpus(db, {
+      transcripts: size,
+      dimensions: status.vectorDimensions,
+      shortlistDimensions: status.shortlistAvailable ? status.shortlistDimensions : undefined,
+      fts: status.ftsAvailable,
+    });
+    console.log(
+      `   ${corpus.chunks} chunks, ${corpus.tasks} tasks, ${corpus.taskLogs} task logs, ` +
+      `${corpus.todayTranscripts} transcripts today (${(corpus.durationMs / 1000).toFixed(1)}s)`
+    );
+
+    const random = seededRandom(size);
+    const queries = Array.from({ length: 32 }, () => ({
+      text: sentence(random, 2, 5),
+      embedding: randomUnitVector(status.vectorDimensions ?? 3072, random),
+    }));
+    const vectorMode = process.env.KITT_VECTOR_MODE === 'exact' ? 'exact'
+      : process.env.KITT_VECTOR_MODE === 'shortlist' && status.shortlistAvailable ? 'shortlist'
+      : 'ann';
+
+    if (wanted('hybridSearch')) {
+      results.push(await measure('hybridSearch', size, opts, async (i) => {
+        const query = queries[i % queries.length];
+        await hybridSearch({
+          db,
+          query: query.text,
+          queryEmbedding: query.embedding,
+          maxResults: 10,
+          minScore: 0,
+          vectorAvailable: status.vectorAvailable,
+          ftsAvailable: status.ftsAvailable,
+          vectorMode,
+          shortlistDimensions: status.shortlistDimensions,
+        });
+      }));
+    }
+
+    // End to end: query embedding (stub server) + hybrid search
+    if (wanted('memory.search')) {
+      results.push(await measure('memory.search', size, opts, async (i) => {
+        await memory.search(`${queries[i % queries.length].text} ${i}`);
+      }));
+    }
+
+    if (wanted('getOpenTasks')) {
+      results.push(await measure('getOpenTasks', size, opts, async () => {
+        await getOpenTasks(db);
+      }));
+    }
+
+    // Skills and profile come from empty directories: no fetch commands run
+    const emptyDir = path.join(dir, 'empty');
+    await fs.mkdir(emptyDir);
+    const builderOptions = { skillsDir: emptyDir, profileDir: emptyDir, watch: false };
+
+    if (wanted('buildThinkLoopContext')) {
+      results.push(await measure('buildThinkLoopContext', size, opts, async () => {
+        const builder = new ThinkLoopContextBuilder(builderOptions);
+        await builder.build(db);
+        builder.close();
+      }));
+    }
+
+    // Warm builder, one new message per tick (like the bridge between ticks)
+    if (wanted('buildThinkLoopContext.incremental')) {
+      const builder = new ThinkLoopContextBuilder(builderOptions);
+      await quiet(() => builder.build(db));
+      results.push(await measure('buildThinkLoopContext.incremental', size, opts, async (i) => {
+        await db.execute(transcriptInsert({
+          id: `bench-tick-${i}`,
+          role: 'user',
+          type: 'message',
+          content: sentence(random, 5, 20),
+          createdAt: Date.now(),
+        }));
+        await builder.build(db);
+      }));
+      builder.close();
+    }
+
+    // Last: adds transcripts (and chunks) to the corpus
+    if (wanted('indexTranscripts')) {
+      const batchSize = 10;
+      results.push(await measure('indexTranscripts', size, opts, async (i) => {
+        const ids = Array.from({ length: batchSize }, (_, n) => `bench-index-${i}-${n}`);
+        await db.batch(ids.map((id) => transcriptInsert({
+          id,
+          role: 'user',
+          type: 'message',
+          content: sentence(random, 100, 400),
+          createdAt: Date.now(),
+        })), 'write');
+        const stats = await memory.indexTranscripts(ids);
+        return stats.transcripts;
+      }));
+    }
+  } finally {
+    await quiet(() => memory.close());
+    if (opts.keep) {
+      console.log(`   Database kept at ${dir}`);
+    } else {
+      await fs.rm(dir, { recursive: true, force: true });
+    }
+  }
+
+  return results;
+}
+
+/**
+ * Benchmark getNextRun (independent of the corpus)
+ */
+async function benchCron(opts: BenchOptions, wanted: (name: string) => boolean): Promise<BenchResult[]> {
+  const { getNextRun } = await import('../scheduler/cron.js');
+  const results: BenchResult[] = [];
+  const start = Date.now();
+
+  console.log('\n⏰ Cron');
+
+  if (wanted('getNextRun')) {
+    results.push(await measure('getNextRun', 0, opts, async (i) => {
+      // Spread start times over a week
+      const after = new Date(start + (i % 97) * 103 * 60 * 1000);
+      getNextRun(CRON_EXPRESSIONS[i % CRON_EXPRESSIONS.length], after);
+    }));
+  }
+
+  // Worst case: next run almost a year away
+  if (wanted('getNextRun.yearly')) {
+    results.push(await measure('getNextRun.yearly', 0, opts, async () => {
+      getNextRun('0 0 1 1 *', new Date(new Date().getFullYear(), 0, 2));
+    }));
+  }
+
+  return results;
+}
+
+function printResult(r: BenchResult): void {
+  const items = r.itemsPerSec !== undefined ? ` · ${r.itemsPerSec} items/s` : '';
+  console.log(
+    `   ${r.path.padEnd(36)} p50 ${fmt(r.p50)}  p95 ${fmt(r.p95)}  p99 ${fmt(r.p99)}  ` +
+    `${r.opsPerSec} ops/s${items}`
+  );
+}
+
+function fmt(ms: number): string {
+  return `${ms.toFixed(2)}ms`.padStart(10);
+}
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+async function main() {
+  const opts = parseArgs();
+
+  try {
+    const stub = await startStubServer({
+      port: opts.stub ? opts.port : 0,
+      latencyMs: opts.latency,
+      jitterMs: opts.jitter,
+    });
+
+    if (opts.stub) {
+      console.log(`🧪 Stub server running at ${stub.url} (latency ${opts.latency}ms + 0..${opts.jitter}ms)`);
+      for (const [key, value] of Object.entries(stub.env)) {
+        console.log(`   ${key}=${value}`);
+      }
+      return;
+    }
+
+    // Never touch the real database or the real APIs
+    Object.assign(process.env, stub.env, { OPENAI_API_KEY: 'bench' });
+    delete process.env.KITT_MEMORY_DB;
+
+    const unknown = opts.only.filter((name) => !HOT_PATHS.includes(name));
+    if (unknown.length > 0) {
+      console.error(`Unknown hot path(s): ${unknown.join(', ')} (available: ${HOT_PATHS.join(', ')})`);
+      process.exit(1);
+    }
+    const wanted = (name: string) => opts.only.length === 0 || opts.only.includes(name);
+
+    console.log(
+      `🏁 KITT bench: sizes ${opts.sizes.join(', ')} · ${opts.iterations} iterations ` +
+      `(+${opts.warmup} warmup) · stub latency ${opts.latency}ms`
+    );
+
+    const results: BenchResult[] = [];
+    results.push(...await benchCron(opts, wanted));
+    for (const size of opts.sizes) {
+      results.push(...await benchCorpus(size, opts, wanted));
+    }
+
+    await stub.close();
+    console.log(`\n🧪 Stub: ${stub.stats.embeddings} embedding requests (${stub.stats.embeddedTexts} texts)`);
+
+    const report: BenchReport = {
+      name: opts.save ?? undefined,
+      createdAt: new Date().toISOString(),
+      node: process.version,
+      platform: `${process.platform}-${process.arch} (${os.cpus().length} cpus)`,
+      options: {
+        sizes: opts.sizes,
+        iterations: opts.iterations,
+        warmup: opts.warmup,
+        latency: opts.latency,
+        jitter: opts.jitter,
+        only: opts.only,
+      },
+      results,
+    };
+
+    if (opts.save) {
+      await fs.mkdir(BASELINE_DIR, { recursive: true });
+      const file = path.join(BASELINE_DIR, `${opts.save}.json`);
+      await fs.writeFile(file, JSON.stringify(report, null, 2) + '\n');
+      console.log(`\n💾 Saved results to ${file}`);
+    }
+  } catch (err) {
+    console.error('Error:', err instanceof Error ? err.message : err);
+    process.exit(1);
+  }
+}
+
+main();
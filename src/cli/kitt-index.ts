@@ -0,0 +1,220 @@
+#!/usr/bin/env tsx
+/**
+ * KITT Index CLI
+ * Backfill the search index for transcripts
+ *
+ * Finds transcripts without chunks, or with chunks that are missing an
+ * embedding (e.g. after embedding failures or a model change), and indexes
+ * them in batched rounds. Progress is checkpointed in the meta table, so an
+ * interrupted run resumes where it stopped.
+ *
+ * Usage:
+ *   npm run index
+ *   npm run index -- --all
+ *   npm run index -- --batch 500 --concurrency 8
+ *   KITT_VECTOR_MODE=shortlist npm run index -- --shortlist
+ *
+ * Options:
+ *   --all              Reindex every transcript (after a model/chunking change)
+ *   --restart          Ignore the saved checkpoint and start from the beginning
+ *   --batch, -b N      Transcripts per round (default: 200)
+ *   --concurrency, -c N  Embedding requests in flight (default: 4)
+ *   --limit, -l N      Stop after N transcripts
+ *   --dry-run          Only report how many transcripts need indexing
+ *   --shortlist        Fill the shortlist column for existing chunks
+ *                      (vector mode 'shortlist', no API calls)
+ */
+
+import 'dotenv/config';
+import { getMemoryService } from '../memory/index.js';
+import type { IndexStats } from '../memory/types.js';
+
+// Parse command line arguments
+function parseArgs(): {
+  all: boolean;
+  restart: boolean;
+  batch: number;
+  concurrency: number;
+  limit: number;
+  dryRun: boolean;
+  shortlist: boolean;
+} {
+  const args = process.argv.slice(2);
+  const result = {
+    all: false,
+    restart: false,
+    batch: 200,
+    concurrency: 4,
+    limit: Infinity,
+    dryRun: false,
+    shortlist: false,
+  };
+
+  for (let i = 0; i < args.length; i++) {
+    const arg = args[i];
+    const next = args[i + 1];
+
+    switch (arg) {
+      case '--all':
+        result.all = true;
+        break;
+      case '--restart':
+        result.restart = true;
+        break;
+      case '--batch':
+      case '-b':
+        result.batch = parseInt(next, 10) || 200;
+        i++;
+        break;
+      case '--concurrency':
+      case '-c':
+        result.concurrency = parseInt(next, 10) || 4;
+        i++;
+        break;
+      case '--limit':
+      case '-l':
+        result.limit = parseInt(next, 10) || Infinity;
+        i++;
+        break;
+      case '--dry-run':
+        result.dryRun = true;
+        break;
+      case '--shortlist':
+        result.shortlist = true;
+        break;
+    }
+  }
+
+  return result;
+}
+
+function formatDuration(ms: number): string {
+  const seconds = Math.round(ms / 1000);
+  if (seconds < 60) return `${seconds}s`;
+  const minutes = Math.floor(seconds / 60);
+  return `${minutes}m${String(seconds % 60).padStart(2, '0')}s`;
+}
+
+async function main() {
+  const opts = parseArgs();
+  const checkpointKey = opts.all ? 'backfill-all' : 'backfill';
+
+  try {
+    const memory = getMemoryService({ embeddingConcurrency: opts.concurrency });
+    const status = await memory.initialize();
+
+    if (opts.shortlist) {
+      if (!status.shortlistAvailable) {
+        console.error('Shortlist index not available (set KITT_VECTOR_MODE=shortlist)');
+        process.exit(1);
+      }
+
+      const startedAt = Date.now();
+      let updated = 0;
+      let lastId: string | null = null;
+
+      do {
+        const round = await memory.backfillShortlist(opts.batch, lastId);
+        updated += round.updated;
+        lastId = round.lastId;
+        if (round.updated > 0) {
+          console.log(`  ${updated} chunks shortlisted`);
+        }
+      } while (lastId !== null);
+
+      console.log(`✅ Shortlist filled for ${updated} chunks in ${formatDuration(Date.now() - startedAt)}`);
+      await memory.close();
+      return;
+    }
+
+    if (!status.vectorAvailable || !process.env.OPENAI_API_KEY) {
+      console.error('Vector search or OPENAI_API_KEY not available, cannot embed');
+      process.exit(1);
+    }
+
+    // Resume from checkpoint unless asked to restart
+    if (opts.restart) {
+      await memory.setIndexCheckpoint(checkpointKey, null);
+    }
+    let cursor = await memory.getIndexCheckpoint(checkpointKey);
+
+    const total = await memory.countTranscriptsToIndex({ all: opts.all, after: cursor });
+    const target = Math.min(total, opts.limit);
+
+    if (cursor) {
+      console.log(`Resuming after ${new Date(cursor.createdAt).toISOString()} (${cursor.id})`);
+    }
+    console.log(`📚 ${total} transcripts to index${opts.all ? ' (full reindex)' : ''}`);
+
+    if (opts.dryRun || target === 0) {
+      await memory.close();
+      return;
+    }
+
+    const totals: IndexStats = {
+      transcripts: 0, chunks: 0, embedded: 0, cached: 0, missing: 0, deferred: [],
+    };
+    const startedAt = Date.now();
+
+    while (totals.transcripts < target) {
+      const batch = await memory.findTranscriptsToIndex({
+        all: opts.all,
+        after: cursor,
+        limit: Math.min(opts.batch, target - totals.transcripts),
+      });
+      if (batch.length === 0) break;
+
+      const stats = await memory.indexTranscripts(
+        batch.map((t) => t.id),
+        { replace: true }
+      );
+
+      // Checkpoint only after the round is committed
+      cursor = batch[batch.length - 1];
+      await memory.setIndexCheckpoint(checkpointKey, cursor);
+
+      totals.transcripts += batch.length;
+      totals.chunks += stats.chunks;
+      totals.embedded += stats.embedded;
+      totals.cached += stats.cached;
+      totals.missing += stats.missing;
+      totals.deferred.push(...stats.deferred);
+
+      const elapsed = Date.now() - startedAt;
+      const rate = totals.transcripts / (elapsed / 1000);
+      const eta = rate > 0 ? ((target - totals.transcripts) / rate) * 1000 : 0;
+      const pct = ((totals.transcripts / target) * 100).toFixed(1);
+
+      console.log(
+        `  ${totals.transcripts}/${target} (${pct}%) · ${totals.chunks} chunks · ` +
+        `${rate.toFixed(1)} transcripts/s · ETA ${formatDuration(eta)}`
+      );
+    }
+
+    // Finished: clear checkpoint so the next run starts fresh
+    if (totals.transcripts >= total) {
+      await memory.setIndexCheckpoint(checkpointKey, null);
+    }
+
+    const elapsed = Date.now() - startedAt;
+    const seconds = Math.max(elapsed / 1000, 0.001);
+
+    console.log('');
+    console.log(`✅ Indexed ${totals.transcripts} transcripts in ${formatDuration(elapsed)}`);
+    console.log(`   Chunks:     ${totals.chunks} (${(totals.chunks / seconds).toFixed(1)}/s)`);
+    console.log(`   Embedded:   ${totals.embedded} via API, ${totals.cached} from cache`);
+    if (totals.missing > 0) {
+      console.log(`   ⚠️  ${totals.missing} chunks still without embedding (rerun to retry)`);
+    }
+    if (totals.deferred.length > 0) {
+      console.log(`   ⚠️  ${totals.deferred.length} transcripts skipped, embedding failed (rerun to retry)`);
+    }
+
+    await memory.close();
+  } catch (err) {
+    console.error('Error:', err instanceof Error ? err.message : err);
+    process.exit(1);
+  }
+}
+
+main();
@@ -11,6 +11,7 @@
  * Options:
  *   --limit, -l    Max results (default: 10)
  *   --exact        Use keyword search instead of semantic (for exact matches)
+ *   --cursor C     Next page of --exact results (cursor from previous output)
  *   --json         Output as JSON
  *
  * Examples:
@@ -27,10 +28,11 @@ function parseArgs(): {
   query: string;
   limit: number;
   exact: boolean;
+  cursor?: string;
   json: boolean;
 } {
   const args = process.argv.slice(2);
-  const result = {
+  const result: ReturnType<typeof parseArgs> = {
     query: '',
     limit: 10,
     exact: false,
@@ -50,6 +52,11 @@ function parseArgs(): {
       case '--exact':
         result.exact = true;
         break;
+      case '--cursor':
+        result.cursor = next;
+        result.exact = true;
+        i++;
+        break;
       case '--json':
         result.json = true;
         break;
@@ -73,6 +80,7 @@ async function main() {
     console.error('Options:');
     console.error('  -l, --limit N   Max results (default: 10)');
     console.error('  --exact         Keyword search instead of semantic');
+    console.error('  --cursor C      Next page of --exact results');
     console.error('  --json          Output as JSON');
     process.exit(1);
   }
@@ -81,11 +89,12 @@ async function main() {
     const memory = getMemoryService();
 
     if (opts.exact) {
-      // Keyword search (LIKE query) - for exact matches
-      const results = await memory.searchTranscripts({
+      // Keyword search (FTS5 substring match, BM25 ranked) - for exact matches
+      const { results, nextCursor } = await memory.searchTranscriptsPage({
         query: opts.query,
         timeframe: 'all',
         limit: opts.limit,
+        cursor: opts.cursor,
       });
 
       if (opts.json) {
@@ -119,6 +128,10 @@ async function main() {
         console.log(`  ${content.replace(/\n/g, '\n  ')}`);
         console.log('');
       }
+
+      if (nextCursor) {
+        console.log(`Meer resultaten: --cursor ${nextCursor}`);
+      }
     } else {
       // Semantic search (vector) - default
       const results = await memory.search(opts.query, {
@@ -0,0 +1,121 @@
+/**
+ * KITT Memory System - Embedding Caches
+ *
+ * Two layers to avoid paying for the same embedding twice:
+ * - LruCache: bounded in-memory cache (used for query embeddings)
+ * - EmbeddingCache: content-addressed cache in the embedding_cache table,
+ *   keyed by (chunk hash, model)
+ */
+
+import type { Client, InStatement } from '@libsql/client';
+import { blobToEmbedding, embeddingToBuffer, now } from './utils.js';
+
+// Keep IN (...) lists well below SQLite's variable limit
+const LOOKUP_BATCH_SIZE = 500;
+
+/**
+ * Minimal LRU cache on top of Map insertion order
+ */
+export class LruCache<K, V> {
+  private maxSize: number;
+  private entries = new Map<K, V>();
+
+  constructor(maxSize: number) {
+    this.maxSize = Math.max(1, maxSize);
+  }
+
+  get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value === undefined) {
+      return undefined;
+    }
+
+    // Move to most-recently-used position
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  set(key: K, value: V): void {
+    if (this.entries.has(key)) {
+      this.entries.delete(key);
+    }
+    this.entries.set(key, value);
+
+    // Evict least-recently-used entries
+    while (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next().value as K;
+      this.entries.delete(oldest);
+    }
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+/**
+ * Persistent embedding cache keyed by chunk hash + model
+ */
+export class EmbeddingCache {
+  private db: Client;
+  private model: string;
+
+  constructor(db: Client, model: string) {
+    this.db = db;
+    this.model = model;
+  }
+
+  /**
+   * Look up cached embeddings for a set of hashes
+   * Returns only the hashes that were found
+   */
+  async getMany(hashes: string[]): Promise<Map<string, number[]>> {
+    const found = new Map<string, number[]>();
+    const unique = Array.from(new Set(hashes));
+
+    for (let i = 0; i < unique.length; i += LOOKUP_BATCH_SIZE) {
+      const slice = unique.slice(i, i + LOOKUP_BATCH_SIZE);
+      const placeholders = slice.map(() => '?').join(', ');
+
+      const result = await this.db.execute({
+        sql: `SELECT hash, embedding FROM embedding_cache
+              WHERE model = ? AND hash IN (${placeholders})`,
+        args: [this.model, ...slice],
+      });
+
+      for (const row of result.rows) {
+        const embedding = blobToEmbedding(row.embedding);
+        if (embedding && embedding.length > 0) {
+          found.set(String(row.hash), embedding);
+        }
+      }
+    }
+
+    return found;
+  }
+
+  /**
+   * Store embeddings for the given hashes (single write batch)
+   */
+  async setMany(
+    entries: Array<{ hash: string; embedding: number[] }>
+  ): Promise<void> {
+    if (entries.length === 0) {
+      return;
+    }
+
+    const timestamp = now();
+    const statements: InStatement[] = entries.map((entry) => ({
+      sql: `INSERT OR REPLACE INTO embedding_cache (hash, model, embedding, created_at)
+            VALUES (?, ?, ?, ?)`,
+      args: [entry.hash, this.model, embeddingToBuffer(entry.embedding), timestamp],
+    }));
+
+    await this.db.batch(statements, 'write');
+  }
+}
@@ -3,44 +3,86 @@
  *
  * Wrapper for OpenAI's embedding API with:
  * - Single and batch embedding
+ * - Bounded concurrent sub-batch requests
  * - Retry logic with exponential backoff
  * - Rate limit handling
+ * - In-memory LRU cache for query embeddings
  */
 
-import { withRetry, sleep } from './utils.js';
+import { withRetry, sleep, hashText, mapWithConcurrency } from './utils.js';
+import { LruCache } from './cache.js';
+import { timeSpan } from '../metrics/index.js';
 
-const OPENAI_API_URL = 'https://api.openai.com/v1/embeddings';
+const OPENAI_API_URL = process.env.OPENAI_EMBEDDINGS_URL || 'https://api.openai.com/v1/embeddings';
 const MAX_BATCH_SIZE = 100; // OpenAI limit
 const MAX_TOKENS_PER_BATCH = 8000; // Conservative token budget
+const QUERY_CACHE_SIZE = 256; // ~3 MB at 3072 dims
+const DEFAULT_CONCURRENCY = 4; // Parallel sub-batch requests
+
+export interface EmbeddingServiceOptions {
+  /** Max cached query embeddings (default: 256) */
+  queryCacheSize?: number;
+  /** Max embedding requests in flight (default: 4) */
+  concurrency?: number;
+}
 
 export class EmbeddingService {
   private apiKey: string;
   private model: string;
+  private concurrency: number;
+  private queryCache: LruCache<string, number[]>;
 
-  constructor(apiKey: string, model = 'text-embedding-3-large') {
+  constructor(
+    apiKey: string,
+    model = 'text-embedding-3-large',
+    options: EmbeddingServiceOptions = {}
+  ) {
     if (!apiKey) {
       throw new Error('OpenAI API key is required for embeddings');
     }
     this.apiKey = apiKey;
     this.model = model;
+    this.concurrency = Math.max(1, options.concurrency ?? DEFAULT_CONCURRENCY);
+    this.queryCache = new LruCache(options.queryCacheSize ?? QUERY_CACHE_SIZE);
+  }
+
+  /**
+   * Get the embedding model name
+   */
+  getModel(): string {
+    return this.model;
   }
 
   /**
    * Embed a single text query
    * Truncates if text exceeds token limit
+   * Repeated queries are served from the in-memory LRU cache
    */
   async embedQuery(text: string): Promise<number[]> {
     // Truncate to ~8000 tokens (~32000 chars) to stay within OpenAI limit
     const maxChars = 30000;
     const truncated = text.length > maxChars ? text.slice(0, maxChars) : text;
+
+    const cacheKey = hashText(truncated);
+    const cached = this.queryCache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
     const [embedding] = await this.embedBatch([truncated]);
+    if (embedding && embedding.length > 0) {
+      this.queryCache.set(cacheKey, embedding);
+    }
     return embedding ?? [];
   }
 
   /**
    * Embed multiple texts in a batch
-   * Automatically splits into sub-batches if needed
+   * Automatically splits into full sub-batches (MAX_BATCH_SIZE /
+   * MAX_TOKENS_PER_BATCH) and sends up to `concurrency` at once
    * Truncates individual texts that exceed token limit
+   * A failed sub-batch yields empty embeddings for its texts, so the
+   * sub-batches that succeeded are kept; throws only if all of them failed
    */
   async embedBatch(texts: string[]): Promise<number[][]> {
     if (texts.length === 0) {
@@ -58,12 +100,27 @@ export class EmbeddingService {
 
     // Split into sub-batches based on token budget
     const batches = this.splitIntoBatches(validTexts);
-    const results: number[][] = [];
-
-    for (const batch of batches) {
-      const batchResults = await this.embedBatchDirect(batch);
-      results.push(...batchResults);
+    const failures: unknown[] = [];
+    const batchResults = await timeSpan('embedding.batch', () =>
+      mapWithConcurrency(batches, this.concurrency, async (batch) => {
+        try {
+          return await this.embedBatchDirect(batch);
+        } catch (err) {
+          failures.push(err);
+          return batch.map(() => []);
+        }
+      })
+    );
+    if (failures.length === batches.length) {
+      throw failures[0];
+    }
+    if (failures.length > 0) {
+      console.error(
+        `[embeddings] ${failures.length}/${batches.length} sub-batches failed:`,
+        failures[0]
+      );
     }
+    const results = batchResults.flat();
 
     // Map results back to original indices (handle filtered empty texts)
     const mappedResults: number[][] = [];
@@ -126,7 +183,8 @@ export class EmbeddingService {
    */
   private async embedBatchDirect(texts: string[]): Promise<number[][]> {
     return withRetry(
-      async () => {
+      // One span per attempt, including reading the response body
+      () => timeSpan('embedding.request', async () => {
         const response = await fetch(OPENAI_API_URL, {
           method: 'POST',
           headers: {
@@ -171,7 +229,7 @@ export class EmbeddingService {
         // Sort by index to ensure correct order
         const sorted = data.data.sort((a, b) => a.index - b.index);
         return sorted.map((item) => this.normalizeEmbedding(item.embedding));
-      },
+      }),
       {
         maxAttempts: 3,
         baseDelayMs: 500,
@@ -6,7 +6,7 @@
  * 2. Long-term Memory (libSQL) - searchable transcripts with vector search
  */
 
-import type { Client } from '@libsql/client';
+import type { Client, InStatement } from '@libsql/client';
 import fs from 'node:fs/promises';
 import path from 'node:path';
 
@@ -17,17 +17,37 @@ import type {
   SearchResult,
   TranscriptSearchOptions,
   TranscriptSearchResult,
+  TranscriptSearchPage,
   TranscriptTimeframe,
   TranscriptType,
   Channel,
   Role,
+  ChunkSource,
+  ChunkingOptions,
+  TextChunk,
+  IndexStats,
+  IndexCursor,
+  FindTranscriptsOptions,
+  VectorMode,
 } from './types.js';
+import type { EmbeddingService } from './embeddings.js';
+import type { EmbeddingCache } from './cache.js';
 import {
   initializeDatabase,
   closeDatabase,
   type DatabaseStatus,
 } from './schema.js';
-import { generateId, now, formatDate } from './utils.js';
+import {
+  generateId,
+  now,
+  formatDate,
+  blobToEmbedding,
+  embeddingToBuffer,
+  shortenEmbedding,
+  encodeTranscriptCursor,
+  decodeTranscriptCursor,
+} from './utils.js';
+import { instrumentClient, startSpan, timeSpan } from '../metrics/index.js';
 
 // Default configuration
 const DEFAULT_CONFIG: MemoryConfig = {
@@ -36,12 +56,18 @@ const DEFAULT_CONFIG: MemoryConfig = {
   openaiApiKey: process.env.OPENAI_API_KEY ?? '',
   embeddingModel: 'text-embedding-3-large',
   embeddingDimensions: 3072,
+  embeddingConcurrency: 4,
+  vectorMode: 'ann',
+  shortlistDimensions: 256,
   chunkTokens: 400,
   chunkOverlap: 80,
   vectorWeight: 0.7,
   textWeight: 0.3,
 };
 
+// Max transcripts per indexing round (one embed pass + one write transaction)
+const INDEX_ROUND_SIZE = 200;
+
 export class MemoryService {
   private db: Client | null = null;
   private config: MemoryConfig;
@@ -51,9 +77,13 @@ export class MemoryService {
   // Background indexing queue
   private indexQueue: Set<string> = new Set();
   private indexTimer: NodeJS.Timeout | null = null;
+  private syncTimer: NodeJS.Timeout | null = null;
+  private syncInFlight: Promise<void> | null = null;
+  private syncQueued: Promise<void> | null = null;
 
   // Lazy-loaded services (initialized on first use)
-  private _embedder: any = null;
+  private _embedder: EmbeddingService | null = null;
+  private _embeddingCache: EmbeddingCache | null = null;
   private _searcher: any = null;
 
   constructor(config: Partial<MemoryConfig> = {}) {
@@ -63,6 +93,9 @@ export class MemoryService {
     if (process.env.KITT_MEMORY_DB) {
       this.config.dbPath = process.env.KITT_MEMORY_DB;
     }
+    if (process.env.KITT_VECTOR_MODE) {
+      this.config.vectorMode = process.env.KITT_VECTOR_MODE as VectorMode;
+    }
     if (process.env.OPENAI_API_KEY) {
       this.config.openaiApiKey = process.env.OPENAI_API_KEY;
     }
@@ -79,9 +112,12 @@ export class MemoryService {
 
     const { db, status } = await initializeDatabase(this.config.dbPath, {
       vectorDimensions: this.config.embeddingDimensions,
+      vectorMode: this.config.vectorMode,
+      shortlistDimensions: this.config.shortlistDimensions,
     });
 
-    this.db = db;
+    // Every query is timed (db.execute / db.batch spans on /api/metrics)
+    this.db = instrumentClient(db);
     this.status = status;
     this.initialized = true;
 
@@ -94,6 +130,7 @@ export class MemoryService {
       fts: status.ftsAvailable,
       vector: status.vectorAvailable,
       dimensions: status.vectorDimensions,
+      mode: this.getVectorMode(),
     });
 
     return status;
@@ -109,6 +146,18 @@ export class MemoryService {
       this.indexTimer = null;
     }
 
+    // Flush a debounced MEMORY.md sync, or wait for the one running
+    const pendingSync = this.syncTimer
+      ? this.sync()
+      : this.syncQueued ?? this.syncInFlight;
+    if (this.syncTimer) {
+      clearTimeout(this.syncTimer);
+      this.syncTimer = null;
+    }
+    await pendingSync?.catch((err) => {
+      console.error('[memory] Final sync failed:', err);
+    });
+
     // Process remaining queue
     if (this.indexQueue.size > 0) {
       await this.processIndexQueue();
@@ -120,6 +169,7 @@ export class MemoryService {
       this.db = null;
     }
 
+    this._embeddingCache = null;
     this.initialized = false;
   }
 
@@ -193,38 +243,52 @@ export class MemoryService {
     options: SearchOptions = {}
   ): Promise<SearchResult[]> {
     await this.ensureInitialized();
+    const endSpan = startSpan('search.total');
+    let failed = true;
 
-    // Import search module lazily
-    if (!this._searcher) {
-      const { hybridSearch } = await import('./search.js');
-      this._searcher = hybridSearch;
-    }
+    try {
+      // Import search module lazily
+      if (!this._searcher) {
+        const { hybridSearch } = await import('./search.js');
+        this._searcher = hybridSearch;
+      }
 
-    // Import embeddings module lazily
-    if (!this._embedder) {
-      const { EmbeddingService } = await import('./embeddings.js');
-      this._embedder = new EmbeddingService(
-        this.config.openaiApiKey,
-        this.config.embeddingModel
-      );
-    }
+      // Get query embedding (LRU-cached in the embedding service)
+      const embedder = await this.getEmbedder();
+      const queryEmbedding = await embedder.embedQuery(query);
+
+      // Run hybrid search
+      const results: SearchResult[] = await this._searcher({
+        db: this.db!,
+        query,
+        queryEmbedding,
+        maxResults: options.maxResults ?? 10,
+        minScore: options.minScore ?? 0.3,
+        vectorWeight: this.config.vectorWeight,
+        textWeight: this.config.textWeight,
+        sources: options.sources,
+        vectorAvailable: this.status?.vectorAvailable ?? false,
+        ftsAvailable: this.status?.ftsAvailable ?? false,
+        vectorMode: this.getVectorMode(),
+        shortlistDimensions: this.status?.shortlistDimensions,
+      });
 
-    // Get query embedding
-    const queryEmbedding = await this._embedder.embedQuery(query);
+      failed = false;
+      return results;
+    } finally {
+      // Failed searches count as errors on the span
+      endSpan(failed);
+    }
+  }
 
-    // Run hybrid search
-    return this._searcher({
-      db: this.db!,
-      query,
-      queryEmbedding,
-      maxResults: options.maxResults ?? 10,
-      minScore: options.minScore ?? 0.3,
-      vectorWeight: this.config.vectorWeight,
-      textWeight: this.config.textWeight,
-      sources: options.sources,
-      vectorAvailable: this.status?.vectorAvailable ?? false,
-      ftsAvailable: this.status?.ftsAvailable ?? false,
-    });
+  /**
+   * Effective vector mode (shortlist falls back to ann if unavailable)
+   */
+  private getVectorMode(): VectorMode {
+    if (this.config.vectorMode === 'shortlist' && !this.status?.shortlistAvailable) {
+      return 'ann';
+    }
+    return this.config.vectorMode;
   }
 
   // ==========================================
@@ -239,6 +303,21 @@ export class MemoryService {
   async searchTranscripts(
     options: TranscriptSearchOptions = {}
   ): Promise<TranscriptSearchResult[]> {
+    const page = await this.searchTranscriptsPage(options);
+    return page.results;
+  }
+
+  /**
+   * Search transcripts, one page at a time
+   * A query answered by the FTS5 index is BM25 ranked, paged on
+   * (rank, created_at, fts_id); the first page pins the highest fts_id so rows
+   * added later don't shift pages. Without a query (or on the LIKE fallback)
+   * results are newest first, paged on (created_at, rowid).
+   * Pass nextCursor back as options.cursor
+   */
+  async searchTranscriptsPage(
+    options: TranscriptSearchOptions = {}
+  ): Promise<TranscriptSearchPage> {
     await this.ensureInitialized();
 
     const {
@@ -247,6 +326,7 @@ export class MemoryService {
       roles,
       channels,
       limit = 20,
+      cursor,
     } = options;
 
     // Calculate start date based on timeframe
@@ -256,53 +336,105 @@ export class MemoryService {
     const whereClauses: string[] = [];
     const args: (string | number)[] = [];
 
-    // Timeframe filter
+    // Timeframe filter (range scan on idx_transcripts_created)
     if (startDate) {
-      whereClauses.push('created_at >= ?');
+      whereClauses.push('t.created_at >= ?');
       args.push(startDate);
     }
 
     // Role filter
     if (roles && roles.length > 0) {
       const placeholders = roles.map(() => '?').join(', ');
-      whereClauses.push(`role IN (${placeholders})`);
+      whereClauses.push(`t.role IN (${placeholders})`);
       args.push(...roles);
     }
 
     // Channel filter
     if (channels && channels.length > 0) {
       const placeholders = channels.map(() => '?').join(', ');
-      whereClauses.push(`channel IN (${placeholders})`);
+      whereClauses.push(`t.channel IN (${placeholders})`);
       args.push(...channels);
     }
 
-    // Query filter (LIKE search)
-    if (query && query.trim()) {
-      whereClauses.push('content LIKE ?');
+    // Query filter: FTS5 when the index can answer it, LIKE otherwise
+    const ftsQuery = query ? this.buildTranscriptFtsQuery(query) : null;
+    if (query && query.trim() && !ftsQuery) {
+      whereClauses.push('t.content LIKE ?');
       args.push(`%${query.trim()}%`);
     }
 
-    // Build SQL
-    // F53: Include type column
-    const whereClause = whereClauses.length > 0
-      ? `WHERE ${whereClauses.join(' AND ')}`
-      : '';
+    // Keyset position; a cursor from the other ordering starts over
+    let position = cursor ? decodeTranscriptCursor(cursor) : null;
+    if (position && (position.rank !== undefined) !== (ftsQuery !== null)) {
+      position = null;
+    }
+
+    let sql: string;
+    let snapshot: number | undefined;
+    if (ftsQuery) {
+      snapshot = position?.snapshot ?? await this.getTranscriptFtsSnapshot();
+      whereClauses.unshift('transcripts_fts MATCH ?', 'f.rowid <= ?');
+      args.unshift(ftsQuery, snapshot);
+
+      // Continue after the last (rank, created_at, fts_id) seen
+      if (position) {
+        whereClauses.push(
+          '(f.rank > ? OR (f.rank = ? AND (t.created_at < ? OR (t.created_at = ? AND t.fts_id < ?))))'
+        );
+        args.push(
+          position.rank!, position.rank!, position.createdAt, position.createdAt, position.rowid
+        );
+      }
+
+      // F53: Include type column
+      sql = `
+        SELECT t.fts_id AS row_id, f.rank AS rank, t.id, t.session_id, t.channel, t.role, t.type, t.content, t.created_at
+        FROM transcripts_fts f
+        JOIN transcripts t ON t.fts_id = f.rowid
+        WHERE ${whereClauses.join(' AND ')}
+        ORDER BY f.rank ASC, t.created_at DESC, t.fts_id DESC
+        LIMIT ?
+      `;
+    } else {
+      // Continue after the last (created_at, rowid) seen
+      if (position) {
+        whereClauses.push('(t.created_at < ? OR (t.created_at = ? AND t.rowid < ?))');
+        args.push(position.createdAt, position.createdAt, position.rowid);
+      }
 
-    const sql = `
-      SELECT id, session_id, channel, role, type, content, created_at
-      FROM transcripts
-      ${whereClause}
-      ORDER BY created_at DESC
-      LIMIT ?
-    `;
-    args.push(limit);
+      const whereClause = whereClauses.length > 0
+        ? whereClauses.join(' AND ')
+        : '1 = 1';
+
+      // F53: Include type column
+      sql = `
+        SELECT t.rowid AS row_id, t.id, t.session_id, t.channel, t.role, t.type, t.content, t.created_at
+        FROM transcripts t
+        WHERE ${whereClause}
+        ORDER BY t.created_at DESC, t.rowid DESC
+        LIMIT ?
+      `;
+    }
 
-    // Execute query
-    const result = await this.db!.execute({ sql, args });
+    // Fetch one extra row to know if there is a next page
+    const result = await this.db!.execute({
+      sql,
+      args: [...args, limit + 1],
+    });
+
+    const rows = result.rows.slice(0, limit);
+    const last = rows[rows.length - 1];
+    const nextCursor = result.rows.length > limit && last
+      ? encodeTranscriptCursor({
+          createdAt: Number(last.created_at),
+          rowid: Number(last.row_id),
+          ...(snapshot !== undefined ? { rank: Number(last.rank), snapshot } : {}),
+        })
+      : null;
 
     // Map to results
     // F53: Include type in result
-    return result.rows.map((row) => {
+    const results = rows.map((row) => {
       const content = String(row.content);
       return {
         id: String(row.id),
@@ -315,6 +447,38 @@ export class MemoryService {
         createdAt: new Date(Number(row.created_at)),
       };
     });
+
+    return { results, nextCursor };
+  }
+
+  /**
+   * Highest fts_id indexed so far (bounds a ranked search across pages)
+   */
+  private async getTranscriptFtsSnapshot(): Promise<number> {
+    const result = await this.db!.execute('SELECT COALESCE(MAX(fts_id), 0) AS max_id FROM transcripts');
+    return Number(result.rows[0].max_id);
+  }
+
+  /**
+   * Build an FTS5 MATCH expression for a transcript query
+   * Returns null if the FTS index can't answer it (caller falls back to LIKE)
+   */
+  private buildTranscriptFtsQuery(query: string): string | null {
+    const tokenizer = this.status?.transcriptsFtsTokenizer;
+    const trimmed = query.trim();
+    if (!tokenizer || !trimmed) return null;
+
+    if (tokenizer === 'trigram') {
+      // Phrase match = case-insensitive substring match (same as LIKE)
+      // Trigram can't match anything shorter than 3 characters
+      if ([...trimmed].length < 3) return null;
+      return `"${trimmed.replace(/"/g, '""')}"`;
+    }
+
+    // unicode61: AND all word tokens (prefix match on each)
+    const tokens = trimmed.match(/[\p{L}\p{N}_]+/gu) ?? [];
+    if (tokens.length === 0) return null;
+    return tokens.map((t) => `"${t}"*`).join(' AND ');
   }
 
   /**
@@ -374,6 +538,9 @@ export class MemoryService {
     // Find section and append
     const updated = this.appendToSection(content, section, entry);
     await fs.writeFile(this.config.memoryPath, updated);
+
+    // Keep the search index in sync (only changed chunks are re-embedded)
+    this.scheduleSync();
   }
 
   /**
@@ -416,8 +583,30 @@ export class MemoryService {
 
   /**
    * Sync memory files (MEMORY.md) to the search index
+   * One sync runs at a time; calls made meanwhile share a single follow-up
+   * run, so their changes are picked up without overlapping writes
    */
   async sync(): Promise<void> {
+    if (this.syncQueued) return this.syncQueued;
+
+    if (this.syncInFlight) {
+      this.syncQueued = this.syncInFlight.then(() => {
+        this.syncQueued = null;
+        return this.sync();
+      });
+      return this.syncQueued;
+    }
+
+    this.syncInFlight = this.syncMemoryFiles().finally(() => {
+      this.syncInFlight = null;
+    });
+    return this.syncInFlight;
+  }
+
+  /**
+   * One sync run (see sync)
+   */
+  private async syncMemoryFiles(): Promise<void> {
     await this.ensureInitialized();
 
     // Import chunking module
@@ -441,14 +630,15 @@ export class MemoryService {
 
   /**
    * Index a memory file into chunks
+   * Diffs chunk hashes against the index: unchanged chunks are kept,
+   * only new chunks are embedded and only stale rows are removed
    */
   private async indexMemoryFile(
     filePath: string,
     content: string,
     source: 'memory',
-    chunkText: any
+    chunkText: (content: string, options: ChunkingOptions) => TextChunk[]
   ): Promise<void> {
-    const { hashText } = await import('./utils.js');
     const relativePath = path.relative(process.cwd(), filePath);
 
     // Chunk the content
@@ -457,99 +647,122 @@ export class MemoryService {
       overlap: this.config.chunkOverlap,
     });
 
-    // Check if already indexed with same hash
-    const contentHash = hashText(content);
+    // Load what is currently indexed for this file
     const existingResult = await this.db!.execute({
-      sql: `SELECT id FROM chunks WHERE path = ? AND hash = ? AND source = ? LIMIT 1`,
-      args: [relativePath, contentHash, source],
+      sql: `SELECT id, hash, start_line, end_line, model, embedding IS NOT NULL AS has_embedding
+            FROM chunks WHERE path = ? AND source = ?`,
+      args: [relativePath, source],
     });
 
-    if (existingResult.rows.length > 0) {
-      return; // Already indexed
-    }
+    // Rows are reusable if they were embedded with the current model
+    const wantsEmbeddings = this.canEmbed();
+    const reusable = new Map<string, Array<{ id: string; startLine: number; endLine: number }>>();
+    const staleIds: string[] = [];
 
-    // Delete old chunks for this path
-    await this.db!.execute({
-      sql: `DELETE FROM chunks WHERE path = ? AND source = ?`,
-      args: [relativePath, source],
-    });
+    for (const row of existingResult.rows) {
+      const id = String(row.id);
+      const usable =
+        String(row.model) === this.config.embeddingModel &&
+        (!wantsEmbeddings || Number(row.has_embedding) === 1);
 
-    // Delete from FTS if available
-    if (this.status?.ftsAvailable) {
-      try {
-        await this.db!.execute({
-          sql: `DELETE FROM chunks_fts WHERE path = ? AND source = ?`,
-          args: [relativePath, source],
-        });
-      } catch {
-        // Ignore FTS errors
+      if (!usable) {
+        staleIds.push(id);
+        continue;
       }
+
+      const hash = String(row.hash);
+      const rows = reusable.get(hash) ?? [];
+      rows.push({ id, startLine: Number(row.start_line), endLine: Number(row.end_line) });
+      reusable.set(hash, rows);
     }
 
-    // Get embeddings for all chunks
-    let embeddings: number[][] = [];
-    if (this.status?.vectorAvailable && this.config.openaiApiKey) {
-      if (!this._embedder) {
-        const { EmbeddingService } = await import('./embeddings.js');
-        this._embedder = new EmbeddingService(
-          this.config.openaiApiKey,
-          this.config.embeddingModel
-        );
-      }
+    // Match new chunks against existing rows by hash
+    const added: TextChunk[] = [];
+    const moved: Array<{ id: string; chunk: TextChunk }> = [];
 
-      try {
-        embeddings = await this._embedder.embedBatch(
-          chunks.map((c: any) => c.content)
-        );
-      } catch (err) {
-        console.error('[memory] Failed to generate embeddings:', err);
+    for (const chunk of chunks) {
+      const match = reusable.get(chunk.hash)?.shift();
+      if (!match) {
+        added.push(chunk);
+      } else if (match.startLine !== chunk.startLine || match.endLine !== chunk.endLine) {
+        moved.push({ id: match.id, chunk });
       }
     }
 
-    // Insert new chunks
-    const timestamp = now();
+    // Whatever was not matched no longer exists in the file
+    for (const rows of reusable.values()) {
+      staleIds.push(...rows.map((r) => r.id));
+    }
 
-    for (let i = 0; i < chunks.length; i++) {
-      const chunk = chunks[i];
-      const embedding = embeddings[i] ?? null;
-      const id = generateId();
+    if (staleIds.length === 0 && added.length === 0 && moved.length === 0) {
+      return; // Already indexed
+    }
 
-      // Insert chunk with vector embedding
-      await this.db!.execute({
-        sql: `INSERT INTO chunks (id, transcript_id, source, path, content, hash, start_line, end_line, embedding, model, created_at)
-              VALUES (?, NULL, ?, ?, ?, ?, ?, ?, ${embedding ? 'vector32(?)' : 'NULL'}, ?, ?)`,
-        args: [
-          id,
-          source,
-          relativePath,
-          chunk.content,
-          chunk.hash,
-          chunk.startLine,
-          chunk.endLine,
-          ...(embedding ? [JSON.stringify(embedding)] : []),
-          this.config.embeddingModel,
-          timestamp,
-        ],
-      });
+    // Embed only the new chunks (before opening the write transaction)
+    const { embeddings } = await this.embedChunks(added);
+
+    const statements: InStatement[] = [];
 
-      // Insert into FTS
+    // Remove stale chunks
+    if (staleIds.length > 0) {
+      const placeholders = staleIds.map(() => '?').join(', ');
       if (this.status?.ftsAvailable) {
-        try {
-          await this.db!.execute({
-            sql: `INSERT INTO chunks_fts (id, content, source, path) VALUES (?, ?, ?, ?)`,
-            args: [id, chunk.content, source, relativePath],
-          });
-        } catch {
-          // Ignore FTS errors
-        }
+        statements.push({
+          sql: `DELETE FROM chunks_fts WHERE id IN (${placeholders})`,
+          args: staleIds,
+        });
       }
+      statements.push({
+        sql: `DELETE FROM chunks WHERE id IN (${placeholders})`,
+        args: staleIds,
+      });
+    }
+
+    // Keep line numbers of shifted chunks accurate for citations
+    for (const { id, chunk } of moved) {
+      statements.push({
+        sql: `UPDATE chunks SET start_line = ?, end_line = ? WHERE id = ?`,
+        args: [chunk.startLine, chunk.endLine, id],
+      });
     }
+
+    // Insert new chunks
+    for (let i = 0; i < added.length; i++) {
+      statements.push(
+        ...this.buildChunkInserts(added[i], embeddings[i], {
+          source,
+          transcriptId: null,
+          path: relativePath,
+        })
+      );
+    }
+
+    // Apply the whole diff in one transaction
+    await this.db!.batch(statements, 'write');
+
+    console.log(
+      `[memory] Reindexed ${relativePath}: +${added.length} -${staleIds.length} ~${moved.length}`
+    );
   }
 
   // ==========================================
   // Background Indexing
   // ==========================================
 
+  /**
+   * Schedule a MEMORY.md sync (debounced)
+   */
+  private scheduleSync(): void {
+    if (this.syncTimer) return;
+
+    this.syncTimer = setTimeout(() => {
+      this.syncTimer = null;
+      this.sync().catch((err) => {
+        console.error('[memory] Background sync failed:', err);
+      });
+    }, 1000);
+  }
+
   /**
    * Schedule a transcript for background indexing
    */
@@ -569,6 +782,8 @@ export class MemoryService {
 
   /**
    * Process all queued transcripts for indexing
+   * Queued transcripts are indexed together so their chunks share
+   * embedding requests and write transactions
    */
   private async processIndexQueue(): Promise<void> {
     if (this.indexQueue.size === 0) return;
@@ -576,97 +791,454 @@ export class MemoryService {
     const ids = Array.from(this.indexQueue);
     this.indexQueue.clear();
 
-    for (const id of ids) {
+    for (let i = 0; i < ids.length; i += INDEX_ROUND_SIZE) {
+      const round = ids.slice(i, i + INDEX_ROUND_SIZE);
       try {
-        await this.indexTranscript(id);
+        const stats = await timeSpan('index.round', () => this.indexTranscripts(round));
+
+        // Retried with the next scheduled round
+        for (const id of stats.deferred) {
+          this.indexQueue.add(id);
+        }
       } catch (err) {
-        console.error(`[memory] Failed to index transcript ${id}:`, err);
+        console.error(`[memory] Failed to index ${round.length} transcripts:`, err);
+        for (const id of round) {
+          this.indexQueue.add(id);
+        }
       }
     }
   }
 
   /**
-   * Index a single transcript
+   * Index a set of transcripts in one pass:
+   * 1. Load and chunk all transcripts
+   * 2. Embed all chunks together (packed into full, concurrent API batches)
+   * 3. Write all chunks in a single transaction
+   * Transcripts with a chunk that failed to embed are not written (their
+   * existing chunks stay) and are returned in stats.deferred
+   *
+   * @param options.replace - Remove existing chunks first (for reindexing)
    */
-  private async indexTranscript(transcriptId: string): Promise<void> {
-    // Get transcript content
-    const result = await this.db!.execute({
-      sql: `SELECT content FROM transcripts WHERE id = ?`,
-      args: [transcriptId],
-    });
+  async indexTranscripts(
+    transcriptIds: string[],
+    options: { replace?: boolean } = {}
+  ): Promise<IndexStats> {
+    await this.ensureInitialized();
 
-    if (result.rows.length === 0) return;
-    const content = String(result.rows[0].content);
+    const stats: IndexStats = {
+      transcripts: 0,
+      chunks: 0,
+      embedded: 0,
+      cached: 0,
+      missing: 0,
+      deferred: [],
+    };
+    if (transcriptIds.length === 0) return stats;
 
-    // Import chunking
     const { chunkText } = await import('./chunking.js');
 
-    // Chunk the content
-    const chunks = chunkText(content, {
-      tokens: this.config.chunkTokens,
-      overlap: this.config.chunkOverlap,
+    // Load transcript contents
+    const placeholders = transcriptIds.map(() => '?').join(', ');
+    const result = await this.db!.execute({
+      sql: `SELECT id, content FROM transcripts WHERE id IN (${placeholders})`,
+      args: transcriptIds,
     });
 
-    // Skip if no meaningful chunks
-    if (chunks.length === 0) return;
-
-    // Get embeddings if vector search is available
-    let embeddings: number[][] = [];
-    if (this.status?.vectorAvailable && this.config.openaiApiKey) {
-      if (!this._embedder) {
-        const { EmbeddingService } = await import('./embeddings.js');
-        this._embedder = new EmbeddingService(
-          this.config.openaiApiKey,
-          this.config.embeddingModel
+    // Chunk every transcript
+    const pending = result.rows.map((row) => ({
+      transcriptId: String(row.id),
+      chunks: chunkText(String(row.content), {
+        tokens: this.config.chunkTokens,
+        overlap: this.config.chunkOverlap,
+      }),
+    }));
+
+    // Embed all chunks together (cached by chunk hash)
+    const allChunks = pending.flatMap((p) => p.chunks);
+    const { embeddings, embedded, cached } = await this.embedChunks(allChunks);
+
+    // Build one write batch for all transcripts
+    const canEmbed = this.canEmbed();
+    const statements: InStatement[] = [];
+    let offset = 0;
+
+    for (const { transcriptId, chunks } of pending) {
+      const chunkEmbeddings = embeddings.slice(offset, offset + chunks.length);
+      offset += chunks.length;
+
+      if (canEmbed && chunkEmbeddings.some((e) => !e)) {
+        stats.deferred.push(transcriptId);
+        continue;
+      }
+
+      if (options.replace) {
+        if (this.status?.ftsAvailable) {
+          statements.push({
+            sql: `DELETE FROM chunks_fts WHERE id IN (SELECT id FROM chunks WHERE transcript_id = ?)`,
+            args: [transcriptId],
+          });
+        }
+        statements.push({
+          sql: `DELETE FROM chunks WHERE transcript_id = ?`,
+          args: [transcriptId],
+        });
+      }
+
+      for (let i = 0; i < chunks.length; i++) {
+        const chunk = chunks[i];
+        const embedding = chunkEmbeddings[i];
+        if (!embedding) stats.missing++;
+        stats.chunks++;
+
+        statements.push(
+          ...this.buildChunkInserts(chunk, embedding, {
+            source: 'transcript',
+            transcriptId,
+            path: null,
+          })
         );
       }
+    }
+
+    if (statements.length > 0) {
+      await this.db!.batch(statements, 'write');
+    }
+
+    if (stats.deferred.length > 0) {
+      console.warn(`[memory] Deferred ${stats.deferred.length} transcripts (embedding failed)`);
+    }
+
+    stats.transcripts = pending.length - stats.deferred.length;
+    stats.embedded = embedded;
+    stats.cached = cached;
+    return stats;
+  }
+
+  /**
+   * Find transcripts that need (re)indexing, oldest first
+   * Default: transcripts without chunks, or with chunks that are missing an
+   * embedding or were embedded with another model
+   */
+  async findTranscriptsToIndex(
+    options: FindTranscriptsOptions
+  ): Promise<Array<IndexCursor>> {
+    await this.ensureInitialized();
+
+    const { where, args } = this.buildIndexFilter(options);
+    const result = await this.db!.execute({
+      sql: `SELECT t.id, t.created_at FROM transcripts t
+            ${where}
+            ORDER BY t.created_at ASC, t.id ASC
+            LIMIT ?`,
+      args: [...args, options.limit],
+    });
+
+    return result.rows.map((row) => ({
+      id: String(row.id),
+      createdAt: Number(row.created_at),
+    }));
+  }
+
+  /**
+   * Count transcripts that need (re)indexing (for progress reporting)
+   */
+  async countTranscriptsToIndex(
+    options: Omit<FindTranscriptsOptions, 'limit'>
+  ): Promise<number> {
+    await this.ensureInitialized();
+
+    const { where, args } = this.buildIndexFilter(options);
+    const result = await this.db!.execute({
+      sql: `SELECT COUNT(*) AS count FROM transcripts t ${where}`,
+      args,
+    });
+
+    return Number(result.rows[0]?.count ?? 0);
+  }
+
+  /**
+   * Build the WHERE clause shared by find/count
+   */
+  private buildIndexFilter(
+    options: Omit<FindTranscriptsOptions, 'limit'>
+  ): { where: string; args: (string | number)[] } {
+    // Task logs are never indexed (see storeMessage), and blank content
+    // yields no chunks, so it would otherwise match "not indexed" forever
+    const whereClauses: string[] = [
+      "(t.type IS NULL OR t.type != 'task')",
+      "TRIM(COALESCE(t.content, ''), char(32, 9, 10, 13)) != ''",
+    ];
+    const args: (string | number)[] = [];
+
+    if (options.after) {
+      whereClauses.push('(t.created_at > ? OR (t.created_at = ? AND t.id > ?))');
+      args.push(options.after.createdAt, options.after.createdAt, options.after.id);
+    }
+
+    if (!options.all) {
+      whereClauses.push(`(
+        NOT EXISTS (SELECT 1 FROM chunks c WHERE c.transcript_id = t.id)
+        OR EXISTS (
+          SELECT 1 FROM chunks c
+          WHERE c.transcript_id = t.id
+            AND (c.embedding IS NULL OR c.model IS NOT ?)
+        )
+      )`);
+      args.push(this.config.embeddingModel);
+    }
+
+    return { where: `WHERE ${whereClauses.join(' AND ')}`, args };
+  }
+
+  /**
+   * Read a saved backfill checkpoint from the meta table
+   */
+  async getIndexCheckpoint(key: string): Promise<IndexCursor | null> {
+    await this.ensureInitialized();
+
+    const result = await this.db!.execute({
+      sql: 'SELECT value FROM meta WHERE key = ?',
+      args: [`index_checkpoint:${key}`],
+    });
+    if (result.rows.length === 0) return null;
+
+    try {
+      return JSON.parse(String(result.rows[0].value)) as IndexCursor;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Save (or clear, with null) a backfill checkpoint
+   */
+  async setIndexCheckpoint(key: string, cursor: IndexCursor | null): Promise<void> {
+    await this.ensureInitialized();
+
+    if (cursor) {
+      await this.db!.execute({
+        sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+        args: [`index_checkpoint:${key}`, JSON.stringify(cursor)],
+      });
+    } else {
+      await this.db!.execute({
+        sql: 'DELETE FROM meta WHERE key = ?',
+        args: [`index_checkpoint:${key}`],
+      });
+    }
+  }
+
+  /**
+   * Fill embedding_short for chunks embedded before shortlist mode was enabled
+   * Derived from the stored full embedding, no API calls
+   * Pass the returned lastId to continue; lastId is null when done
+   */
+  async backfillShortlist(
+    limit = 500,
+    after: string | null = null
+  ): Promise<{ updated: number; lastId: string | null }> {
+    await this.ensureInitialized();
+
+    const dims = this.status?.shortlistDimensions;
+    if (!dims) return { updated: 0, lastId: null };
+
+    const result = await this.db!.execute({
+      sql: `SELECT id, embedding FROM chunks
+            WHERE embedding IS NOT NULL AND embedding_short IS NULL AND id > ?
+            ORDER BY id
+            LIMIT ?`,
+      args: [after ?? '', limit],
+    });
+    if (result.rows.length === 0) return { updated: 0, lastId: null };
+
+    const statements: InStatement[] = [];
+    for (const row of result.rows) {
+      const embedding = blobToEmbedding(row.embedding);
+      if (!embedding || embedding.length === 0) continue;
+
+      statements.push({
+        sql: `UPDATE chunks SET embedding_short = vector32(?) WHERE id = ?`,
+        args: [embeddingToBuffer(shortenEmbedding(embedding, dims)), String(row.id)],
+      });
+    }
+
+    if (statements.length > 0) {
+      await this.db!.batch(statements, 'write');
+    }
+
+    return {
+      updated: statements.length,
+      lastId: String(result.rows[result.rows.length - 1].id),
+    };
+  }
+
+  // ==========================================
+  // Embeddings
+  // ==========================================
+
+  /**
+   * Whether embeddings can be generated (vector support + API key)
+   */
+  private canEmbed(): boolean {
+    return Boolean(this.status?.vectorAvailable && this.config.openaiApiKey);
+  }
+
+  /**
+   * Get the embedding service (lazy-loaded)
+   */
+  private async getEmbedder(): Promise<EmbeddingService> {
+    if (!this._embedder) {
+      const { EmbeddingService } = await import('./embeddings.js');
+      this._embedder = new EmbeddingService(
+        this.config.openaiApiKey,
+        this.config.embeddingModel,
+        { concurrency: this.config.embeddingConcurrency }
+      );
+    }
+    return this._embedder;
+  }
+
+  /**
+   * Get the persistent embedding cache (lazy-loaded)
+   */
+  private async getEmbeddingCache(): Promise<EmbeddingCache> {
+    if (!this._embeddingCache) {
+      const { EmbeddingCache } = await import('./cache.js');
+      this._embeddingCache = new EmbeddingCache(
+        this.db!,
+        this.config.embeddingModel
+      );
+    }
+    return this._embeddingCache;
+  }
+
+  /**
+   * Embed chunks, reusing cached embeddings by chunk hash
+   * Only chunks missing from the cache are sent to OpenAI
+   * Returns null for chunks that could not be embedded
+   */
+  private async embedChunks(chunks: TextChunk[]): Promise<{
+    embeddings: Array<number[] | null>;
+    embedded: number;
+    cached: number;
+  }> {
+    if (chunks.length === 0 || !this.canEmbed()) {
+      return { embeddings: chunks.map(() => null), embedded: 0, cached: 0 };
+    }
+
+    const cache = await this.getEmbeddingCache();
+    let found = new Map<string, number[]>();
+
+    try {
+      found = await cache.getMany(chunks.map((c) => c.hash));
+    } catch (err) {
+      console.warn('[memory] Embedding cache lookup failed:', err);
+    }
+
+    // Deduplicate misses by hash (identical chunks embed once)
+    const misses = new Map<string, TextChunk>();
+    for (const chunk of chunks) {
+      if (!found.has(chunk.hash)) {
+        misses.set(chunk.hash, chunk);
+      }
+    }
+
+    const cached = chunks.length - misses.size;
+    let embedded = 0;
+
+    if (misses.size > 0) {
+      const pending = Array.from(misses.values());
 
       try {
-        embeddings = await this._embedder.embedBatch(
-          chunks.map((c: any) => c.content)
-        );
+        const embedder = await this.getEmbedder();
+        const fresh = await embedder.embedBatch(pending.map((c) => c.content));
+
+        const entries: Array<{ hash: string; embedding: number[] }> = [];
+        for (let i = 0; i < pending.length; i++) {
+          const embedding = fresh[i];
+          if (embedding && embedding.length > 0) {
+            found.set(pending[i].hash, embedding);
+            entries.push({ hash: pending[i].hash, embedding });
+          }
+        }
+        embedded = entries.length;
+
+        try {
+          await cache.setMany(entries);
+        } catch (err) {
+          console.warn('[memory] Embedding cache write failed:', err);
+        }
       } catch (err) {
         console.error('[memory] Failed to generate embeddings:', err);
       }
     }
 
-    // Store chunks
-    const timestamp = now();
+    return {
+      embeddings: chunks.map((c) => found.get(c.hash) ?? null),
+      embedded,
+      cached,
+    };
+  }
 
-    for (let i = 0; i < chunks.length; i++) {
-      const chunk = chunks[i];
-      const embedding = embeddings[i] ?? null;
-      const id = generateId();
+  /**
+   * Build INSERT statements for a chunk (and its FTS row)
+   */
+  private buildChunkInserts(
+    chunk: TextChunk,
+    embedding: number[] | null,
+    target: {
+      source: ChunkSource;
+      transcriptId: string | null;
+      path: string | null;
+    }
+  ): InStatement[] {
+    const id = generateId();
+    const shortlistDims = this.status?.shortlistDimensions;
+
+    // Embeddings are bound as Float32 blobs (no JSON round trip)
+    const vectorColumns = ['embedding'];
+    const vectorValues = [embedding ? 'vector32(?)' : 'NULL'];
+    const vectorArgs: Buffer[] = embedding ? [embeddingToBuffer(embedding)] : [];
+
+    // Shortlist shadow column (reduced dimensions)
+    if (shortlistDims) {
+      vectorColumns.push('embedding_short');
+      vectorValues.push(embedding ? 'vector32(?)' : 'NULL');
+      if (embedding) {
+        vectorArgs.push(embeddingToBuffer(shortenEmbedding(embedding, shortlistDims)));
+      }
+    }
 
-      // Insert chunk with vector embedding
-      await this.db!.execute({
-        sql: `INSERT INTO chunks (id, transcript_id, source, path, content, hash, start_line, end_line, embedding, model, created_at)
-              VALUES (?, ?, 'transcript', NULL, ?, ?, ?, ?, ${embedding ? 'vector32(?)' : 'NULL'}, ?, ?)`,
+    // Chunk with vector embedding
+    const statements: InStatement[] = [
+      {
+        sql: `INSERT INTO chunks (id, transcript_id, source, path, content, hash, start_line, end_line, ${vectorColumns.join(', ')}, model, created_at)
+              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ${vectorValues.join(', ')}, ?, ?)`,
         args: [
           id,
-          transcriptId,
+          target.transcriptId,
+          target.source,
+          target.path,
           chunk.content,
           chunk.hash,
           chunk.startLine,
           chunk.endLine,
-          ...(embedding ? [JSON.stringify(embedding)] : []),
+          ...vectorArgs,
           this.config.embeddingModel,
-          timestamp,
+          now(),
         ],
-      });
+      },
+    ];
 
-      // Insert into FTS
-      if (this.status?.ftsAvailable) {
-        try {
-          await this.db!.execute({
-            sql: `INSERT INTO chunks_fts (id, content, source, path) VALUES (?, ?, 'transcript', NULL)`,
-            args: [id, chunk.content],
-          });
-        } catch {
-          // Ignore FTS errors
-        }
-      }
+    // FTS row
+    if (this.status?.ftsAvailable) {
+      statements.push({
+        sql: `INSERT INTO chunks_fts (id, content, source, path) VALUES (?, ?, ?, ?)`,
+        args: [id, chunk.content, target.source, target.path],
+      });
     }
+
+    return statements;
   }
 
   // ==========================================
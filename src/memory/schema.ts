@@ -11,7 +11,9 @@ import { createClient, type Client } from '@libsql/client';
 import fs from 'node:fs';
 import path from 'node:path';
 
-const SCHEMA_VERSION = 10; // Bumped for Daily Blog Post (F60)
+import type { VectorMode } from './types.js';
+
+const SCHEMA_VERSION = 12; // Bumped for task completion covering index
 
 // Core schema SQL
 const CORE_SCHEMA = `
@@ -56,12 +58,13 @@ CREATE INDEX IF NOT EXISTS idx_chunks_transcript ON chunks(transcript_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_source ON chunks(source);
 CREATE INDEX IF NOT EXISTS idx_chunks_hash ON chunks(hash);
 
--- Embedding cache to avoid re-computing
+-- Embedding cache to avoid re-computing (content-addressed by chunk hash)
 CREATE TABLE IF NOT EXISTS embedding_cache (
-  hash TEXT PRIMARY KEY,
-  embedding TEXT NOT NULL,
+  hash TEXT NOT NULL,
   model TEXT NOT NULL,
-  created_at INTEGER NOT NULL
+  embedding BLOB NOT NULL,                 -- Float32 little-endian
+  created_at INTEGER NOT NULL,
+  PRIMARY KEY (hash, model)
 );
 
 -- Task Engine: KITT's mental to-do list
@@ -140,11 +143,49 @@ CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
 );
 `;
 
+// FTS5 index over raw transcripts (for searchTranscripts)
+// External content: the text lives only in transcripts. The index is keyed on
+// transcripts.fts_id, a stored integer, because VACUUM may renumber the
+// implicit rowid of a table with a TEXT primary key.
+// Trigram tokenizer keeps substring matches working (Dutch compounds)
+const TRANSCRIPTS_FTS_TOKENIZERS = ['trigram', 'unicode61 remove_diacritics 2'];
+
+// Rows indexed per write batch when backfilling existing transcripts
+const TRANSCRIPTS_FTS_BACKFILL_BATCH = 1000;
+
+const TRANSCRIPTS_FTS_TRIGGERS = [
+  // New rows get an fts_id above every existing one (and never below their
+  // rowid, so ids handed out while older rows are backfilled can't collide)
+  `CREATE TRIGGER IF NOT EXISTS transcripts_fts_ai AFTER INSERT ON transcripts BEGIN
+    UPDATE transcripts
+    SET fts_id = MAX((SELECT COALESCE(MAX(fts_id), 0) + 1 FROM transcripts), new.rowid)
+    WHERE rowid = new.rowid AND new.fts_id IS NULL;
+    INSERT INTO transcripts_fts (rowid, content)
+    SELECT fts_id, content FROM transcripts WHERE rowid = new.rowid;
+  END`,
+  `CREATE TRIGGER IF NOT EXISTS transcripts_fts_ad AFTER DELETE ON transcripts
+  WHEN old.fts_id IS NOT NULL BEGIN
+    INSERT INTO transcripts_fts (transcripts_fts, rowid, content) VALUES ('delete', old.fts_id, old.content);
+  END`,
+  `CREATE TRIGGER IF NOT EXISTS transcripts_fts_au AFTER UPDATE OF content ON transcripts
+  WHEN old.fts_id IS NOT NULL BEGIN
+    INSERT INTO transcripts_fts (transcripts_fts, rowid, content) VALUES ('delete', old.fts_id, old.content);
+    INSERT INTO transcripts_fts (rowid, content) VALUES (new.fts_id, new.content);
+  END`,
+];
+
 // Vector index for fast similarity search
 const VECTOR_INDEX_SCHEMA = `
 CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON chunks(libsql_vector_idx(embedding));
 `;
 
+// Compact ANN index over the reduced-dimension shadow column (shortlist mode)
+// Neighbor copies are stored as 8-bit floats (float8) to keep the index small
+const SHORTLIST_INDEX_SCHEMA = `
+CREATE INDEX IF NOT EXISTS idx_chunks_embedding_short
+ON chunks(libsql_vector_idx(embedding_short, 'metric=cosine', 'compress_neighbors=float8'));
+`;
+
 export interface DatabaseStatus {
   /** Is database initialized */
   initialized: boolean;
@@ -152,10 +193,16 @@ export interface DatabaseStatus {
   schemaVersion: number;
   /** Is FTS5 available */
   ftsAvailable: boolean;
+  /** Tokenizer of the transcripts FTS index (undefined if unavailable) */
+  transcriptsFtsTokenizer?: string;
   /** Is vector search available */
   vectorAvailable: boolean;
   /** Vector dimensions (if available) */
   vectorDimensions?: number;
+  /** Is the reduced-dimension shortlist index available */
+  shortlistAvailable: boolean;
+  /** Shortlist dimensions (if available) */
+  shortlistDimensions?: number;
   /** Any initialization errors */
   errors: string[];
 }
@@ -163,6 +210,10 @@ export interface DatabaseStatus {
 export interface InitOptions {
   /** Vector embedding dimensions (default: 3072) */
   vectorDimensions?: number;
+  /** Vector search engine (default: 'ann') */
+  vectorMode?: VectorMode;
+  /** Shortlist column dimensions for vectorMode 'shortlist' (default: 256) */
+  shortlistDimensions?: number;
 }
 
 /**
@@ -184,10 +235,16 @@ export async function initializeDatabase(
   dbPath: string,
   options: InitOptions = {}
 ): Promise<{ db: Client; status: DatabaseStatus }> {
-  const { vectorDimensions = 3072 } = options;
+  const {
+    vectorDimensions = 3072,
+    vectorMode = 'ann',
+    shortlistDimensions = 256,
+  } = options;
   const errors: string[] = [];
   let ftsAvailable = false;
+  let transcriptsFtsTokenizer: string | undefined;
   let vectorAvailable = false;
+  let shortlistAvailable = false;
 
   // Ensure directory exists
   ensureDirectory(dbPath);
@@ -532,6 +589,40 @@ export async function initializeDatabase(
       console.log('[schema] Migration v9 -> v10 complete');
     }
 
+    // Migration: v10 -> v11: Embedding cache keyed by (hash, model)
+    // The old table was never written to, so it is safe to recreate
+    if (currentVersion < 11) {
+      console.log('[schema] Running migration v10 -> v11 (embedding cache)...');
+
+      await db.execute('DROP TABLE IF EXISTS embedding_cache');
+      await db.execute(`
+        CREATE TABLE embedding_cache (
+          hash TEXT NOT NULL,
+          model TEXT NOT NULL,
+          embedding BLOB NOT NULL,
+          created_at INTEGER NOT NULL,
+          PRIMARY KEY (hash, model)
+        )
+      `);
+
+      console.log('[schema] Migration v10 -> v11 complete');
+    }
+
+    // Migration: v11 -> v12: Covering index for Task Engine completion lookups
+    // getOpenTasks filters on type/task_status and a created_at range (the
+    // earliest period start), so those lead; task_id keeps it covering.
+    // Lifetime lookups for 'once' tasks use idx_transcripts_task_id
+    if (currentVersion < 12) {
+      console.log('[schema] Running migration v11 -> v12 (task completion index)...');
+
+      await db.execute(`
+        CREATE INDEX IF NOT EXISTS idx_transcripts_task_period
+        ON transcripts(type, task_status, created_at, task_id)
+      `);
+
+      console.log('[schema] Migration v11 -> v12 complete');
+    }
+
     // Update schema version
     await db.execute({
       sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
@@ -551,23 +642,57 @@ export async function initializeDatabase(
     errors.push(`FTS5 not available: ${message}`);
   }
 
-  // Try to create vector index (libSQL native)
-  try {
-    await db.execute(VECTOR_INDEX_SCHEMA);
-    vectorAvailable = true;
+  // Transcripts FTS index (created + backfilled on first run)
+  if (ftsAvailable) {
+    try {
+      transcriptsFtsTokenizer = await ensureTranscriptsFts(db);
+    } catch (err) {
+      const message = err instanceof Error ? err.message : String(err);
+      errors.push(`Transcripts FTS not available: ${message}`);
+    }
+  }
 
-    // Store vector dimensions in meta
-    await db.execute({
-      sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
-      args: ['vector_dimensions', String(vectorDimensions)],
-    });
-  } catch (err) {
-    const message = err instanceof Error ? err.message : String(err);
-    // Vector index might fail on older libSQL versions
-    if (!message.includes('already exists')) {
-      errors.push(`Vector index not available: ${message}`);
-    } else {
+  // Shortlist mode: reduced-dimension shadow column with its own ANN index
+  // The full-size index is dropped, since exact reranking doesn't need it
+  if (vectorMode === 'shortlist') {
+    try {
+      await ensureShortlistColumn(db, shortlistDimensions);
+      await db.execute(SHORTLIST_INDEX_SCHEMA);
+      await db.execute('DROP INDEX IF EXISTS idx_chunks_embedding');
+      shortlistAvailable = true;
       vectorAvailable = true;
+    } catch (err) {
+      const message = err instanceof Error ? err.message : String(err);
+      errors.push(`Shortlist index not available: ${message}`);
+    }
+  }
+
+  // Try to create vector index (libSQL native)
+  if (!shortlistAvailable) {
+    try {
+      await db.execute(VECTOR_INDEX_SCHEMA);
+      vectorAvailable = true;
+    } catch (err) {
+      const message = err instanceof Error ? err.message : String(err);
+      // Vector index might fail on older libSQL versions
+      if (!message.includes('already exists')) {
+        errors.push(`Vector index not available: ${message}`);
+      } else {
+        vectorAvailable = true;
+      }
+    }
+  }
+
+  // Store vector dimensions in meta
+  if (vectorAvailable) {
+    try {
+      await db.execute({
+        sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+        args: ['vector_dimensions', String(vectorDimensions)],
+      });
+    } catch (err) {
+      const message = err instanceof Error ? err.message : String(err);
+      errors.push(`Vector meta error: ${message}`);
     }
   }
 
@@ -586,14 +711,147 @@ export async function initializeDatabase(
     initialized: true,
     schemaVersion: SCHEMA_VERSION,
     ftsAvailable,
+    transcriptsFtsTokenizer,
     vectorAvailable,
     vectorDimensions: vectorAvailable ? vectorDimensions : undefined,
+    shortlistAvailable,
+    shortlistDimensions: shortlistAvailable ? shortlistDimensions : undefined,
     errors,
   };
 
   return { db, status };
 }
 
+/**
+ * Create the transcripts_fts index and its triggers, and backfill existing rows
+ * Returns the tokenizer in use
+ */
+async function ensureTranscriptsFts(db: Client): Promise<string> {
+  // Stable key for the index (see TRANSCRIPTS_FTS_TRIGGERS)
+  const columns = await db.execute('PRAGMA table_info(transcripts)');
+  if (!columns.rows.some((row) => row.name === 'fts_id')) {
+    await db.execute('ALTER TABLE transcripts ADD COLUMN fts_id INTEGER');
+  }
+  await db.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_transcripts_fts_id ON transcripts(fts_id)');
+
+  const existing = await db.execute(
+    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'transcripts_fts'"
+  );
+
+  // An index from before external content (keyed on rowid) is rebuilt
+  if (existing.rows.length > 0 && !String(existing.rows[0].sql).includes("content='transcripts'")) {
+    await db.batch([
+      'DROP TRIGGER IF EXISTS transcripts_fts_ai',
+      'DROP TRIGGER IF EXISTS transcripts_fts_ad',
+      'DROP TRIGGER IF EXISTS transcripts_fts_au',
+      'DROP TABLE transcripts_fts',
+      'UPDATE transcripts SET fts_id = NULL',
+    ], 'write');
+    console.log('[schema] Migration: Rebuilding transcripts_fts as external content index');
+  }
+
+  if (existing.rows.length === 0 || !String(existing.rows[0].sql).includes("content='transcripts'")) {
+    // Prefer trigram, fall back to unicode61 on older SQLite builds
+    let created: string | null = null;
+    for (const tokenizer of TRANSCRIPTS_FTS_TOKENIZERS) {
+      try {
+        await db.batch([
+          `CREATE VIRTUAL TABLE transcripts_fts USING fts5(
+            content, content='transcripts', content_rowid='fts_id', tokenize = '${tokenizer}'
+          )`,
+          {
+            sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+            args: ['transcripts_fts_tokenizer', tokenizer],
+          },
+        ], 'write');
+        created = tokenizer;
+        break;
+      } catch {
+        // Try next tokenizer
+      }
+    }
+    if (!created) {
+      throw new Error('no supported FTS5 tokenizer');
+    }
+
+    console.log(`[schema] Migration: Created transcripts_fts (${created})`);
+  }
+
+  for (const trigger of TRANSCRIPTS_FTS_TRIGGERS) {
+    await db.execute(trigger);
+  }
+
+  // Backfill rows stored before the index existed, in batches
+  // (resumable: rows without fts_id are exactly the ones not yet indexed)
+  let backfilled = 0;
+  for (;;) {
+    const pending = await db.execute({
+      sql: 'SELECT rowid FROM transcripts WHERE fts_id IS NULL ORDER BY rowid LIMIT ?',
+      args: [TRANSCRIPTS_FTS_BACKFILL_BATCH],
+    });
+    if (pending.rows.length === 0) break;
+
+    const rowids = pending.rows.map((row) => Number(row.rowid));
+    const placeholders = rowids.map(() => '?').join(', ');
+    await db.batch([
+      { sql: `UPDATE transcripts SET fts_id = rowid WHERE rowid IN (${placeholders})`, args: rowids },
+      {
+        sql: `INSERT INTO transcripts_fts (rowid, content)
+              SELECT fts_id, content FROM transcripts WHERE rowid IN (${placeholders})`,
+        args: rowids,
+      },
+    ], 'write');
+    backfilled += rowids.length;
+  }
+  if (backfilled > 0) {
+    console.log(`[schema] Migration: Backfilled transcripts_fts (${backfilled} rows)`);
+  }
+
+  const tokenizer = await db.execute({
+    sql: 'SELECT value FROM meta WHERE key = ?',
+    args: ['transcripts_fts_tokenizer'],
+  });
+  return tokenizer.rows.length > 0
+    ? String(tokenizer.rows[0].value)
+    : TRANSCRIPTS_FTS_TOKENIZERS[0];
+}
+
+/**
+ * Add the embedding_short shadow column (idempotent)
+ * Throws if it already exists with different dimensions
+ */
+async function ensureShortlistColumn(db: Client, dimensions: number): Promise<void> {
+  const existing = await db.execute({
+    sql: 'SELECT value FROM meta WHERE key = ?',
+    args: ['shortlist_dimensions'],
+  });
+
+  if (existing.rows.length > 0) {
+    const current = parseInt(String(existing.rows[0].value), 10);
+    if (current !== dimensions) {
+      throw new Error(
+        `embedding_short has ${current} dimensions, configured ${dimensions}`
+      );
+    }
+    return;
+  }
+
+  try {
+    await db.execute(`ALTER TABLE chunks ADD COLUMN embedding_short F32_BLOB(${dimensions})`);
+    console.log(`[schema] Added embedding_short column (${dimensions} dims)`);
+  } catch (err) {
+    const message = err instanceof Error ? err.message : String(err);
+    if (!message.includes('duplicate column')) {
+      throw err;
+    }
+  }
+
+  await db.execute({
+    sql: 'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+    args: ['shortlist_dimensions', String(dimensions)],
+  });
+}
+
 /**
  * Get current database status
  */
@@ -602,6 +860,8 @@ export async function getDatabaseStatus(db: Client): Promise<DatabaseStatus> {
   let ftsAvailable = false;
   let vectorAvailable = false;
   let vectorDimensions: number | undefined;
+  let shortlistAvailable = false;
+  let shortlistDimensions: number | undefined;
 
   // Check schema version
   let schemaVersion = 0;
@@ -626,6 +886,21 @@ export async function getDatabaseStatus(db: Client): Promise<DatabaseStatus> {
     ftsAvailable = false;
   }
 
+  // Check transcripts FTS
+  let transcriptsFtsTokenizer: string | undefined;
+  try {
+    await db.execute('SELECT * FROM transcripts_fts LIMIT 0');
+    const tokenizerResult = await db.execute({
+      sql: 'SELECT value FROM meta WHERE key = ?',
+      args: ['transcripts_fts_tokenizer'],
+    });
+    transcriptsFtsTokenizer = tokenizerResult.rows.length > 0
+      ? String(tokenizerResult.rows[0].value)
+      : undefined;
+  } catch {
+    transcriptsFtsTokenizer = undefined;
+  }
+
   // Check vector support by testing the column
   try {
     // Try a simple vector query to see if it works
@@ -644,12 +919,33 @@ export async function getDatabaseStatus(db: Client): Promise<DatabaseStatus> {
     vectorAvailable = false;
   }
 
+  // Check shortlist index
+  try {
+    const indexResult = await db.execute(
+      "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_chunks_embedding_short'"
+    );
+    const dimsResult = await db.execute({
+      sql: 'SELECT value FROM meta WHERE key = ?',
+      args: ['shortlist_dimensions'],
+    });
+
+    if (indexResult.rows.length > 0 && dimsResult.rows.length > 0) {
+      shortlistAvailable = true;
+      shortlistDimensions = parseInt(String(dimsResult.rows[0].value), 10);
+    }
+  } catch {
+    shortlistAvailable = false;
+  }
+
   return {
     initialized: schemaVersion > 0,
     schemaVersion,
     ftsAvailable,
+    transcriptsFtsTokenizer,
     vectorAvailable,
     vectorDimensions,
+    shortlistAvailable,
+    shortlistDimensions,
     errors,
   };
 }
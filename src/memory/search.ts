@@ -2,7 +2,8 @@
  * KITT Memory System - Hybrid Search
  *
  * Combines vector search (semantic) with keyword search (BM25):
- * - Vector search via libSQL native vector support (cosine distance)
+ * - Vector search via libSQL native vector support (cosine distance):
+ *   exact scan, ANN (vector_top_k), or reduced-dimension shortlist + exact rerank
  * - Keyword search via FTS5 (BM25 ranking)
  * - Merge with weighted scoring: 0.7 × vector + 0.3 × text
  */
@@ -11,10 +12,22 @@ import type { Client } from '@libsql/client';
 import type {
   SearchResult,
   ChunkSource,
+  VectorMode,
   VectorSearchRow,
   KeywordSearchRow,
 } from './types.js';
-import { distanceToScore, bm25RankToScore, createSnippet } from './utils.js';
+import {
+  distanceToScore,
+  bm25RankToScore,
+  createSnippet,
+  embeddingToBuffer,
+  shortenEmbedding,
+} from './utils.js';
+import { timeSpan } from '../metrics/index.js';
+
+// ANN candidates fetched per wanted result when rows get filtered
+// (source filter) or reranked (shortlist)
+const ANN_OVERFETCH = 4;
 
 export interface HybridSearchParams {
   db: Client;
@@ -27,6 +40,10 @@ export interface HybridSearchParams {
   sources?: ChunkSource[];
   vectorAvailable: boolean;
   ftsAvailable: boolean;
+  /** Vector search engine (default: 'exact') */
+  vectorMode?: VectorMode;
+  /** Shortlist column dimensions (required for vectorMode 'shortlist') */
+  shortlistDimensions?: number;
 }
 
 interface MergedResult {
@@ -57,6 +74,8 @@ export async function hybridSearch(
     sources,
     vectorAvailable,
     ftsAvailable,
+    vectorMode = 'exact',
+    shortlistDimensions,
   } = params;
 
   // Over-fetch candidates for better merging
@@ -65,10 +84,12 @@ export async function hybridSearch(
   // Get results from both search methods (run in parallel)
   const [vectorResults, keywordResults] = await Promise.all([
     vectorAvailable
-      ? searchVector(db, queryEmbedding, candidateLimit, sources)
+      ? timeSpan('search.vector', () =>
+          searchVector(db, queryEmbedding, candidateLimit, sources, vectorMode, shortlistDimensions)
+        )
       : Promise.resolve([]),
     ftsAvailable
-      ? searchKeyword(db, query, candidateLimit, sources)
+      ? timeSpan('search.keyword', () => searchKeyword(db, query, candidateLimit, sources))
       : Promise.resolve([]),
   ]);
 
@@ -105,47 +126,134 @@ export async function hybridSearch(
 
 /**
  * Vector search using libSQL native vector support
+ * ANN modes fall back to an exact scan if the index query fails
  */
 async function searchVector(
   db: Client,
   embedding: number[],
   limit: number,
-  sources?: ChunkSource[]
+  sources: ChunkSource[] | undefined,
+  mode: VectorMode,
+  shortlistDimensions?: number
 ): Promise<Array<MergedResult>> {
+  if (embedding.length === 0) {
+    return [];
+  }
+
+  let rows: VectorSearchRow[];
   try {
-    // Build source filter
-    const sourceFilter = buildSourceFilter(sources);
+    rows = mode === 'exact'
+      ? await queryVectorExact(db, embedding, limit, sources)
+      : await queryVectorAnn(
+          db,
+          embedding,
+          limit,
+          sources,
+          mode === 'shortlist' ? shortlistDimensions : undefined
+        );
+  } catch (err) {
+    if (mode === 'exact') {
+      console.error('[search] Vector search failed:', err);
+      return [];
+    }
 
-    // libSQL native vector search using vector_distance_cos
-    // Note: vector32() converts JSON array to F32_BLOB
-    const sql = `
-      SELECT id, content, source, path, start_line, end_line,
-             vector_distance_cos(embedding, vector32(?)) AS distance
-      FROM chunks
-      WHERE embedding IS NOT NULL ${sourceFilter.sql}
-      ORDER BY distance ASC
-      LIMIT ?
-    `;
+    console.warn(`[search] ANN search (${mode}) failed, using exact scan:`, err);
+    try {
+      rows = await queryVectorExact(db, embedding, limit, sources);
+    } catch (fallbackErr) {
+      console.error('[search] Vector search failed:', fallbackErr);
+      return [];
+    }
+  }
 
-    const result = await db.execute({
-      sql,
-      args: [JSON.stringify(embedding), ...sourceFilter.params, limit],
-    });
+  return rows.map((row) => ({
+    id: String(row.id),
+    content: String(row.content),
+    source: String(row.source) as ChunkSource,
+    path: row.path ? String(row.path) : null,
+    startLine: row.start_line ? Number(row.start_line) : null,
+    endLine: row.end_line ? Number(row.end_line) : null,
+    vectorScore: distanceToScore(Number(row.distance)),
+    textScore: 0,
+  }));
+}
 
-    return result.rows.map((row) => ({
-      id: String(row.id),
-      content: String(row.content),
-      source: String(row.source) as ChunkSource,
-      path: row.path ? String(row.path) : null,
-      startLine: row.start_line ? Number(row.start_line) : null,
-      endLine: row.end_line ? Number(row.end_line) : null,
-      vectorScore: distanceToScore(Number(row.distance)),
-      textScore: 0,
-    }));
-  } catch (err) {
-    console.error('[search] Vector search failed:', err);
-    return [];
-  }
+/**
+ * Exact search: cosine distance against every embedded chunk
+ */
+async function queryVectorExact(
+  db: Client,
+  embedding: number[],
+  limit: number,
+  sources?: ChunkSource[]
+): Promise<VectorSearchRow[]> {
+  const sourceFilter = buildSourceFilter(sources);
+
+  // Query vector is bound as a Float32 blob (no JSON parsing per query)
+  const sql = `
+    SELECT id, content, source, path, start_line, end_line,
+           vector_distance_cos(embedding, vector32(?)) AS distance
+    FROM chunks
+    WHERE embedding IS NOT NULL ${sourceFilter.sql}
+    ORDER BY distance ASC
+    LIMIT ?
+  `;
+
+  const result = await db.execute({
+    sql,
+    args: [embeddingToBuffer(embedding), ...sourceFilter.params, limit],
+  });
+
+  return result.rows as unknown as VectorSearchRow[];
+}
+
+/**
+ * ANN search through a libsql_vector_idx with vector_top_k
+ * Candidates are reranked by exact distance on the full-precision embedding
+ *
+ * @param shortlistDimensions - Probe the reduced-dimension shortlist index
+ *   instead of the full index
+ */
+async function queryVectorAnn(
+  db: Client,
+  embedding: number[],
+  limit: number,
+  sources?: ChunkSource[],
+  shortlistDimensions?: number
+): Promise<VectorSearchRow[]> {
+  const sourceFilter = buildSourceFilter(sources, 'c');
+  const useShortlist = shortlistDimensions !== undefined;
+
+  const indexName = useShortlist ? 'idx_chunks_embedding_short' : 'idx_chunks_embedding';
+  const probe = useShortlist ? shortenEmbedding(embedding, shortlistDimensions) : embedding;
+
+  // Over-fetch when candidates get filtered or reranked
+  const k = useShortlist || sourceFilter.params.length > 0
+    ? limit * ANN_OVERFETCH
+    : limit;
+
+  const sql = `
+    SELECT c.id, c.content, c.source, c.path, c.start_line, c.end_line,
+           vector_distance_cos(c.embedding, vector32(?)) AS distance
+    FROM vector_top_k('${indexName}', vector32(?), ?) AS v
+    JOIN chunks c ON c.rowid = v.id
+    WHERE c.embedding IS NOT NULL ${sourceFilter.sql}
+    ORDER BY distance ASC
+    LIMIT ?
+  `;
+
+  const result = await db.execute({
+    sql,
+    args: [
+      embeddingToBuffer(embedding),
+      embeddingToBuffer(probe),
+      k,
+      ...sourceFilter.params,
+      limit,
+    ],
+  });
+
+  return result.rows as unknown as VectorSearchRow[];
 }
 
 /**
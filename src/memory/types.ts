@@ -15,6 +15,12 @@ export interface MemoryConfig {
   embeddingModel: string;
   /** Embedding vector dimensions */
   embeddingDimensions: number;
+  /** Max embedding requests in flight while indexing */
+  embeddingConcurrency: number;
+  /** Vector search engine (see VectorMode) */
+  vectorMode: VectorMode;
+  /** Dimensions of the shortlist column (vectorMode 'shortlist') */
+  shortlistDimensions: number;
   /** Chunk size in tokens */
   chunkTokens: number;
   /** Overlap between chunks in tokens */
@@ -33,6 +39,15 @@ export type TranscriptType = 'message' | 'thought' | 'task' | 'reflection';
 export type TranscriptTaskStatus = 'reminder' | 'completed' | 'skipped' | 'deferred';
 export type ChunkSource = 'transcript' | 'memory';
 
+/**
+ * Vector search engine:
+ * - exact: full scan with vector_distance_cos
+ * - ann: vector_top_k over idx_chunks_embedding, exact distance on the hits
+ * - shortlist: vector_top_k over a reduced-dimension shadow column,
+ *   reranked exactly against the full-precision embedding
+ */
+export type VectorMode = 'exact' | 'ann' | 'shortlist';
+
 // === Store Message ===
 
 export interface StoreMessageParams {
@@ -178,6 +193,39 @@ export interface EmbeddingResult {
   tokenCount?: number;
 }
 
+// === Indexing ===
+
+export interface IndexStats {
+  /** Transcripts processed */
+  transcripts: number;
+  /** Chunks written */
+  chunks: number;
+  /** Chunks embedded via the API */
+  embedded: number;
+  /** Chunks served from the embedding cache */
+  cached: number;
+  /** Chunks stored without an embedding (will be picked up by backfill) */
+  missing: number;
+  /** Transcripts left unwritten because embedding failed (retry later) */
+  deferred: string[];
+}
+
+export interface IndexCursor {
+  /** created_at of the last processed transcript */
+  createdAt: number;
+  /** id of the last processed transcript (tie-breaker) */
+  id: string;
+}
+
+export interface FindTranscriptsOptions {
+  /** Reindex every transcript, not only missing ones */
+  all?: boolean;
+  /** Only return transcripts after this cursor */
+  after?: IndexCursor | null;
+  /** Max transcripts to return */
+  limit: number;
+}
+
 // === Database Row Types (for SQLite queries) ===
 
 export interface TranscriptRow {
@@ -240,8 +288,17 @@ export interface TranscriptSearchOptions {
   roles?: Role[];
   /** Filter by channels */
   channels?: Channel[];
-  /** Maximum results (default: 20) */
+  /** Maximum results per page (default: 20) */
   limit?: number;
+  /** Opaque cursor from a previous page's nextCursor */
+  cursor?: string;
+}
+
+export interface TranscriptSearchPage {
+  /** Results for this page */
+  results: TranscriptSearchResult[];
+  /** Cursor for the next page (null if this is the last page) */
+  nextCursor: string | null;
 }
 
 export interface TranscriptSearchResult {
@@ -98,6 +98,40 @@ export function bufferToEmbedding(buffer: Buffer): number[] {
   return Array.from(float32);
 }
 
+/**
+ * Reduce an embedding to its first `dimensions` values and re-normalize
+ * text-embedding-3 models are trained so that prefixes stay meaningful
+ */
+export function shortenEmbedding(
+  embedding: number[],
+  dimensions: number
+): number[] {
+  const prefix = embedding.slice(0, dimensions);
+  const norm = Math.sqrt(prefix.reduce((sum, v) => sum + v * v, 0));
+  return norm > 0 ? prefix.map((v) => v / norm) : prefix;
+}
+
+/**
+ * Convert a stored embedding value (BLOB or legacy JSON text) to an array
+ * Returns null for missing or unrecognized values
+ */
+export function blobToEmbedding(value: unknown): number[] | null {
+  if (value instanceof ArrayBuffer) {
+    return bufferToEmbedding(Buffer.from(value));
+  }
+  if (value instanceof Uint8Array) {
+    return bufferToEmbedding(Buffer.from(value));
+  }
+  if (typeof value === 'string' && value.startsWith('[')) {
+    try {
+      return JSON.parse(value) as number[];
+    } catch {
+      return null;
+    }
+  }
+  return null;
+}
+
 /**
  * Convert BM25 rank to normalized score (0-1)
  * FTS5 rank is typically negative, lower is better
@@ -117,6 +151,46 @@ export function distanceToScore(distance: number): number {
   return Math.max(0, 1 - distance);
 }
 
+/**
+ * Keyset position in a transcript search
+ * rank/snapshot are only set for BM25-ranked (FTS) searches
+ */
+export interface TranscriptCursor {
+  createdAt: number;
+  rowid: number;
+  rank?: number;
+  snapshot?: number;
+}
+
+/**
+ * Encode a transcript keyset position as an opaque cursor
+ */
+export function encodeTranscriptCursor(position: TranscriptCursor): string {
+  const values = position.rank !== undefined && position.snapshot !== undefined
+    ? [position.createdAt, position.rowid, position.rank, position.snapshot]
+    : [position.createdAt, position.rowid];
+  return Buffer.from(JSON.stringify(values)).toString('base64url');
+}
+
+/**
+ * Decode a transcript cursor (null if malformed)
+ */
+export function decodeTranscriptCursor(cursor: string): TranscriptCursor | null {
+  try {
+    const values = JSON.parse(
+      Buffer.from(cursor, 'base64url').toString('utf-8')
+    ) as unknown;
+    if (!Array.isArray(values) || (values.length !== 2 && values.length !== 4)) return null;
+    if (!values.every((value) => typeof value === 'number' && Number.isFinite(value))) return null;
+    const [createdAt, rowid, rank, snapshot] = values as number[];
+    return values.length === 4
+      ? { createdAt, rowid, rank, snapshot }
+      : { createdAt, rowid };
+  } catch {
+    return null;
+  }
+}
+
 /**
  * Sleep for specified milliseconds
  */
@@ -124,6 +198,30 @@ export function sleep(ms: number): Promise<void> {
   return new Promise(resolve => setTimeout(resolve, ms));
 }
 
+/**
+ * Map over items with at most `limit` calls in flight
+ * Results keep the input order
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const workers = Math.max(1, Math.min(limit, items.length));
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
+
 /**
  * Retry a function with exponential backoff
  */
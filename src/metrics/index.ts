@@ -0,0 +1,225 @@
+/**
+ * KITT Metrics
+ *
+ * In-process timing spans for the hot paths (agent turns, embeddings,
+ * search, DB queries, think loop phases). Each span keeps its totals plus
+ * a window of recent samples for percentiles. Exposed on the portal at
+ * /api/metrics and reused by the benchmark suite for its reports.
+ */
+
+import { monitorEventLoopDelay, type IntervalHistogram } from 'node:perf_hooks';
+import type { Client } from '@libsql/client';
+
+// Recent samples kept per span (percentiles are over this window)
+const SAMPLE_WINDOW = 1024;
+
+// Event loop sampling interval; samples include it, so it's subtracted
+const EVENT_LOOP_RESOLUTION_MS = 20;
+
+export interface LatencySummary {
+  p50: number;
+  p95: number;
+  p99: number;
+  mean: number;
+  max: number;
+}
+
+export interface SpanSummary extends LatencySummary {
+  count: number;
+  errors: number;
+  totalMs: number;
+  lastAt: number;
+}
+
+export interface MetricsSnapshot {
+  startedAt: number;
+  uptimeMs: number;
+  spans: Record<string, SpanSummary>;
+  counters: Record<string, number>;
+  eventLoop?: { p50: number; p99: number; max: number };
+  memory: { rssMb: number; heapUsedMb: number };
+}
+
+class Span {
+  count = 0;
+  errors = 0;
+  totalMs = 0;
+  maxMs = 0;
+  lastAt = 0;
+  private samples = new Float64Array(SAMPLE_WINDOW);
+
+  record(durationMs: number, failed: boolean): void {
+    this.samples[this.count % SAMPLE_WINDOW] = durationMs;
+    this.count++;
+    if (failed) this.errors++;
+    this.totalMs += durationMs;
+    this.maxMs = Math.max(this.maxMs, durationMs);
+    this.lastAt = Date.now();
+  }
+
+  summary(): SpanSummary {
+    const window = Array.from(this.samples.subarray(0, Math.min(this.count, SAMPLE_WINDOW)));
+    return {
+      ...summarizeLatencies(window),
+      // Mean and max over the whole lifetime, percentiles over the window
+      mean: round(this.totalMs / Math.max(1, this.count)),
+      max: round(this.maxMs),
+      count: this.count,
+      errors: this.errors,
+      totalMs: round(this.totalMs),
+      lastAt: this.lastAt,
+    };
+  }
+}
+
+const startedAt = Date.now();
+const spans = new Map<string, Span>();
+const counters = new Map<string, number>();
+let eventLoop: IntervalHistogram | null = null;
+
+/**
+ * Record a finished span
+ */
+export function recordSpan(name: string, durationMs: number, failed = false): void {
+  let span = spans.get(name);
+  if (!span) {
+    span = new Span();
+    spans.set(name, span);
+  }
+  span.record(durationMs, failed);
+}
+
+/**
+ * Start a span; call the returned function when done
+ * Returns the duration in ms
+ */
+export function startSpan(name: string): (failed?: boolean) => number {
+  const start = performance.now();
+  return (failed = false) => {
+    const durationMs = performance.now() - start;
+    recordSpan(name, durationMs, failed);
+    return durationMs;
+  };
+}
+
+/**
+ * Time an async call as a span (rejections are counted as errors)
+ */
+export async function timeSpan<T>(name: string, fn: () => Promise<T>): Promise<T> {
+  const end = startSpan(name);
+  try {
+    const result = await fn();
+    end();
+    return result;
+  } catch (err) {
+    end(true);
+    throw err;
+  }
+}
+
+/**
+ * Count an event (e.g. a skipped think loop tick)
+ */
+export function countEvent(name: string, by = 1): void {
+  counters.set(name, (counters.get(name) ?? 0) + by);
+}
+
+/**
+ * Record the duration of every query on a libSQL client
+ * Patches execute/batch on the instance and returns the same client
+ */
+export function instrumentClient(client: Client): Client {
+  const execute = client.execute.bind(client) as (...args: unknown[]) => ReturnType<Client['execute']>;
+  const batch = client.batch.bind(client) as (...args: unknown[]) => ReturnType<Client['batch']>;
+
+  client.execute = ((...args: unknown[]) =>
+    timeSpan('db.execute', () => execute(...args))) as Client['execute'];
+  client.batch = ((...args: unknown[]) =>
+    timeSpan('db.batch', () => batch(...args))) as Client['batch'];
+
+  return client;
+}
+
+/**
+ * Sample event loop delay (stalls show up as high p99/max)
+ */
+export function startEventLoopMonitor(): void {
+  if (eventLoop) return;
+  eventLoop = monitorEventLoopDelay({ resolution: EVENT_LOOP_RESOLUTION_MS });
+  eventLoop.enable();
+}
+
+/**
+ * Snapshot of all spans and counters
+ */
+export function getMetrics(): MetricsSnapshot {
+  const spanSummaries: Record<string, SpanSummary> = {};
+  for (const name of Array.from(spans.keys()).sort()) {
+    spanSummaries[name] = spans.get(name)!.summary();
+  }
+
+  const memory = process.memoryUsage();
+
+  return {
+    startedAt,
+    uptimeMs: Date.now() - startedAt,
+    spans: spanSummaries,
+    counters: Object.fromEntries(counters),
+    eventLoop: eventLoop && eventLoop.count > 0
+      ? {
+          p50: loopDelay(eventLoop.percentile(50)),
+          p99: loopDelay(eventLoop.percentile(99)),
+          max: loopDelay(eventLoop.max),
+        }
+      : undefined,
+    memory: {
+      rssMb: round(memory.rss / 1024 / 1024),
+      heapUsedMb: round(memory.heapUsed / 1024 / 1024),
+    },
+  };
+}
+
+/**
+ * Forget all recorded spans and counters
+ */
+export function resetMetrics(): void {
+  spans.clear();
+  counters.clear();
+  eventLoop?.reset();
+}
+
+/**
+ * Percentiles, mean and max of a list of durations (ms)
+ */
+export function summarizeLatencies(durations: number[]): LatencySummary {
+  if (durations.length === 0) {
+    return { p50: 0, p95: 0, p99: 0, mean: 0, max: 0 };
+  }
+  const sorted = [...durations].sort((a, b) => a - b);
+  const total = sorted.reduce((sum, d) => sum + d, 0);
+
+  return {
+    p50: round(percentile(sorted, 50)),
+    p95: round(percentile(sorted, 95)),
+    p99: round(percentile(sorted, 99)),
+    mean: round(total / sorted.length),
+    max: round(sorted[sorted.length - 1]),
+  };
+}
+
+/**
+ * Nearest-rank percentile of an ascending list
+ */
+export function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const rank = Math.ceil((p / 100) * sorted.length);
+  return sorted[Math.min(sorted.length, Math.max(1, rank)) - 1];
+}
+
+function loopDelay(nanoseconds: number): number {
+  return round(Math.max(0, nanoseconds / 1e6 - EVENT_LOOP_RESOLUTION_MS));
+}
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
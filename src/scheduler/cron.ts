@@ -77,6 +77,9 @@ export function parseCron(expression: string): CronParts {
   };
 }
 
+const MINUTE_MS = 60 * 1000;
+const MAX_SEARCH_MS = 366 * 24 * 60 * MINUTE_MS; // 1 year
+
 /**
  * Get the next occurrence of a cron schedule after a given date
  * @param expression Cron expression
@@ -89,6 +92,11 @@ export function getNextRun(
   timezone = 'Europe/Amsterdam'
 ): Date {
   const cron = parseCron(expression);
+  const minutes = [...new Set(cron.minute)].sort((a, b) => a - b);
+  const hours = [...new Set(cron.hour)].sort((a, b) => a - b);
+  const daysOfMonth = new Set(cron.dayOfMonth);
+  const months = new Set(cron.month);
+  const daysOfWeek = new Set(cron.dayOfWeek);
 
   // Start from the next minute
   const candidate = new Date(after);
@@ -96,64 +104,97 @@ export function getNextRun(
   candidate.setMilliseconds(0);
   candidate.setMinutes(candidate.getMinutes() + 1);
 
-  // Search for the next valid time (max 1 year)
-  const maxIterations = 366 * 24 * 60; // 1 year in minutes
-
-  for (let i = 0; i < maxIterations; i++) {
-    const inTz = toTimezone(candidate, timezone);
-
-    const minute = inTz.getMinutes();
-    const hour = inTz.getHours();
-    const dayOfMonth = inTz.getDate();
-    const month = inTz.getMonth() + 1; // JS months are 0-indexed
-    const dayOfWeek = inTz.getDay();
-
-    if (
-      cron.minute.includes(minute) &&
-      cron.hour.includes(hour) &&
-      cron.dayOfMonth.includes(dayOfMonth) &&
-      cron.month.includes(month) &&
-      cron.dayOfWeek.includes(dayOfWeek)
-    ) {
-      return candidate;
+  // Search for the next valid time (max 1 year), skipping ahead to the next
+  // minute/hour/day that can match instead of checking every minute.
+  // Jumps over several hours stop one hour early, so a DST change in between
+  // can never carry us past a match.
+  let time = candidate.getTime();
+  const end = time + MAX_SEARCH_MS;
+
+  while (time < end) {
+    const inTz = wallClock(time, timezone);
+
+    if (!months.has(inTz.month)) {
+      // Rest of the month can't match: go to the first day of the next month
+      const daysInMonth = new Date(Date.UTC(inTz.year, inTz.month, 0)).getUTCDate();
+      time += Math.max(
+        60 - inTz.minute,
+        ((daysInMonth - inTz.day) * 24 + 23 - inTz.hour) * 60 - inTz.minute
+      ) * MINUTE_MS;
+      continue;
     }
 
-    // Move to next minute
-    candidate.setMinutes(candidate.getMinutes() + 1);
+    const dayMatches = daysOfMonth.has(inTz.day) && daysOfWeek.has(inTz.dayOfWeek);
+    const nextHour = dayMatches ? hours.find((h) => h >= inTz.hour) : undefined;
+
+    if (nextHour === undefined) {
+      // Rest of the day can't match: go to the next day
+      time += Math.max(60 - inTz.minute, (23 - inTz.hour) * 60 - inTz.minute) * MINUTE_MS;
+      continue;
+    }
+
+    if (nextHour > inTz.hour) {
+      time += Math.max(60 - inTz.minute, (nextHour - 1 - inTz.hour) * 60 - inTz.minute) * MINUTE_MS;
+      continue;
+    }
+
+    const nextMinute = minutes.find((m) => m >= inTz.minute);
+    if (nextMinute === inTz.minute) {
+      return new Date(time);
+    }
+
+    // No matching minute left in this hour: go to the next hour
+    time += ((nextMinute ?? 60) - inTz.minute) * MINUTE_MS;
   }
 
   throw new Error(`Could not find next run for: ${expression}`);
 }
 
+interface WallClock {
+  year: number;
+  month: number; // 1-12
+  day: number;
+  hour: number;
+  minute: number;
+  dayOfWeek: number; // 0 = Sunday
+}
+
+// Creating a DateTimeFormat is expensive, so keep one per timezone
+const formatters = new Map<string, Intl.DateTimeFormat>();
+
 /**
- * Get time in a specific timezone
- * Note: This is a simplified version - for production, use a proper timezone library
+ * Get the wall clock time in a specific timezone
  */
-function toTimezone(date: Date, timezone: string): Date {
-  // Use Intl to get the time in the target timezone
-  const formatter = new Intl.DateTimeFormat('en-US', {
-    timeZone: timezone,
-    year: 'numeric',
-    month: '2-digit',
-    day: '2-digit',
-    hour: '2-digit',
-    minute: '2-digit',
-    second: '2-digit',
-    hour12: false,
-  });
-
-  const parts = formatter.formatToParts(date);
-  const get = (type: string) =>
-    parseInt(parts.find((p) => p.type === type)?.value ?? '0', 10);
-
-  return new Date(
-    get('year'),
-    get('month') - 1,
-    get('day'),
-    get('hour'),
-    get('minute'),
-    get('second')
-  );
+function wallClock(time: number, timezone: string): WallClock {
+  let formatter = formatters.get(timezone);
+  if (!formatter) {
+    formatter = new Intl.DateTimeFormat('en-US', {
+      timeZone: timezone,
+      year: 'numeric',
+      month: '2-digit',
+      day: '2-digit',
+      hour: '2-digit',
+      minute: '2-digit',
+      hourCycle: 'h23',
+    });
+    formatters.set(timezone, formatter);
+  }
+
+  const fields: Record<string, number> = {};
+  for (const part of formatter.formatToParts(time)) {
+    if (part.type !== 'literal') {
+      fields[part.type] = parseInt(part.value, 10);
+    }
+  }
+
+  return {
+    year: fields.year,
+    month: fields.month,
+    day: fields.day,
+    hour: fields.hour,
+    minute: fields.minute,
+    dayOfWeek: new Date(Date.UTC(fields.year, fields.month - 1, fields.day)).getUTCDay(),
+  };
 }
 
 /**
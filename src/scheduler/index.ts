@@ -11,12 +11,14 @@ import path from 'node:path';
 import type { ScheduleRegistry, ScheduledTask, TaskExecutionResult } from './types.js';
 import { getNextRun, describeCron } from './cron.js';
 import {
-  buildThinkLoopContext,
+  ThinkLoopContextBuilder,
   buildThinkPrompt,
+  fingerprintThinkLoopContext,
   parseThinkResponse,
 } from './think-loop.js';
 import { logTaskExecution } from './task-engine.js';
 import { getSleepUntil, formatWakeTime } from './sleep-mode.js';
+import { countEvent, timeSpan } from '../metrics/index.js';
 
 const REGISTRY_PATH = process.env.KITT_SCHEDULER_REGISTRY || './profile/schedules/registry.json';
 const DEFAULT_TIMEZONE = 'Europe/Amsterdam';
@@ -28,6 +30,8 @@ export class SchedulerService {
   private registry: ScheduleRegistry | null = null;
   private timers: Map<string, NodeJS.Timeout> = new Map();
   private initialized = false;
+  private thinkContext: ThinkLoopContextBuilder | null = null;
+  private lastThinkFingerprint: string | null = null;
 
   /**
    * Initialize the scheduler
@@ -55,6 +59,9 @@ export class SchedulerService {
       console.log('[scheduler] Cancelled task', { taskId: id });
     }
     this.timers.clear();
+    this.thinkContext?.close();
+    this.thinkContext = null;
+    this.lastThinkFingerprint = null;
     this.initialized = false;
   }
 
@@ -253,8 +260,20 @@ export class SchedulerService {
 
     console.log('[think-loop] 🧠 Running think loop');
 
-    // Build context from today's transcripts
-    const context = await buildThinkLoopContext(db);
+    // Build context from today's transcripts (incremental between ticks)
+    if (!this.thinkContext) {
+      this.thinkContext = new ThinkLoopContextBuilder();
+    }
+    const builder = this.thinkContext;
+    const context = await timeSpan('think.build', () => builder.build(db));
+
+    // Nothing new since the previous tick: the agent would see the same input
+    const fingerprint = fingerprintThinkLoopContext(context);
+    if (fingerprint === this.lastThinkFingerprint) {
+      console.log('[think-loop] 💤 No changes since last tick, skipping agent');
+      countEvent('think.skipped');
+      return;
+    }
 
     // Log if no conversations today (but continue - scheduled skills may need to run)
     if (context.messageCount === 0) {
@@ -277,6 +296,7 @@ export class SchedulerService {
       openTasks: context.tasks.length,
       skills: context.skills.length,
       skillsWithData: context.skills.filter(s => s.fetchResult).length,
+      slowestFetchMs: Math.max(0, ...context.skills.map(s => s.fetchMs ?? 0)),
       lastUserMessage: context.lastUserMessage?.minutesAgo,
       model,
     });
@@ -285,7 +305,9 @@ export class SchedulerService {
     // skipMemorySearch: true because think prompt already contains all context
     // and the prompt is too large to embed (would exceed 8192 token limit)
     const { runAgent } = await import('../bridge/agent.js');
-    const response = await runAgent(thinkPrompt, { model, skipMemorySearch: true });
+    const response = await timeSpan('think.agent', () =>
+      runAgent(thinkPrompt, { model, skipMemorySearch: true })
+    );
 
     if (!response.result) {
       console.log('[think-loop] ⚠️ Agent returned no response');
@@ -307,6 +329,7 @@ export class SchedulerService {
 
     if (!thought.shouldAct) {
       console.log('[think-loop] ✓ Decision: No action needed');
+      this.lastThinkFingerprint = fingerprint;
       return;
     }
 
@@ -430,6 +453,9 @@ export class SchedulerService {
       console.log('[think-loop] 🧠 Thought stored:', thoughtContent.slice(0, 60));
     }
 
+    // Only remember the input once it was handled, so a failed action is retried
+    this.lastThinkFingerprint = fingerprint;
+
     // Update lastRun for logging purposes
     if (this.registry?.thinkLoop) {
       this.registry.thinkLoop.lastRun = new Date().toISOString();
@@ -51,6 +51,41 @@ export interface OpenTasksResult {
   skippedReasons: Map<number, string>; // task_id -> reason
 }
 
+/**
+ * Local-time period boundaries as [start, end) timestamps in ms
+ * Mirror SQLite's date()/strftime('%W'/'%m'/'%Y', ..., 'localtime') buckets
+ */
+export interface PeriodBounds {
+  dayStart: number;
+  dayEnd: number;
+  /** Monday-based week (%W), clipped to the current year (%Y) */
+  weekStart: number;
+  weekEnd: number;
+  monthStart: number;
+  monthEnd: number;
+}
+
+/**
+ * Completion state for one task_id (task_status 'reminder' or 'completed')
+ */
+interface TaskCompletion {
+  today: boolean;
+  thisWeek: boolean;
+  thisMonth: boolean;
+}
+
+/**
+ * Everything getOpenTasks needs from transcripts, loaded up front
+ */
+interface CompletionState {
+  /** Completions within the current day/week/month */
+  byTask: Map<number, TaskCompletion>;
+  /** 'once' tasks that were ever reminded or completed */
+  onceDone: Set<number>;
+  /** User sent a message today (satisfies wake-up dependency #0) */
+  userActiveToday: boolean;
+}
+
 // ==========================================
 // Task Queries
 // ==========================================
@@ -67,6 +102,7 @@ export interface OpenTasksResult {
 export async function getOpenTasks(db: Client): Promise<OpenTasksResult> {
   const now = Date.now();
   const skippedReasons = new Map<number, string>();
+  const bounds = getPeriodBounds(new Date(now));
 
   console.log('[task-engine] 📋 Checking open tasks...');
 
@@ -101,6 +137,9 @@ export async function getOpenTasks(db: Client): Promise<OpenTasksResult> {
     created_at: Number(row.created_at),
   }));
 
+  // Load all completion state in one pass (no per-task queries)
+  const state = await loadCompletionState(db, bounds, allTasks);
+
   // Filter tasks
   const openTasks: KittTask[] = [];
 
@@ -119,14 +158,10 @@ export async function getOpenTasks(db: Client): Promise<OpenTasksResult> {
 
     // Check dependencies (F54: supports multiple dependencies)
     if (task.depends_on !== null && task.depends_on.length > 0) {
-      const allCompleted = await areDependenciesCompleted(db, task.depends_on);
-      if (!allCompleted) {
-        // Find which dependencies are not completed for detailed message
-        const pendingDeps: number[] = [];
-        for (const depId of task.depends_on) {
-          const completed = await isDependencyCompleted(db, depId);
-          if (!completed) pendingDeps.push(depId);
-        }
+      const pendingDeps = task.depends_on.filter(
+        (depId) => !isDependencyCompleted(state, depId)
+      );
+      if (pendingDeps.length > 0) {
         // Special case: wake-up task (id=0)
         const reason = pendingDeps.includes(0)
           ? 'Wacht op wake-up (geen user message vandaag)'
@@ -148,7 +183,7 @@ export async function getOpenTasks(db: Client): Promise<OpenTasksResult> {
     }
 
     // Check if already executed based on frequency
-    const executed = await hasBeenExecuted(db, task);
+    const executed = hasBeenExecuted(state, task);
     if (executed) {
       skippedReasons.set(task.id, `Already executed (${task.frequency})`);
       continue;
@@ -175,98 +210,167 @@ export async function getOpenTasks(db: Client): Promise<OpenTasksResult> {
 }
 
 /**
- * Check if a dependency task has been completed today
- * Used for task chaining (e.g., wake-up task gates other tasks)
+ * Compute local day/week/month boundaries for a moment in time
+ */
+export function getPeriodBounds(date: Date): PeriodBounds {
+  const dayStart = new Date(date);
+  dayStart.setHours(0, 0, 0, 0);
+  const dayEnd = new Date(dayStart);
+  dayEnd.setDate(dayEnd.getDate() + 1);
+
+  const yearStart = new Date(date.getFullYear(), 0, 1);
+  const yearEnd = new Date(date.getFullYear() + 1, 0, 1);
+
+  // %W weeks start on Monday; week 00 is clipped to Jan 1 by the %Y check
+  const weekStart = new Date(dayStart);
+  weekStart.setDate(weekStart.getDate() - ((weekStart.getDay() + 6) % 7));
+  const weekEnd = new Date(weekStart);
+  weekEnd.setDate(weekEnd.getDate() + 7);
+
+  const monthStart = new Date(date.getFullYear(), date.getMonth(), 1);
+  const monthEnd = new Date(date.getFullYear(), date.getMonth() + 1, 1);
+
+  return {
+    dayStart: dayStart.getTime(),
+    dayEnd: dayEnd.getTime(),
+    weekStart: Math.max(weekStart.getTime(), yearStart.getTime()),
+    weekEnd: Math.min(weekEnd.getTime(), yearEnd.getTime()),
+    monthStart: monthStart.getTime(),
+    monthEnd: monthEnd.getTime(),
+  };
+}
+
+/**
+ * Load completion state for all tasks
  *
- * Special case: wake-up task (id=0) is considered "completed" when:
- * - User has sent any message today (they're awake)
- * - OR the task was explicitly marked completed
+ * One grouped query over idx_transcripts_task_period
+ * (type, task_status, created_at, task_id), bounded by the earliest period
+ * start any task needs, plus an EXISTS lookup for 'once' tasks and one
+ * range query on idx_transcripts_created for the wake-up check.
  *
  * F53: Uses type='task' and task_id/task_status columns
  */
-async function isDependencyCompleted(db: Client, dependsOnId: number): Promise<boolean> {
-  // Special case: wake-up task (id=0)
-  // User sending a message = they're awake
-  if (dependsOnId === 0) {
-    const userMessageResult = await db.execute(`
-      SELECT 1 FROM transcripts
-      WHERE role = 'user'
-        AND date(created_at/1000, 'unixepoch', 'localtime') = date('now', 'localtime')
-      LIMIT 1
-    `);
-    if (userMessageResult.rows.length > 0) {
-      return true;
-    }
+async function loadCompletionState(
+  db: Client,
+  bounds: PeriodBounds,
+  tasks: KittTask[]
+): Promise<CompletionState> {
+  // Today is always needed (dependencies); weeks/months only when used
+  let since = bounds.dayStart;
+  let until = bounds.dayEnd;
+  if (tasks.some((t) => t.frequency === 'weekly')) {
+    since = Math.min(since, bounds.weekStart);
+    until = Math.max(until, bounds.weekEnd);
+  }
+  if (tasks.some((t) => t.frequency === 'monthly')) {
+    since = Math.min(since, bounds.monthStart);
+    until = Math.max(until, bounds.monthEnd);
   }
 
-  // Standard case: check if task was explicitly completed using F53 columns
   const result = await db.execute({
     sql: `
-      SELECT 1 FROM transcripts
+      SELECT task_id,
+             MAX(created_at >= ? AND created_at < ?) AS today,
+             MAX(created_at >= ? AND created_at < ?) AS this_week,
+             MAX(created_at >= ? AND created_at < ?) AS this_month
+      FROM transcripts
       WHERE type = 'task'
-        AND task_id = ?
         AND task_status IN ('reminder', 'completed')
-        AND date(created_at/1000, 'unixepoch', 'localtime') = date('now', 'localtime')
-      LIMIT 1
+        AND created_at >= ? AND created_at < ?
+      GROUP BY task_id
     `,
-    args: [dependsOnId],
+    args: [
+      bounds.dayStart, bounds.dayEnd,
+      bounds.weekStart, bounds.weekEnd,
+      bounds.monthStart, bounds.monthEnd,
+      since, until,
+    ],
   });
-  return result.rows.length > 0;
+
+  const byTask = new Map<number, TaskCompletion>();
+  for (const row of result.rows) {
+    if (row.task_id === null) continue;
+    byTask.set(Number(row.task_id), {
+      today: Number(row.today) === 1,
+      thisWeek: Number(row.this_week) === 1,
+      thisMonth: Number(row.this_month) === 1,
+    });
+  }
+
+  // 'once' tasks: ever reminded or completed (idx_transcripts_task_id)
+  const onceDone = new Set<number>();
+  const onceIds = tasks.filter((t) => t.frequency === 'once').map((t) => t.id);
+  if (onceIds.length > 0) {
+    const onceResult = await db.execute({
+      sql: `
+        SELECT k.id FROM kitt_tasks k
+        WHERE k.id IN (${onceIds.map(() => '?').join(', ')})
+          AND EXISTS (
+            SELECT 1 FROM transcripts t
+            WHERE t.task_id = k.id
+              AND t.type = 'task'
+              AND t.task_status IN ('reminder', 'completed')
+          )
+      `,
+      args: onceIds,
+    });
+    for (const row of onceResult.rows) {
+      onceDone.add(Number(row.id));
+    }
+  }
+
+  // Wake-up task (id=0): user sending a message = they're awake
+  let userActiveToday = false;
+  if (tasks.some((t) => t.depends_on?.includes(0))) {
+    const userMessageResult = await db.execute({
+      sql: `
+        SELECT 1 FROM transcripts
+        WHERE created_at >= ? AND created_at < ?
+          AND role = 'user'
+        LIMIT 1
+      `,
+      args: [bounds.dayStart, bounds.dayEnd],
+    });
+    userActiveToday = userMessageResult.rows.length > 0;
+  }
+
+  return { byTask, onceDone, userActiveToday };
 }
 
 /**
- * Check if ALL dependency tasks have been completed today
- * F54: Supports multiple dependencies
+ * Check if a dependency task has been completed today
+ * Used for task chaining (e.g., wake-up task gates other tasks)
+ *
+ * Special case: wake-up task (id=0) is considered "completed" when:
+ * - User has sent any message today (they're awake)
+ * - OR the task was explicitly marked completed
  */
-async function areDependenciesCompleted(db: Client, dependsOn: number[]): Promise<boolean> {
-  for (const depId of dependsOn) {
-    const completed = await isDependencyCompleted(db, depId);
-    if (!completed) return false;
+function isDependencyCompleted(state: CompletionState, dependsOnId: number): boolean {
+  if (dependsOnId === 0 && state.userActiveToday) {
+    return true;
   }
-  return true;
+  return state.byTask.get(dependsOnId)?.today ?? false;
 }
 
 /**
  * Check if a task has been executed based on its frequency
- *
- * F53: Uses type='task' and task_id/task_status columns
  */
-async function hasBeenExecuted(db: Client, task: KittTask): Promise<boolean> {
-  let dateFilter: string;
+function hasBeenExecuted(state: CompletionState, task: KittTask): boolean {
+  const completion = state.byTask.get(task.id);
 
   switch (task.frequency) {
     case 'daily':
-      dateFilter = "date(created_at/1000, 'unixepoch', 'localtime') = date('now', 'localtime')";
-      break;
+      return completion?.today ?? false;
     case 'weekly':
-      dateFilter = `strftime('%W', datetime(created_at/1000, 'unixepoch', 'localtime')) = strftime('%W', 'now', 'localtime')
-                    AND strftime('%Y', datetime(created_at/1000, 'unixepoch', 'localtime')) = strftime('%Y', 'now', 'localtime')`;
-      break;
+      return completion?.thisWeek ?? false;
     case 'monthly':
-      dateFilter = `strftime('%m', datetime(created_at/1000, 'unixepoch', 'localtime')) = strftime('%m', 'now', 'localtime')
-                    AND strftime('%Y', datetime(created_at/1000, 'unixepoch', 'localtime')) = strftime('%Y', 'now', 'localtime')`;
-      break;
+      return completion?.thisMonth ?? false;
     case 'once':
       // For once tasks, check if it's ever been completed
-      dateFilter = '1=1';
-      break;
+      return state.onceDone.has(task.id);
     default:
       return false;
   }
-
-  // F53: Use direct columns instead of JSON metadata
-  const result = await db.execute({
-    sql: `
-      SELECT COUNT(*) as count FROM transcripts
-      WHERE type = 'task'
-        AND task_id = ?
-        AND task_status IN ('reminder', 'completed')
-        AND ${dateFilter}
-    `,
-    args: [task.id],
-  });
-
-  return Number(result.rows[0].count) > 0;
 }
 
 /**
@@ -380,14 +484,15 @@ export async function getTaskHistory(
  * F53: Uses task_id column
  */
 export async function getTaskAttemptCountToday(db: Client, taskId: number): Promise<number> {
+  const { dayStart, dayEnd } = getPeriodBounds(new Date());
   const result = await db.execute({
     sql: `
       SELECT COUNT(*) as count FROM transcripts
       WHERE type = 'task'
         AND task_id = ?
-        AND date(created_at/1000, 'unixepoch', 'localtime') = date('now', 'localtime')
+        AND created_at >= ? AND created_at < ?
     `,
-    args: [taskId],
+    args: [taskId, dayStart, dayEnd],
   });
 
   return Number(result.rows[0].count);
@@ -408,16 +513,17 @@ export async function wasTaskExecutedToday(
   statuses: TaskStatus[] = ['reminder', 'completed']
 ): Promise<boolean> {
   const placeholders = statuses.map(() => '?').join(', ');
+  const { dayStart, dayEnd } = getPeriodBounds(new Date());
   const result = await db.execute({
     sql: `
       SELECT 1 FROM transcripts
       WHERE type = 'task'
         AND task_id = ?
         AND task_status IN (${placeholders})
-        AND date(created_at/1000, 'unixepoch', 'localtime') = date('now', 'localtime')
+        AND created_at >= ? AND created_at < ?
       LIMIT 1
     `,
-    args: [taskId, ...statuses],
+    args: [taskId, ...statuses, dayStart, dayEnd],
   });
   return result.rows.length > 0;
 }
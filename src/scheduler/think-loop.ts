@@ -25,6 +25,8 @@ import {
   getOpenTasks,
   type KittTask,
 } from './task-engine.js';
+import { hashText, mapWithConcurrency } from '../memory/utils.js';
+import { timeSpan } from '../metrics/index.js';
 
 const execAsync = promisify(exec);
 
@@ -70,8 +72,13 @@ export interface ThinkLoopSkill {
   daypart?: 'morning' | 'afternoon' | 'evening' | 'night';
   // For every_time skills: command to fetch data
   fetch?: string;
+  // Seconds a fetch result may be reused (default: 0, fetch every tick)
+  fetchTtl?: number;
   // Result of fetch command (populated at runtime)
   fetchResult?: string;
+  // Fetch duration in ms, and whether the result came from the TTL cache
+  fetchMs?: number;
+  fetchCached?: boolean;
   // NOTE: skillContent removed - too large for think prompt, agent can read SKILL.md if needed
 }
 
@@ -101,6 +108,7 @@ interface SkillMetadata {
     trigger?: SkillTrigger;
     // For every_time triggers: command to fetch data
     fetch?: string;
+    fetchTtl?: number;
     // For scheduled triggers
     frequency?: 'daily' | 'weekly' | 'monthly';
     timesPerDay?: number;
@@ -157,6 +165,7 @@ export function discoverThinkLoopSkills(skillsDir: string): ThinkLoopSkill[] {
           timesPerDay: metadata?.kitt?.timesPerDay,
           daypart: metadata?.kitt?.daypart || metadata?.kitt?.schedule?.daypart,
           fetch: metadata?.kitt?.fetch,
+          fetchTtl: metadata?.kitt?.fetchTtl,
         });
       }
     } catch {
@@ -200,23 +209,62 @@ function parseSkillMetadata(content: string): SkillMetadata | null {
 // Skill Data Fetching
 // ==========================================
 
+const SKILL_FETCH_TIMEOUT_MS = 10000;
+const SKILL_FETCH_CONCURRENCY = 4;
+
+interface FetchCacheEntry {
+  result?: string;
+  fetchedAt: number;
+}
+
+export interface SkillFetchOptions {
+  /** Max fetch commands in flight (default: 4) */
+  concurrency?: number;
+  /** Results of earlier fetches, reused while younger than the skill's fetchTtl */
+  cache?: Map<string, FetchCacheEntry>;
+}
+
 /**
  * Execute fetch commands for skills that have them
  * Populates skill.fetchResult with the command output
+ *
+ * Commands run concurrently (bounded). A skill with `fetchTtl` (seconds)
+ * reuses its previous result until it expires instead of spawning again.
  */
-async function executeSkillFetches(skills: ThinkLoopSkill[]): Promise<void> {
-  for (const skill of skills) {
-    if (!skill.fetch) continue;
+export async function executeSkillFetches(
+  skills: ThinkLoopSkill[],
+  options: SkillFetchOptions = {}
+): Promise<void> {
+  const { concurrency = SKILL_FETCH_CONCURRENCY, cache } = options;
+  const fetchable = skills.filter((s) => s.fetch);
+
+  await mapWithConcurrency(fetchable, concurrency, async (skill) => {
+    const cacheKey = `${skill.id}\0${skill.fetch}`;
+    const cached = cache?.get(cacheKey);
+    const ttlMs = (skill.fetchTtl ?? 0) * 1000;
+
+    if (cached && Date.now() - cached.fetchedAt < ttlMs) {
+      skill.fetchResult = cached.result;
+      skill.fetchCached = true;
+      skill.fetchMs = 0;
+      return;
+    }
 
+    const startedAt = Date.now();
     try {
-      const { stdout } = await execAsync(skill.fetch, { timeout: 10000 });
+      const { stdout } = await execAsync(skill.fetch!, { timeout: SKILL_FETCH_TIMEOUT_MS });
       skill.fetchResult = stdout.trim();
-      console.log(`[think-loop] Fetched data for ${skill.id}:`, skill.fetchResult.slice(0, 100));
+      skill.fetchMs = Date.now() - startedAt;
+      console.log(`[think-loop] Fetched data for ${skill.id} (${skill.fetchMs}ms):`, skill.fetchResult.slice(0, 100));
+      cache?.set(cacheKey, { result: skill.fetchResult, fetchedAt: Date.now() });
     } catch (err) {
-      console.warn(`[think-loop] Fetch failed for ${skill.id}:`, err instanceof Error ? err.message : String(err));
+      skill.fetchMs = Date.now() - startedAt;
+      console.warn(`[think-loop] Fetch failed for ${skill.id} (${skill.fetchMs}ms):`, err instanceof Error ? err.message : String(err));
       skill.fetchResult = undefined;
+      // Don't cache failures - retry on the next tick
+      cache?.delete(cacheKey);
     }
-  }
+  });
 }
 
 // ==========================================
@@ -225,6 +273,38 @@ async function executeSkillFetches(skills: ThinkLoopSkill[]): Promise<void> {
 
 const PROFILE_DIR = process.env.KITT_PROFILE_DIR || './profile';
 
+interface ProfileFiles {
+  identity: string;
+  soul: string;
+  userInfo: string;
+  workingMemory: string;
+}
+
+interface TranscriptLine {
+  rowid: number;
+  createdAt: number;
+  text: string;
+}
+
+interface TranscriptState {
+  /** Start of the day the lines belong to (reset at midnight) */
+  dayStart: number;
+  /** Highest transcripts.rowid seen so far */
+  lastRowid: number;
+  /** Formatted lines, ordered by created_at */
+  lines: TranscriptLine[];
+  lastUser: { content: string; createdAt: number } | null;
+}
+
+export interface ThinkLoopContextBuilderOptions {
+  skillsDir?: string;
+  profileDir?: string;
+  /** Max skill fetch commands in flight (default: 4) */
+  fetchConcurrency?: number;
+  /** Watch skills/profile with fs.watch instead of re-reading every tick (default: true) */
+  watch?: boolean;
+}
+
 /**
  * Read a file safely, returning empty string on error
  */
@@ -237,115 +317,297 @@ function readFileSafe(filePath: string): string {
 }
 
 /**
- * Build context for the think loop
+ * Format a transcript row for the agent
+ * F53: Use type='thought' instead of role='thought'
  */
-export async function buildThinkLoopContext(
-  db: Client,
-  skillsDir = '.claude/skills'
-): Promise<ThinkLoopContext> {
-  const now = new Date();
-  const startOfDay = new Date(now);
-  startOfDay.setHours(0, 0, 0, 0);
-
-  // Get today's transcripts
-  // F53: Include type column for proper role/type distinction
-  const todayResult = await db.execute({
-    sql: `SELECT role, type, content, created_at
-          FROM transcripts
-          WHERE created_at >= ?
-          ORDER BY created_at ASC`,
-    args: [startOfDay.getTime()],
+function formatTranscriptLine(row: Record<string, unknown>): string {
+  const time = new Date(Number(row.created_at)).toLocaleTimeString('nl-NL', {
+    hour: '2-digit',
+    minute: '2-digit',
+    timeZone: 'Europe/Amsterdam',
   });
+  // F53: Check type for thoughts, role for user/kitt
+  const type = row.type || 'message';
+  const isThought = type === 'thought';
+  const isTask = type === 'task';
+  const role = row.role === 'user' ? 'Renier'
+    : isThought ? '🧠 KITT (gedachte)'
+    : isTask ? '📋 KITT (task)'
+    : 'KITT';
+  const content = String(row.content);
+  const preview = content.length > 200 ? content.slice(0, 200) + '...' : content;
+  return `[${time}] ${role}: ${preview}`;
+}
 
-  // Format transcripts for the agent
-  // F53: Use type='thought' instead of role='thought'
-  const transcripts = todayResult.rows
-    .map((row) => {
-      const time = new Date(Number(row.created_at)).toLocaleTimeString('nl-NL', {
-        hour: '2-digit',
-        minute: '2-digit',
-        timeZone: 'Europe/Amsterdam',
+/**
+ * Incremental context builder for the think loop
+ *
+ * Keeps state between ticks so a quiet tick costs almost nothing:
+ * - Transcripts: only rows after the last seen rowid are read and formatted
+ * - Skills and profile files: cached until fs.watch reports a change
+ * - Skill fetches: concurrent, with a per-skill TTL cache
+ */
+export class ThinkLoopContextBuilder {
+  private skillsDir: string;
+  private profileDir: string;
+  private fetchConcurrency: number;
+  private watchers: fs.FSWatcher[] = [];
+
+  private skills: ThinkLoopSkill[] | null = null;
+  private skillsWatched = false;
+  private profile: ProfileFiles | null = null;
+  private profileWatched = false;
+  private fetchCache = new Map<string, FetchCacheEntry>();
+  private transcriptState: TranscriptState | null = null;
+
+  constructor(options: ThinkLoopContextBuilderOptions = {}) {
+    this.skillsDir = options.skillsDir ?? '.claude/skills';
+    this.profileDir = options.profileDir ?? PROFILE_DIR;
+    this.fetchConcurrency = options.fetchConcurrency ?? SKILL_FETCH_CONCURRENCY;
+
+    if (options.watch !== false) {
+      this.skillsWatched = this.watch(this.skillsDir, true, () => {
+        this.skills = null;
       });
-      // F53: Check type for thoughts, role for user/kitt
-      const type = row.type || 'message';
-      const isThought = type === 'thought';
-      const isTask = type === 'task';
-      const role = row.role === 'user' ? 'Renier'
-        : isThought ? '🧠 KITT (gedachte)'
-        : isTask ? '📋 KITT (task)'
-        : 'KITT';
-      const content = String(row.content);
-      const preview = content.length > 200 ? content.slice(0, 200) + '...' : content;
-      return `[${time}] ${role}: ${preview}`;
-    })
-    .join('\n');
-
-  // Find last user message
-  let lastUserMessage: ThinkLoopContext['lastUserMessage'];
-  for (let i = todayResult.rows.length - 1; i >= 0; i--) {
-    const row = todayResult.rows[i];
-    if (row.role === 'user') {
-      const msgTime = new Date(Number(row.created_at));
-      const minutesAgo = Math.round((now.getTime() - msgTime.getTime()) / 60000);
+      this.profileWatched = ['identity', 'user', 'memory'].every((dir) =>
+        this.watch(path.join(this.profileDir, dir), false, () => {
+          this.profile = null;
+        })
+      );
+    }
+  }
+
+  /**
+   * Build context for the think loop
+   */
+  async build(db: Client): Promise<ThinkLoopContext> {
+    const now = new Date();
+    const startOfDay = new Date(now);
+    startOfDay.setHours(0, 0, 0, 0);
+
+    // Today's transcripts (incremental)
+    const state = await timeSpan('think.transcripts', () => this.loadTranscripts(db, startOfDay.getTime()));
+    const transcripts = state.lines.map((line) => line.text).join('\n');
+
+    // Last user message (minutesAgo is relative to this tick)
+    let lastUserMessage: ThinkLoopContext['lastUserMessage'];
+    if (state.lastUser) {
+      const msgTime = new Date(state.lastUser.createdAt);
       lastUserMessage = {
-        content: String(row.content),
+        content: state.lastUser.content,
         time: msgTime.toLocaleTimeString('nl-NL', {
           hour: '2-digit',
           minute: '2-digit',
           timeZone: 'Europe/Amsterdam',
         }),
-        minutesAgo,
+        minutesAgo: Math.round((now.getTime() - msgTime.getTime()) / 60000),
       };
-      break;
     }
+
+    // Skills for think loop (every_time + scheduled only)
+    // Copies, because fetch results are filled in per tick
+    const skills = this.getSkills().map((skill) => ({ ...skill }));
+
+    // Execute fetch commands for skills that have them
+    await timeSpan('think.fetch', () => executeSkillFetches(skills, {
+      concurrency: this.fetchConcurrency,
+      cache: this.fetchCache,
+    }));
+
+    // KITT identity context
+    const profile = this.getProfile();
+
+    // Calculate week of year
+    const startOfYear = new Date(now.getFullYear(), 0, 1);
+    const weekOfYear = Math.ceil(
+      ((now.getTime() - startOfYear.getTime()) / 86400000 + startOfYear.getDay() + 1) / 7
+    );
+
+    const days = ['zondag', 'maandag', 'dinsdag', 'woensdag', 'donderdag', 'vrijdag', 'zaterdag'];
+
+    // Get open tasks from Task Engine
+    const openTasksResult = await timeSpan('think.tasks', () => getOpenTasks(db));
+
+    return {
+      currentTime: now.toLocaleTimeString('nl-NL', {
+        hour: '2-digit',
+        minute: '2-digit',
+        timeZone: 'Europe/Amsterdam',
+      }),
+      currentHour: now.getHours(),
+      dayOfWeek: days[now.getDay()],
+      dayOfMonth: now.getDate(),
+      weekOfYear,
+      transcripts: transcripts || 'Geen gesprekken vandaag.',
+      messageCount: state.lines.length,
+      lastUserMessage,
+      skills,
+      // Task Engine
+      tasks: openTasksResult.tasks,
+      taskSkippedReasons: openTasksResult.skippedReasons,
+      // KITT identity
+      identity: profile.identity || undefined,
+      soul: profile.soul || undefined,
+      userInfo: profile.userInfo || undefined,
+      workingMemory: profile.workingMemory || undefined,
+    };
+  }
+
+  /**
+   * Drop all cached state (next build reads everything again)
+   */
+  invalidate(): void {
+    this.skills = null;
+    this.profile = null;
+    this.fetchCache.clear();
+    this.transcriptState = null;
+  }
+
+  /**
+   * Stop watching skills/profile
+   */
+  close(): void {
+    for (const watcher of this.watchers) {
+      watcher.close();
+    }
+    this.watchers = [];
+    this.skillsWatched = false;
+    this.profileWatched = false;
+    this.invalidate();
   }
 
-  // Get skills for think loop (every_time + scheduled only)
-  const skills = discoverThinkLoopSkills(skillsDir);
+  /**
+   * Read transcripts added since the previous build
+   * The cursor is the rowid (insert order), so rows written late with an
+   * earlier created_at are still picked up and sorted into place.
+   */
+  private async loadTranscripts(db: Client, dayStart: number): Promise<TranscriptState> {
+    if (!this.transcriptState || this.transcriptState.dayStart !== dayStart) {
+      this.transcriptState = { dayStart, lastRowid: 0, lines: [], lastUser: null };
+    }
+    const state = this.transcriptState;
+
+    // F53: Include type column for proper role/type distinction
+    const result = await db.execute({
+      sql: `SELECT rowid, role, type, content, created_at
+            FROM transcripts
+            WHERE rowid > ? AND created_at >= ?
+            ORDER BY created_at ASC, rowid ASC`,
+      args: [state.lastRowid, dayStart],
+    });
+
+    for (const row of result.rows) {
+      const line: TranscriptLine = {
+        rowid: Number(row.rowid),
+        createdAt: Number(row.created_at),
+        text: formatTranscriptLine(row),
+      };
 
-  // Execute fetch commands for skills that have them
-  await executeSkillFetches(skills);
+      // Almost always an append; otherwise insert at its created_at position
+      let index = state.lines.length;
+      while (
+        index > 0 &&
+        (state.lines[index - 1].createdAt > line.createdAt ||
+          (state.lines[index - 1].createdAt === line.createdAt && state.lines[index - 1].rowid > line.rowid))
+      ) {
+        index--;
+      }
+      state.lines.splice(index, 0, line);
 
-  // Load KITT identity context
-  const identity = readFileSafe(path.join(PROFILE_DIR, 'identity/IDENTITY.md'));
-  const soul = readFileSafe(path.join(PROFILE_DIR, 'identity/SOUL.md'));
-  const userInfo = readFileSafe(path.join(PROFILE_DIR, 'user/USER.md'));
-  const workingMemory = readFileSafe(path.join(PROFILE_DIR, 'memory/MEMORY.md'));
+      state.lastRowid = Math.max(state.lastRowid, line.rowid);
+      if (row.role === 'user' && (!state.lastUser || line.createdAt >= state.lastUser.createdAt)) {
+        state.lastUser = { content: String(row.content), createdAt: line.createdAt };
+      }
+    }
 
-  // Calculate week of year
-  const startOfYear = new Date(now.getFullYear(), 0, 1);
-  const weekOfYear = Math.ceil(
-    ((now.getTime() - startOfYear.getTime()) / 86400000 + startOfYear.getDay() + 1) / 7
-  );
+    return state;
+  }
 
-  const days = ['zondag', 'maandag', 'dinsdag', 'woensdag', 'donderdag', 'vrijdag', 'zaterdag'];
+  private getSkills(): ThinkLoopSkill[] {
+    if (this.skills && this.skillsWatched) {
+      return this.skills;
+    }
+    this.skills = discoverThinkLoopSkills(this.skillsDir);
+    return this.skills;
+  }
 
-  // Get open tasks from Task Engine
-  const openTasksResult = await getOpenTasks(db);
+  private getProfile(): ProfileFiles {
+    if (this.profile && this.profileWatched) {
+      return this.profile;
+    }
+    this.profile = {
+      identity: readFileSafe(path.join(this.profileDir, 'identity/IDENTITY.md')),
+      soul: readFileSafe(path.join(this.profileDir, 'identity/SOUL.md')),
+      userInfo: readFileSafe(path.join(this.profileDir, 'user/USER.md')),
+      workingMemory: readFileSafe(path.join(this.profileDir, 'memory/MEMORY.md')),
+    };
+    return this.profile;
+  }
 
-  return {
-    currentTime: now.toLocaleTimeString('nl-NL', {
-      hour: '2-digit',
-      minute: '2-digit',
-      timeZone: 'Europe/Amsterdam',
-    }),
-    currentHour: now.getHours(),
-    dayOfWeek: days[now.getDay()],
-    dayOfMonth: now.getDate(),
-    weekOfYear,
-    transcripts: transcripts || 'Geen gesprekken vandaag.',
-    messageCount: todayResult.rows.length,
-    lastUserMessage,
-    skills,
-    // Task Engine
-    tasks: openTasksResult.tasks,
-    taskSkippedReasons: openTasksResult.skippedReasons,
-    // KITT identity
-    identity: identity || undefined,
-    soul: soul || undefined,
-    userInfo: userInfo || undefined,
-    workingMemory: workingMemory || undefined,
-  };
+  /**
+   * Watch a directory, calling onChange for every event
+   * Returns false when watching isn't possible (the cache is then bypassed)
+   */
+  private watch(dir: string, recursive: boolean, onChange: () => void): boolean {
+    try {
+      const watcher = fs.watch(dir, { recursive, persistent: false }, onChange);
+      watcher.on('error', (err) => {
+        // Fall back to re-reading every tick
+        console.warn(`[think-loop] Stopped watching ${dir}:`, err.message);
+        this.close();
+      });
+      this.watchers.push(watcher);
+      return true;
+    } catch {
+      return false;
+    }
+  }
+}
+
+/**
+ * Build context for the think loop (one-shot, no state kept between calls)
+ */
+export async function buildThinkLoopContext(
+  db: Client,
+  skillsDir = '.claude/skills'
+): Promise<ThinkLoopContext> {
+  const builder = new ThinkLoopContextBuilder({ skillsDir, watch: false });
+  try {
+    return await builder.build(db);
+  } finally {
+    builder.close();
+  }
+}
+
+// Clock resolution of the fingerprint: a quiet context is re-evaluated
+// at least this often (scheduled skills, task time windows, dayparts)
+const FINGERPRINT_BUCKET_MINUTES = 15;
+
+/**
+ * Fingerprint of everything the agent reacts to
+ *
+ * The clock is only included in FINGERPRINT_BUCKET_MINUTES steps (not
+ * minutes or minutesAgo), so a quiet tick matches the previous one within
+ * the same quarter hour.
+ */
+export function fingerprintThinkLoopContext(context: ThinkLoopContext): string {
+  const [hours, minutes] = context.currentTime.split(':').map(Number);
+  const timeBucket = Math.floor((hours * 60 + minutes) / FINGERPRINT_BUCKET_MINUTES);
+
+  return hashText(JSON.stringify([
+    context.dayOfMonth,
+    Number.isFinite(timeBucket) ? timeBucket : context.currentHour,
+    context.transcripts,
+    context.skills.map((s) => [s.id, s.fetchResult ?? null]),
+    context.tasks.map((t) => [
+      t.id, t.title, t.priority, t.description, t.time_window_start, t.time_window_end,
+    ]),
+    Array.from(context.taskSkippedReasons.entries()),
+    context.identity,
+    context.soul,
+    context.userInfo,
+    context.workingMemory,
+  ]));
 }
 
 // ==========================================
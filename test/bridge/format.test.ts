@@ -0,0 +1,50 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { splitFormattedMessage, splitMessage, TELEGRAM_MAX_LENGTH } from '../../src/bridge/format.js';
+
+const words = (text: string): string => text.replace(/\s+/g, ' ').trim();
+
+describe('splitMessage', () => {
+  it('keeps short messages whole', () => {
+    assert.deepEqual(splitMessage('Hallo!', 4000), ['Hallo!']);
+  });
+
+  it('prefers paragraph boundaries', () => {
+    const first = 'a'.repeat(60);
+    const second = 'b'.repeat(60);
+    assert.deepEqual(splitMessage(`${first}\n\n${second}`, 100), [first, second]);
+  });
+
+  it('force splits text without boundaries', () => {
+    const parts = splitMessage('x'.repeat(250), 100);
+    assert.deepEqual(parts.map((p) => p.length), [100, 100, 50]);
+  });
+});
+
+describe('splitFormattedMessage', () => {
+  it('keeps every formatted chunk within the Telegram limit', () => {
+    // Nearly every character needs escaping, so formatting doubles the length
+    const text = Array.from({ length: 40 }, () => '_*[]().!-'.repeat(30)).join('\n');
+    const chunks = splitFormattedMessage(text, 4000);
+
+    assert.ok(chunks.length > 1);
+    for (const chunk of chunks) {
+      assert.ok(chunk.text.length <= TELEGRAM_MAX_LENGTH, `chunk of ${chunk.text.length}`);
+      assert.equal(chunk.parseMode, 'MarkdownV2');
+    }
+    assert.equal(words(chunks.map((c) => c.plain).join(' ')), words(text));
+  });
+
+  it('leaves chunks that fit as they are', () => {
+    const text = 'Gewoon een zin zonder leestekens '.repeat(300);
+    const plain = splitMessage(text, 4000);
+    const chunks = splitFormattedMessage(text, 4000);
+
+    assert.deepEqual(chunks.map((c) => c.plain), plain);
+  });
+
+  it('does not escape code blocks', () => {
+    const [chunk] = splitFormattedMessage('Kijk:\n```ts\nconst a = 1;\n```');
+    assert.equal(chunk.text, 'Kijk:\n```ts\nconst a = 1;\n```');
+  });
+});
@@ -0,0 +1,148 @@
+import { describe, it, beforeEach, afterEach } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { LogStore, RingBuffer, type LogEntry, type LogLevel } from '../../src/bridge/log-store.js';
+
+describe('RingBuffer', () => {
+  it('returns entries oldest first', () => {
+    const buffer = new RingBuffer<number>(3);
+    buffer.push(1);
+    buffer.push(2);
+    assert.deepEqual(buffer.toArray(), [1, 2]);
+  });
+
+  it('overwrites the oldest entries when full', () => {
+    const buffer = new RingBuffer<number>(3);
+    for (let i = 1; i <= 7; i++) buffer.push(i);
+    assert.deepEqual(buffer.toArray(), [5, 6, 7]);
+  });
+
+  it('works with a capacity of one', () => {
+    const buffer = new RingBuffer<string>(1);
+    buffer.push('a');
+    buffer.push('b');
+    assert.deepEqual(buffer.toArray(), ['b']);
+  });
+});
+
+describe('LogStore', () => {
+  let dir: string;
+  let base: number;
+
+  beforeEach(async () => {
+    dir = await fs.mkdtemp(path.join(os.tmpdir(), 'kitt-logs-'));
+    base = Date.now();
+  });
+
+  afterEach(async () => {
+    await fs.rm(dir, { recursive: true, force: true });
+  });
+
+  const entry = (i: number, level: LogLevel = 'info', source = 'bridge'): LogEntry => ({
+    ts: base + i,
+    level,
+    source,
+    content: `entry ${i}`,
+  });
+
+  const contents = (entries: LogEntry[]): string[] => entries.map((e) => e.content);
+
+  it('queries by time, level, source and text', async () => {
+    const store = new LogStore({ dir });
+    await store.open();
+    store.append(entry(0));
+    store.append(entry(1, 'error'));
+    store.append(entry(2, 'debug', 'portal'));
+    store.append(entry(3, 'warn', 'portal'));
+    await store.flush();
+
+    assert.deepEqual(contents((await store.query()).entries), ['entry 0', 'entry 1', 'entry 2', 'entry 3']);
+    assert.deepEqual(contents((await store.query({ from: base + 2 })).entries), ['entry 2', 'entry 3']);
+    assert.deepEqual(contents((await store.query({ to: base + 1 })).entries), ['entry 0', 'entry 1']);
+    assert.deepEqual(contents((await store.query({ level: 'warn' })).entries), ['entry 1', 'entry 3']);
+    assert.deepEqual(contents((await store.query({ source: 'portal' })).entries), ['entry 2', 'entry 3']);
+    assert.deepEqual(contents((await store.query({ q: 'entry 1' })).entries), ['entry 1']);
+
+    await store.close();
+  });
+
+  it('returns the newest matches without from, the oldest with from', async () => {
+    const store = new LogStore({ dir });
+    for (let i = 0; i < 10; i++) store.append(entry(i));
+
+    const newest = await store.query({ limit: 3 });
+    assert.deepEqual(contents(newest.entries), ['entry 7', 'entry 8', 'entry 9']);
+    assert.equal(newest.hasMore, true);
+
+    const oldest = await store.query({ from: base, limit: 3 });
+    assert.deepEqual(contents(oldest.entries), ['entry 0', 'entry 1', 'entry 2']);
+    assert.equal(oldest.hasMore, true);
+
+    await store.close();
+  });
+
+  it('rotates segments and drops the oldest above the size limit', async () => {
+    const store = new LogStore({ dir, segmentBytes: 500, maxBytes: 2000 });
+    for (let i = 0; i < 200; i++) {
+      store.append(entry(i));
+      if (i % 10 === 9) await store.flush();
+    }
+    await store.flush();
+
+    const stats = store.getStats();
+    assert.ok(stats.segments > 1);
+    assert.ok(stats.bytes <= 2000 + 500, `${stats.bytes} bytes kept`);
+
+    const { entries } = await store.query({ limit: 5000 });
+    assert.equal(entries[entries.length - 1].content, 'entry 199');
+    assert.ok(entries[0].ts > base, 'oldest entries were removed');
+    // Still in order across segments
+    for (let i = 1; i < entries.length; i++) {
+      assert.ok(entries[i].ts > entries[i - 1].ts);
+    }
+
+    await store.close();
+  });
+
+  it('tails new entries from a cursor, across segments', async () => {
+    const store = new LogStore({ dir, segmentBytes: 300 });
+    store.append(entry(0));
+
+    const start = await store.tail();
+    assert.deepEqual(start.entries, []);
+
+    for (let i = 1; i <= 20; i++) {
+      store.append(entry(i));
+      await store.flush();
+    }
+
+    const first = await store.tail(start.cursor, 15);
+    assert.deepEqual(contents(first.entries), Array.from({ length: 15 }, (_, i) => `entry ${i + 1}`));
+
+    const rest = await store.tail(first.cursor);
+    assert.deepEqual(contents(rest.entries), Array.from({ length: 5 }, (_, i) => `entry ${i + 16}`));
+
+    const none = await store.tail(rest.cursor);
+    assert.deepEqual(none.entries, []);
+
+    await store.close();
+  });
+
+  it('reopens existing segments, with or without the index', async () => {
+    const first = new LogStore({ dir });
+    for (let i = 0; i < 5; i++) first.append(entry(i, i === 4 ? 'error' : 'info'));
+    await first.close();
+
+    const reopened = new LogStore({ dir });
+    assert.deepEqual(contents((await reopened.query({ level: 'error' })).entries), ['entry 4']);
+    await reopened.close();
+
+    await fs.rm(path.join(dir, 'index.json'));
+    const rebuilt = new LogStore({ dir });
+    assert.equal((await rebuilt.query()).entries.length, 5);
+    assert.deepEqual(contents((await rebuilt.query({ level: 'error' })).entries), ['entry 4']);
+    await rebuilt.close();
+  });
+});
@@ -0,0 +1,163 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { ChatQueue, joinCoalescedMessages } from '../../src/bridge/queue.js';
+
+const sleep = (ms: number): Promise<void> => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Wait until `check` passes (polling), fail after `timeoutMs`
+ */
+async function until(check: () => boolean, timeoutMs = 2000): Promise<void> {
+  const deadline = Date.now() + timeoutMs;
+  while (!check()) {
+    if (Date.now() > deadline) throw new Error('Timed out');
+    await sleep(5);
+  }
+}
+
+describe('ChatQueue', () => {
+  it('merges a burst for one chat into one turn', async () => {
+    const turns: Array<[string, string[]]> = [];
+    const queue = new ChatQueue<string>({
+      coalesceMs: 20,
+      maxWaitMs: 500,
+      maxConcurrent: 2,
+      handler: async (chatId, items) => {
+        turns.push([chatId, items]);
+      },
+    });
+
+    queue.enqueue('chat', 'a');
+    queue.enqueue('chat', 'b');
+    queue.enqueue('chat', 'c');
+    await until(() => turns.length === 1);
+    await sleep(40);
+
+    assert.deepEqual(turns, [['chat', ['a', 'b', 'c']]]);
+    assert.equal(queue.getStats().chats, 0);
+  });
+
+  it('never waits longer than maxWaitMs for a quiet period', async () => {
+    const turns: string[][] = [];
+    const queue = new ChatQueue<string>({
+      coalesceMs: 50,
+      maxWaitMs: 80,
+      maxConcurrent: 1,
+      handler: async (_chatId, items) => {
+        turns.push(items);
+      },
+    });
+
+    const startedAt = Date.now();
+    for (let i = 0; i < 10 && turns.length === 0; i++) {
+      queue.enqueue('chat', String(i));
+      await sleep(20);
+    }
+    await until(() => turns.length > 0);
+
+    assert.ok(Date.now() - startedAt < 400);
+    assert.deepEqual(turns[0].slice(0, 2), ['0', '1']);
+  });
+
+  it('runs messages that arrive during a turn in the next turn', async () => {
+    const turns: string[][] = [];
+    let release!: () => void;
+    const firstTurn = new Promise<void>((resolve) => (release = resolve));
+
+    const queue = new ChatQueue<string>({
+      coalesceMs: 5,
+      maxWaitMs: 50,
+      maxConcurrent: 1,
+      handler: async (_chatId, items) => {
+        turns.push(items);
+        if (turns.length === 1) await firstTurn;
+      },
+    });
+
+    queue.enqueue('chat', 'a');
+    await until(() => turns.length === 1);
+    queue.enqueue('chat', 'b');
+    queue.enqueue('chat', 'c');
+    await sleep(30);
+    assert.equal(turns.length, 1, 'same chat never runs in parallel');
+
+    release();
+    await until(() => turns.length === 2);
+    assert.deepEqual(turns, [['a'], ['b', 'c']]);
+  });
+
+  it('caps concurrent turns across chats', async () => {
+    let active = 0;
+    let maxActive = 0;
+    const done: string[] = [];
+
+    const queue = new ChatQueue<string>({
+      coalesceMs: 1,
+      maxWaitMs: 10,
+      maxConcurrent: 2,
+      handler: async (chatId) => {
+        active++;
+        maxActive = Math.max(maxActive, active);
+        await sleep(20);
+        active--;
+        done.push(chatId);
+      },
+    });
+
+    for (const chatId of ['a', 'b', 'c', 'd', 'e']) {
+      queue.enqueue(chatId, 'hi');
+    }
+    await until(() => done.length === 5);
+
+    assert.equal(maxActive, 2);
+    assert.deepEqual([...done].sort(), ['a', 'b', 'c', 'd', 'e']);
+  });
+
+  it('keeps going after a failed turn', async () => {
+    const turns: string[][] = [];
+    let release!: () => void;
+    const firstTurn = new Promise<void>((resolve) => (release = resolve));
+
+    const queue = new ChatQueue<string>({
+      coalesceMs: 1,
+      maxWaitMs: 10,
+      maxConcurrent: 1,
+      handler: async (_chatId, items) => {
+        turns.push(items);
+        if (turns.length === 1) {
+          await firstTurn;
+          throw new Error('boom');
+        }
+      },
+    });
+
+    queue.enqueue('chat', 'a');
+    await until(() => turns.length === 1);
+    queue.enqueue('chat', 'b');
+    release();
+    await until(() => turns.length === 2);
+
+    assert.deepEqual(turns, [['a'], ['b']]);
+  });
+});
+
+describe('joinCoalescedMessages', () => {
+  it('joins messages from one sender as they are', () => {
+    const content = joinCoalescedMessages([
+      { sender: 'Renier', text: 'hoi' },
+      { sender: 'Renier', text: 'hoe laat is de training?' },
+    ]);
+
+    assert.equal(content, 'hoi\n\nhoe laat is de training?');
+  });
+
+  it('prefixes each message with its sender when several people wrote', () => {
+    const content = joinCoalescedMessages([
+      { sender: 'Renier', text: 'wie doet de boodschappen?' },
+      { sender: 'Mila', text: 'ik!' },
+      { sender: 'Renier', text: 'top' },
+    ]);
+
+    assert.equal(content, 'Renier: wie doet de boodschappen?\n\nMila: ik!\n\nRenier: top');
+  });
+});
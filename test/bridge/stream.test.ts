@@ -0,0 +1,86 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import type { Api } from 'grammy';
+import { StreamingReply } from '../../src/bridge/stream.js';
+import { TELEGRAM_MAX_LENGTH } from '../../src/bridge/format.js';
+
+interface Message {
+  id: number;
+  text: string;
+  parseMode?: string;
+}
+
+/**
+ * In-memory stand-in for the Bot API methods StreamingReply uses
+ */
+function fakeApi() {
+  const messages = new Map<number, Message>();
+  let nextId = 1;
+
+  const api = {
+    sendMessage: async (_chatId: string, text: string, options: { parse_mode?: string } = {}) => {
+      const message = { id: nextId++, text, parseMode: options.parse_mode };
+      messages.set(message.id, message);
+      return { message_id: message.id };
+    },
+    editMessageText: async (_chatId: string, id: number, text: string, options: { parse_mode?: string } = {}) => {
+      messages.set(id, { id, text, parseMode: options.parse_mode });
+      return true;
+    },
+    deleteMessage: async (_chatId: string, id: number) => {
+      messages.delete(id);
+      return true;
+    },
+  };
+
+  return { api: api as unknown as Api, messages };
+}
+
+const sleep = (ms: number): Promise<void> => new Promise((resolve) => setTimeout(resolve, ms));
+
+describe('StreamingReply', () => {
+  it('splits a long final answer into messages within the Telegram limit', async () => {
+    const { api, messages } = fakeApi();
+    const reply = new StreamingReply(api, '1');
+
+    // Escaping roughly doubles this text
+    const text = Array.from({ length: 60 }, (_, i) => `${i}. item_${i} (v1.2-beta)! `.repeat(12)).join('\n');
+    await reply.finish(text);
+
+    assert.ok(messages.size > 1);
+    for (const message of messages.values()) {
+      assert.ok(message.text.length <= TELEGRAM_MAX_LENGTH, `message of ${message.text.length}`);
+      assert.equal(message.parseMode, 'MarkdownV2');
+    }
+  });
+
+  it('edits the draft into the final answer and deletes surplus messages', async () => {
+    const { api, messages } = fakeApi();
+    const reply = new StreamingReply(api, '1');
+
+    reply.update('Lange draft. '.repeat(700));
+    await sleep(20);
+    assert.equal(reply.started, true);
+    assert.equal(messages.size, 3);
+    assert.ok([...messages.values()].every((m) => m.parseMode === undefined));
+
+    await reply.finish('Kort antwoord.');
+
+    assert.equal(messages.size, 1);
+    const [message] = messages.values();
+    assert.equal(message.id, 1);
+    assert.equal(message.text, 'Kort antwoord\\.');
+    assert.equal(message.parseMode, 'MarkdownV2');
+  });
+
+  it('does not open a message for a tiny draft', async () => {
+    const { api, messages } = fakeApi();
+    const reply = new StreamingReply(api, '1');
+
+    reply.update('Ok');
+    await sleep(20);
+
+    assert.equal(reply.started, false);
+    assert.equal(messages.size, 0);
+  });
+});
@@ -0,0 +1,47 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { splitIntoSentenceGroups } from '../../src/bridge/tts.js';
+
+describe('splitIntoSentenceGroups', () => {
+  it('returns nothing for blank text', () => {
+    assert.deepEqual(splitIntoSentenceGroups(''), []);
+    assert.deepEqual(splitIntoSentenceGroups('  \n '), []);
+  });
+
+  it('keeps short text in one group', () => {
+    assert.deepEqual(splitIntoSentenceGroups('Hoi! Hoe gaat het?'), ['Hoi! Hoe gaat het?']);
+  });
+
+  it('does not split inside numbers or abbreviations without a space', () => {
+    const groups = splitIntoSentenceGroups('Versie 3.5 is uit. Kijk op kitt.example.com voor meer.', 20, 20);
+    assert.deepEqual(groups, ['Versie 3.5 is uit.', 'Kijk op kitt.example.com voor meer.']);
+  });
+
+  it('ends a sentence at a newline', () => {
+    assert.deepEqual(splitIntoSentenceGroups('Eerste regel\nTweede regel', 10, 10), ['Eerste regel', 'Tweede regel']);
+  });
+
+  it('keeps closing quotes and brackets with their sentence', () => {
+    const groups = splitIntoSentenceGroups('Hij zei "klaar!" (Echt waar.) Daarna niets.', 10, 10);
+    assert.deepEqual(groups, ['Hij zei "klaar!"', '(Echt waar.)', 'Daarna niets.']);
+  });
+
+  it('starts with a short group, then fills larger ones', () => {
+    const sentence = 'Dit is een zin van ongeveer veertig tekens.';
+    const text = Array.from({ length: 40 }, () => sentence).join(' ');
+    const groups = splitIntoSentenceGroups(text, 100, 300);
+
+    assert.ok(groups[0].length <= 100);
+    for (const group of groups.slice(1)) {
+      assert.ok(group.length <= 300, `group of ${group.length}`);
+    }
+    assert.ok(groups[1].length > 100);
+    assert.equal(groups.join(' '), text);
+  });
+
+  it('never cuts a sentence longer than the limit', () => {
+    const long = `${'woord '.repeat(50).trim()}.`;
+    const groups = splitIntoSentenceGroups(`Kort. ${long} Einde.`, 20, 20);
+    assert.deepEqual(groups, ['Kort.', long, 'Einde.']);
+  });
+});
@@ -0,0 +1,58 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { LruCache } from '../../src/memory/cache.js';
+
+describe('LruCache', () => {
+  it('evicts the least recently used entry', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('c', 3);
+
+    assert.equal(cache.size, 2);
+    assert.equal(cache.get('a'), undefined);
+    assert.equal(cache.get('b'), 2);
+    assert.equal(cache.get('c'), 3);
+  });
+
+  it('treats get as a use', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    assert.equal(cache.get('a'), 1);
+    assert.equal(cache.get('b'), undefined);
+  });
+
+  it('overwrites without growing', () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('a', 10);
+    cache.set('c', 3);
+
+    assert.equal(cache.size, 2);
+    assert.equal(cache.get('a'), 10);
+    assert.equal(cache.get('b'), undefined);
+  });
+
+  it('keeps at least one entry', () => {
+    const cache = new LruCache<string, number>(0);
+    cache.set('a', 1);
+    cache.set('b', 2);
+
+    assert.equal(cache.size, 1);
+    assert.equal(cache.get('b'), 2);
+  });
+
+  it('clears all entries', () => {
+    const cache = new LruCache<string, number>(4);
+    cache.set('a', 1);
+    cache.clear();
+
+    assert.equal(cache.size, 0);
+    assert.equal(cache.get('a'), undefined);
+  });
+});
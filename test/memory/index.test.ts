@@ -0,0 +1,101 @@
+import { afterEach, beforeEach, describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { createClient, type Client } from '@libsql/client';
+import { MemoryService } from '../../src/memory/index.js';
+
+// One ~30 char line per chunk (chunkTokens 10 = 40 chars, no overlap)
+const LINE_A = 'Renier traint op dinsdag en vrijdag';
+const LINE_B = 'Koffie zonder suiker, altijd zwart';
+const LINE_C = 'Verjaardag van Mila is op 12 maart';
+const LINE_NEW = 'Nieuw: fietst sinds mei naar kantoor';
+
+describe('MemoryService MEMORY.md sync', () => {
+  let dir: string;
+  let memoryPath: string;
+  let memory: MemoryService;
+  let db: Client;
+
+  const readChunks = async () => {
+    const result = await db.execute(
+      "SELECT id, content, start_line, end_line FROM chunks WHERE source = 'memory' ORDER BY start_line"
+    );
+    return result.rows.map((row) => ({
+      id: String(row.id),
+      content: String(row.content),
+      startLine: Number(row.start_line),
+      endLine: Number(row.end_line),
+    }));
+  };
+
+  beforeEach(async () => {
+    delete process.env.KITT_MEMORY_DB;
+    delete process.env.OPENAI_API_KEY;
+
+    dir = await fs.mkdtemp(path.join(os.tmpdir(), 'kitt-memory-'));
+    memoryPath = path.join(dir, 'MEMORY.md');
+    memory = new MemoryService({
+      dbPath: path.join(dir, 'kitt.db'),
+      memoryPath,
+      vectorMode: 'exact',
+      chunkTokens: 10,
+      chunkOverlap: 0,
+    });
+    await memory.initialize();
+    db = createClient({ url: `file:${path.join(dir, 'kitt.db')}` });
+  });
+
+  afterEach(async () => {
+    db.close();
+    await memory.close();
+    await fs.rm(dir, { recursive: true, force: true });
+  });
+
+  it('keeps unchanged chunks, moves shifted ones and drops stale ones', async () => {
+    await fs.writeFile(memoryPath, [LINE_A, LINE_B, LINE_C].join('\n'));
+    await memory.sync();
+
+    const before = await readChunks();
+    assert.deepEqual(before.map((c) => c.content), [LINE_A, LINE_B, LINE_C]);
+    const byContent = new Map(before.map((c) => [c.content, c]));
+
+    // New first line shifts A down, B is removed, C stays on line 3
+    await fs.writeFile(memoryPath, [LINE_NEW, LINE_A, LINE_C].join('\n'));
+    await memory.sync();
+
+    const after = await readChunks();
+    assert.deepEqual(
+      after.map((c) => [c.content, c.startLine, c.endLine]),
+      [[LINE_NEW, 1, 1], [LINE_A, 2, 2], [LINE_C, 3, 3]]
+    );
+
+    // Same hash + model: the existing rows are reused, not re-inserted
+    assert.equal(after[1].id, byContent.get(LINE_A)!.id);
+    assert.equal(after[2].id, byContent.get(LINE_C)!.id);
+    assert.notEqual(after[0].id, byContent.get(LINE_B)!.id);
+
+    // The stale chunk is gone from both the table and the FTS index
+    const staleId = byContent.get(LINE_B)!.id;
+    const staleChunks = await db.execute({ sql: 'SELECT 1 FROM chunks WHERE id = ?', args: [staleId] });
+    const staleFts = await db.execute({ sql: 'SELECT 1 FROM chunks_fts WHERE id = ?', args: [staleId] });
+    assert.equal(staleChunks.rows.length, 0);
+    assert.equal(staleFts.rows.length, 0);
+
+    const fts = await db.execute("SELECT id FROM chunks_fts WHERE source = 'memory' ORDER BY id");
+    assert.deepEqual(
+      fts.rows.map((row) => String(row.id)),
+      after.map((c) => c.id).sort()
+    );
+  });
+
+  it('leaves an unchanged file alone', async () => {
+    await fs.writeFile(memoryPath, [LINE_A, LINE_B].join('\n'));
+    await memory.sync();
+    const before = await readChunks();
+
+    await memory.sync();
+    assert.deepEqual(await readChunks(), before);
+  });
+});
@@ -0,0 +1,69 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import {
+  decodeTranscriptCursor,
+  encodeTranscriptCursor,
+  shortenEmbedding,
+} from '../../src/memory/utils.js';
+
+const norm = (vector: number[]): number => Math.sqrt(vector.reduce((sum, v) => sum + v * v, 0));
+
+describe('shortenEmbedding', () => {
+  it('keeps the prefix direction at unit length', () => {
+    const short = shortenEmbedding([3, 4, 12, 84], 2);
+
+    assert.equal(short.length, 2);
+    assert.ok(Math.abs(short[0] - 0.6) < 1e-12);
+    assert.ok(Math.abs(short[1] - 0.8) < 1e-12);
+    assert.ok(Math.abs(norm(short) - 1) < 1e-12);
+  });
+
+  it('returns an all-zero prefix unchanged', () => {
+    assert.deepEqual(shortenEmbedding([0, 0, 1], 2), [0, 0]);
+  });
+
+  it('does not modify the input', () => {
+    const embedding = [1, 2, 3];
+    shortenEmbedding(embedding, 2);
+    assert.deepEqual(embedding, [1, 2, 3]);
+  });
+
+  it('re-normalizes when asked for every dimension', () => {
+    const short = shortenEmbedding([2, 0, 0], 3);
+    assert.deepEqual(short, [1, 0, 0]);
+  });
+});
+
+describe('transcript cursor', () => {
+  it('round-trips a keyset position', () => {
+    const cursor = encodeTranscriptCursor({ createdAt: 1760000000123, rowid: 42 });
+    assert.deepEqual(decodeTranscriptCursor(cursor), { createdAt: 1760000000123, rowid: 42 });
+  });
+
+  it('round-trips a ranked position exactly', () => {
+    const position = { createdAt: 1760000000123, rowid: 42, rank: -3.141592653589793, snapshot: 9001 };
+    assert.deepEqual(decodeTranscriptCursor(encodeTranscriptCursor(position)), position);
+  });
+
+  it('is URL safe', () => {
+    const cursor = encodeTranscriptCursor({
+      createdAt: Number.MAX_SAFE_INTEGER,
+      rowid: Number.MAX_SAFE_INTEGER,
+      rank: -1e-7,
+      snapshot: Number.MAX_SAFE_INTEGER,
+    });
+    assert.match(cursor, /^[A-Za-z0-9_-]+$/);
+  });
+
+  it('rejects malformed cursors', () => {
+    const encode = (value: unknown): string => Buffer.from(JSON.stringify(value)).toString('base64url');
+
+    assert.equal(decodeTranscriptCursor('not a cursor'), null);
+    assert.equal(decodeTranscriptCursor(''), null);
+    assert.equal(decodeTranscriptCursor(encode(['1', 2])), null);
+    assert.equal(decodeTranscriptCursor(encode([1])), null);
+    assert.equal(decodeTranscriptCursor(encode([1, 2, 3])), null);
+    assert.equal(decodeTranscriptCursor(encode([1, 2, -0.5, null])), null);
+    assert.equal(decodeTranscriptCursor(encode({ createdAt: 1, rowid: 2 })), null);
+  });
+});
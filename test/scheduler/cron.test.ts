@@ -0,0 +1,112 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { getNextRun, parseCron } from '../../src/scheduler/cron.js';
+
+const next = (expression: string, after: string, timezone?: string): string =>
+  getNextRun(expression, new Date(after), timezone).toISOString();
+
+const iso = (local: string): string => new Date(local).toISOString();
+
+/**
+ * Reference: check every minute after `after` (slow, but obviously right)
+ */
+function walkMinutes(expression: string, after: Date, timezone: string, maxMinutes: number): Date | null {
+  const cron = parseCron(expression);
+  const format = new Intl.DateTimeFormat('en-US', {
+    timeZone: timezone,
+    year: 'numeric',
+    month: 'numeric',
+    day: 'numeric',
+    hour: 'numeric',
+    minute: 'numeric',
+    weekday: 'short',
+    hourCycle: 'h23',
+  });
+  const weekdays = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+
+  let time = Math.floor(after.getTime() / 60000) * 60000 + 60000;
+  for (let i = 0; i < maxMinutes; i++, time += 60000) {
+    const parts = Object.fromEntries(format.formatToParts(time).map((p) => [p.type, p.value]));
+    if (
+      cron.minute.includes(Number(parts.minute)) &&
+      cron.hour.includes(Number(parts.hour)) &&
+      cron.dayOfMonth.includes(Number(parts.day)) &&
+      cron.month.includes(Number(parts.month)) &&
+      cron.dayOfWeek.includes(weekdays.indexOf(parts.weekday))
+    ) {
+      return new Date(time);
+    }
+  }
+  return null;
+}
+
+describe('getNextRun', () => {
+  it('finds the next daily, hourly and stepped runs', () => {
+    assert.equal(next('0 9 * * *', '2026-10-17T10:00:00+02:00'), iso('2026-10-18T09:00:00+02:00'));
+    assert.equal(next('0 9 * * *', '2026-10-17T08:59:30+02:00'), iso('2026-10-17T09:00:00+02:00'));
+    assert.equal(next('*/15 * * * *', '2026-10-17T10:07:00+02:00'), iso('2026-10-17T10:15:00+02:00'));
+    assert.equal(next('0 */2 * * *', '2026-10-17T23:10:00+02:00'), iso('2026-10-18T00:00:00+02:00'));
+  });
+
+  it('never returns the start minute itself', () => {
+    assert.equal(next('0 9 * * *', '2026-10-17T09:00:00+02:00'), iso('2026-10-18T09:00:00+02:00'));
+  });
+
+  it('treats midnight as hour 0 (h23), not 24', () => {
+    assert.equal(next('0 0 * * *', '2026-10-17T23:30:00+02:00'), iso('2026-10-18T00:00:00+02:00'));
+    assert.equal(next('15 0 * * *', '2026-10-17T00:20:00+02:00'), iso('2026-10-18T00:15:00+02:00'));
+    assert.equal(next('59 23 * * *', '2026-10-17T23:58:00+02:00'), iso('2026-10-17T23:59:00+02:00'));
+  });
+
+  it('matches weekdays and months', () => {
+    // Saturday -> Monday
+    assert.equal(next('0 9 * * 1', '2026-10-17T10:00:00+02:00'), iso('2026-10-19T09:00:00+02:00'));
+    assert.equal(next('30 9 * * 1-5', '2026-10-16T10:00:00+02:00'), iso('2026-10-19T09:30:00+02:00'));
+    assert.equal(next('0 0 1 1 *', '2026-10-17T00:00:00+02:00'), iso('2027-01-01T00:00:00+01:00'));
+    assert.equal(next('0 12 29 2 *', '2027-10-17T00:00:00+02:00'), iso('2028-02-29T12:00:00+01:00'));
+  });
+
+  it('skips a wall time that does not exist (spring forward)', () => {
+    // 02:00-03:00 doesn't exist on 2026-03-29 in Amsterdam
+    assert.equal(next('30 2 * * *', '2026-03-29T00:00:00+01:00'), iso('2026-03-30T02:30:00+02:00'));
+    assert.equal(next('0 3 * * *', '2026-03-29T01:59:00+01:00'), iso('2026-03-29T03:00:00+02:00'));
+  });
+
+  it('runs a repeated wall time on both occurrences (fall back)', () => {
+    // 02:00-03:00 happens twice on 2026-10-25 in Amsterdam
+    assert.equal(next('30 2 * * *', '2026-10-25T00:00:00+02:00'), iso('2026-10-25T02:30:00+02:00'));
+    assert.equal(next('30 2 * * *', '2026-10-25T02:30:00+02:00'), iso('2026-10-25T02:30:00+01:00'));
+    assert.equal(next('0 * * * *', '2026-10-25T02:30:00+02:00'), iso('2026-10-25T02:00:00+01:00'));
+  });
+
+  it('uses the given timezone', () => {
+    assert.equal(next('0 9 * * *', '2026-10-17T14:00:00Z', 'America/New_York'), iso('2026-10-18T09:00:00-04:00'));
+    // US spring forward: 2026-03-08
+    assert.equal(next('30 2 * * *', '2026-03-08T00:00:00-05:00', 'America/New_York'), iso('2026-03-09T02:30:00-04:00'));
+    assert.equal(next('0 0 * * *', '2026-10-17T12:00:00Z', 'Asia/Kolkata'), iso('2026-10-18T00:00:00+05:30'));
+  });
+
+  it('throws when nothing matches within a year', () => {
+    assert.throws(() => getNextRun('0 0 31 2 *', new Date('2026-10-17T00:00:00Z')), /Could not find next run/);
+  });
+
+  it('agrees with a minute-by-minute walk around DST changes', () => {
+    const expressions = ['*/7 * * * *', '0 2 * * *', '30 2 * * *', '45 1,2,3 * * *', '0 */5 * * 0,6', '5 0 * * 1-5'];
+    const starts = ['2026-03-27T21:13:00Z', '2026-03-29T00:59:00Z', '2026-10-24T23:44:00Z', '2026-10-25T01:01:00Z'];
+
+    for (const timezone of ['Europe/Amsterdam', 'America/New_York']) {
+      for (const expression of expressions) {
+        for (const start of starts) {
+          const after = new Date(start);
+          const expected = walkMinutes(expression, after, timezone, 8 * 24 * 60);
+          assert.ok(expected, `${expression} should match within 8 days`);
+          assert.equal(
+            getNextRun(expression, after, timezone).toISOString(),
+            expected.toISOString(),
+            `${expression} after ${start} in ${timezone}`
+          );
+        }
+      }
+    }
+  });
+});
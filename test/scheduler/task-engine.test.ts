@@ -0,0 +1,51 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { getPeriodBounds } from '../../src/scheduler/task-engine.js';
+
+// Bounds are local time; pin the zone so DST cases are deterministic
+process.env.TZ = 'Europe/Amsterdam';
+
+const at = (iso: string): number => new Date(iso).getTime();
+const HOUR_MS = 60 * 60 * 1000;
+
+describe('getPeriodBounds', () => {
+  it('returns the local day, Monday week and month', () => {
+    // Wednesday
+    const bounds = getPeriodBounds(new Date('2026-10-14T15:30:00+02:00'));
+
+    assert.equal(bounds.dayStart, at('2026-10-14T00:00:00+02:00'));
+    assert.equal(bounds.dayEnd, at('2026-10-15T00:00:00+02:00'));
+    assert.equal(bounds.weekStart, at('2026-10-12T00:00:00+02:00'));
+    assert.equal(bounds.weekEnd, at('2026-10-19T00:00:00+02:00'));
+    assert.equal(bounds.monthStart, at('2026-10-01T00:00:00+02:00'));
+    // DST ends on Oct 25, so November starts at +01:00
+    assert.equal(bounds.monthEnd, at('2026-11-01T00:00:00+01:00'));
+  });
+
+  it('puts Sunday in the week that started on Monday', () => {
+    const bounds = getPeriodBounds(new Date('2026-10-18T23:59:00+02:00'));
+
+    assert.equal(bounds.weekStart, at('2026-10-12T00:00:00+02:00'));
+    assert.equal(bounds.weekEnd, at('2026-10-19T00:00:00+02:00'));
+  });
+
+  it('follows DST transitions', () => {
+    const spring = getPeriodBounds(new Date('2026-03-29T12:00:00+02:00'));
+    assert.equal(spring.dayEnd - spring.dayStart, 23 * HOUR_MS);
+
+    const autumn = getPeriodBounds(new Date('2026-10-25T12:00:00+01:00'));
+    assert.equal(autumn.dayEnd - autumn.dayStart, 25 * HOUR_MS);
+  });
+
+  it('clips weeks to the calendar year', () => {
+    // Wednesday Dec 30: the week runs into 2027
+    const december = getPeriodBounds(new Date('2026-12-30T10:00:00+01:00'));
+    assert.equal(december.weekStart, at('2026-12-28T00:00:00+01:00'));
+    assert.equal(december.weekEnd, at('2027-01-01T00:00:00+01:00'));
+
+    // Friday Jan 1: the week started in 2026
+    const january = getPeriodBounds(new Date('2027-01-01T10:00:00+01:00'));
+    assert.equal(january.weekStart, at('2027-01-01T00:00:00+01:00'));
+    assert.equal(january.weekEnd, at('2027-01-04T00:00:00+01:00'));
+  });
+});
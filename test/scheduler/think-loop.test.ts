@@ -0,0 +1,73 @@
+import { describe, it } from 'node:test';
+import assert from 'node:assert/strict';
+import { fingerprintThinkLoopContext, type ThinkLoopContext } from '../../src/scheduler/think-loop.js';
+import type { KittTask } from '../../src/scheduler/task-engine.js';
+
+const task: KittTask = {
+  id: 7,
+  title: 'Vitamine D',
+  description: null,
+  frequency: 'daily',
+  priority: 'medium',
+  skill_refs: [],
+  time_window_start: '09:00',
+  time_window_end: '11:00',
+  grace_period_minutes: 0,
+  snoozed_until: null,
+  next_run: null,
+  depends_on: null,
+  created_by: 'renier',
+  active: true,
+  created_at: 0,
+};
+
+const context = (overrides: Partial<ThinkLoopContext> = {}): ThinkLoopContext => ({
+  currentTime: '09:01',
+  currentHour: 9,
+  dayOfWeek: 'zondag',
+  dayOfMonth: 18,
+  weekOfYear: 42,
+  transcripts: '[08:55] user: goedemorgen',
+  messageCount: 1,
+  lastUserMessage: { content: 'goedemorgen', time: '08:55', minutesAgo: 6 },
+  skills: [],
+  tasks: [task],
+  taskSkippedReasons: new Map(),
+  ...overrides,
+});
+
+describe('fingerprintThinkLoopContext', () => {
+  it('matches an unchanged context on a later tick in the same quarter hour', () => {
+    const later = context({
+      currentTime: '09:14',
+      lastUserMessage: { content: 'goedemorgen', time: '08:55', minutesAgo: 19 },
+    });
+
+    assert.equal(fingerprintThinkLoopContext(later), fingerprintThinkLoopContext(context()));
+  });
+
+  it('changes when the next quarter hour starts', () => {
+    assert.notEqual(
+      fingerprintThinkLoopContext(context({ currentTime: '09:15' })),
+      fingerprintThinkLoopContext(context())
+    );
+  });
+
+  it('changes when the agent would see new input', () => {
+    const base = fingerprintThinkLoopContext(context());
+
+    assert.notEqual(
+      fingerprintThinkLoopContext(context({ transcripts: '[08:55] user: goedemorgen\n[09:01] user: hoi' })),
+      base
+    );
+    assert.notEqual(fingerprintThinkLoopContext(context({ tasks: [] })), base);
+    assert.notEqual(
+      fingerprintThinkLoopContext(context({ tasks: [{ ...task, time_window_end: '12:00' }] })),
+      base
+    );
+    assert.notEqual(
+      fingerprintThinkLoopContext(context({ taskSkippedReasons: new Map([[7, 'snoozed']]) })),
+      base
+    );
+  });
+});